@@ -2,12 +2,18 @@
 # -*- coding: utf-8 -*-
 import argparse
 import codecs
+import copy
+import logging
 import os.path
 import platform
 import shutil
 import sys
+import time
 import webbrowser as wb
-from functools import partial
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
 
 try:
     from PyQt5.QtGui import *
@@ -54,6 +60,23 @@ from libs.quick_id_selector import QuickIDSelector
 
 __appname__ = 'labelImg'
 
+logger = logging.getLogger(__name__)
+
+# Annotation file extension written for each label file format
+LABEL_FILE_EXTS = {
+    LabelFileFormat.PASCAL_VOC: XML_EXT,
+    LabelFileFormat.YOLO: TXT_EXT,
+    LabelFileFormat.CREATE_ML: JSON_EXT,
+}
+
+# Qt enums read by eventFilter, which runs for every event on the window and canvas
+_KEY_PRESS = QEvent.KeyPress
+_WHEEL = QEvent.Wheel
+_CTRL = Qt.ControlModifier
+_CTRL_SHIFT = Qt.ControlModifier | Qt.ShiftModifier
+_ALT = Qt.AltModifier
+_SHIFT = Qt.ShiftModifier
+
 
 class WindowMixin(object):
 
@@ -74,9 +97,39 @@ class WindowMixin(object):
         return toolbar
 
 
+class ExistsCheckJob(QRunnable):
+    """Check which of the given paths exist on a worker thread."""
+
+    def __init__(self, paths, callback):
+        super(ExistsCheckJob, self).__init__()
+        self.paths = paths
+        self.callback = callback
+
+    def run(self):
+        self.callback([(path, os.path.exists(path)) for path in self.paths])
+
+
+class ImagePreloadJob(QRunnable):
+    """Decode the given image files on a worker thread."""
+
+    def __init__(self, paths, callback):
+        super(ImagePreloadJob, self).__init__()
+        self.paths = paths
+        self.callback = callback
+
+    def run(self):
+        for path in self.paths:
+            self.callback(path, read(path, QImage()))
+
+
 class MainWindow(QMainWindow, WindowMixin):
     FIT_WINDOW, FIT_WIDTH, MANUAL_ZOOM = list(range(3))
 
+    # Emitted from ExistsCheckJob with a list of (path, exists) tuples
+    recentFilesChecked = pyqtSignal(list)
+    # Emitted from ImagePreloadJob with (path, image), image is null on failure
+    imagePreloaded = pyqtSignal(str, QImage)
+
     def __init__(self, default_filename=None, default_prefdef_class_file=None, default_save_dir=None):
         super(MainWindow, self).__init__()
         self.setWindowTitle(__appname__)
@@ -98,6 +151,26 @@ class MainWindow(QMainWindow, WindowMixin):
 
         # For loading all image under a directory
         self.m_img_list = []
+        # Image path -> position in m_img_list
+        self.m_img_index = {}
+        # Extension-less basenames aligned with m_img_list
+        self.m_img_stems = []
+        # Size of the last loaded image, see load_file
+        self._last_img_size = None
+        # (width, height) -> placeholder QImage handed to YoloReader
+        self._yolo_size_images = {}
+        # (width, height) -> placeholder QImage with the frames' depth, for
+        # the VOC writer
+        self._voc_size_images = {}
+        # Reused by the propagated-annotation savers, which keep no state in it
+        self._propagated_label_file = LabelFile()
+        # Annotation directory -> (mtime_ns, annotation file names, lower-cased names)
+        self._annotation_dirs = {}
+        # Lower-case image file extensions Qt can decode, for scan_all_images
+        self._img_exts = tuple('.%s' % fmt.data().decode("ascii").lower()
+                               for fmt in QImageReader.supportedImageFormats())
+        self._open_filter = "Image & Label files (%s)" % ' '.join(
+            ['*%s' % ext for ext in self._img_exts] + ['*%s' % LabelFile.suffix])
         self.dir_name = None
         self.label_hist = []
         self.last_open_dir = None
@@ -131,6 +204,7 @@ class MainWindow(QMainWindow, WindowMixin):
 
         # Main widgets and related state.
         self.label_dialog = LabelDialog(parent=self, list_item=self.label_hist)
+        self._label_dialog_items = list(self.label_hist)
         
         # Dual label support
         from libs.dualLabelDialog import DualLabelDialog
@@ -146,6 +220,13 @@ class MainWindow(QMainWindow, WindowMixin):
 
         self.items_to_shapes = {}
         self.shapes_to_items = {}
+        # Display text counted for each label list item, and the number of
+        # items per text, so the unique-label combo box is only rebuilt
+        # when a text appears or disappears.
+        self._item_texts = {}
+        self._label_counts = Counter()
+        self._combo_dirty = False
+        self._defer_combo = False
         self.prev_label_text = ''
         
         # Initialize tracking
@@ -173,6 +254,7 @@ class MainWindow(QMainWindow, WindowMixin):
         self.quick_id_selector = QuickIDSelector(parent=self, max_ids=30)
         self.quick_id_selector.label1_selected.connect(self.on_quick_label1_selected)
         self.quick_id_selector.label2_selected.connect(self.on_quick_label2_selected)
+        self.quick_id_selector.id_selected.connect(self.on_quick_id_selected)
         self.current_quick_id = "1"  # デフォルトID
         
         # BB ID管理
@@ -443,7 +525,6 @@ class MainWindow(QMainWindow, WindowMixin):
         self.region_deletion_frames_spinbox.setMaximum(100)
         self.region_deletion_frames_spinbox.setValue(1)
         self.region_deletion_frames_spinbox.setEnabled(False)  # Disabled until checkbox is checked
-        self.region_deletion_frames_spinbox.valueChanged.connect(lambda v: print(f"[Spinbox] Value changed to: {v}"))
         region_del_frames_layout.addWidget(self.region_deletion_frames_spinbox)
         
         region_del_frames_layout.addStretch()
@@ -820,6 +901,15 @@ class MainWindow(QMainWindow, WindowMixin):
         self.last_open_dir = None
         self.recent_files = []
         self.max_recent = 7
+        # path -> (checked_at, exists) for the recent files menu
+        self._exists_cache = {}
+        self.recentFilesChecked.connect(self.recent_files_checked)
+        # path -> QImage decoded ahead of time for the next frames
+        self._image_cache = OrderedDict()
+        self._preloading = set()
+        # (futures, top_up) while a read_ahead batch is running
+        self._read_ahead = None
+        self.imagePreloaded.connect(self.image_preloaded)
         self.line_color = None
         self.fill_color = None
         self.zoom_level = 100
@@ -921,8 +1011,19 @@ class MainWindow(QMainWindow, WindowMixin):
             self.queue_event(partial(self.load_file, self.file_path or ""))
 
         # Callbacks:
-        self.zoom_widget.valueChanged.connect(self.paint_canvas)
-        self.light_widget.valueChanged.connect(self.paint_canvas)
+        # Zoom/light bursts (wheel, spin box drags) collapse into one paint
+        # once the pending events have been processed.
+        self.paint_timer = QTimer(self)
+        self.paint_timer.setSingleShot(True)
+        self.paint_timer.setInterval(0)
+        self.paint_timer.timeout.connect(self.paint_canvas)
+        self.zoom_widget.valueChanged.connect(self.schedule_paint_canvas)
+        self.light_widget.valueChanged.connect(self.schedule_paint_canvas)
+        # Window drags emit a resize event per step, refit at most once a frame
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(16)
+        self.resize_timer.timeout.connect(self.adjust_scale_to_window)
 
         self.populate_mode_actions()
 
@@ -955,44 +1056,7 @@ class MainWindow(QMainWindow, WindowMixin):
             self.canvas.set_drawing_shape_to_square(False)
 
     def keyPressEvent(self, event):
-        # F1キー: Quick ID Selectorの表示/非表示
-        if event.key() == Qt.Key_F1:
-            self.toggle_quick_id_selector()
-            return
-        
-        # Alt+1: Label1タブへ切り替え
-        if event.modifiers() == Qt.AltModifier and event.key() == Qt.Key_1:
-            if self.quick_id_selector.isVisible():
-                self.quick_id_selector.tab_widget.setCurrentIndex(0)
-            # Label1を変更をONにする
-            self.change_label1_checkbox.setChecked(True)
-            return
-        
-        # Alt+2: Label2タブへ切り替え
-        if event.modifiers() == Qt.AltModifier and event.key() == Qt.Key_2:
-            if self.quick_id_selector.isVisible():
-                self.quick_id_selector.tab_widget.setCurrentIndex(1)
-            # Label2を変更をONにする
-            self.change_label2_checkbox.setChecked(True)
-            return
-        
-        # Alt+3: 両方のラベルを変更をONにする
-        if event.modifiers() == Qt.AltModifier and event.key() == Qt.Key_3:
-            self.change_label1_checkbox.setChecked(True)
-            self.change_label2_checkbox.setChecked(True)
-            return
-        
-        # 数字キー（1-9）: Quick ID直接選択（Altが押されていない場合）
-        if event.modifiers() == Qt.NoModifier and Qt.Key_1 <= event.key() <= Qt.Key_9:
-            id_num = event.key() - Qt.Key_0
-            self.select_quick_id(str(id_num))
-            return
-        
-        # 0キー: ID 10を選択
-        elif event.modifiers() == Qt.NoModifier and event.key() == Qt.Key_0:
-            self.select_quick_id("10")
-            return
-        
+        # Undo/Redo, F1 and the Quick ID number keys are dispatched by eventFilter
         if event.key() == Qt.Key_Control:
             self.canvas.set_drawing_shape_to_square(True)
         
@@ -1014,47 +1078,65 @@ class MainWindow(QMainWindow, WindowMixin):
 
     def eventFilter(self, obj, event):
         """Global event filter to catch keyboard shortcuts"""
-        if event.type() == event.KeyPress:
-            # デバッグ：Ctrlキーと組み合わせのキーを表示
-            if event.modifiers() & Qt.ControlModifier:
-                # Qt.Key_Y = 89, Qt.Key_Z = 90
-                pass
+        event_type = event.type()
+        if event_type == _KEY_PRESS:
+            mods = event.modifiers()
+            key = event.key()
             
             # Ctrl+Z / Ctrl+Shift+Z の処理
-            if event.modifiers() == Qt.ControlModifier:
-                if event.key() == Qt.Key_Z or event.key() == 90:
+            if mods == _CTRL:
+                if key == Qt.Key_Z:
                     self.undo_action()
                     return True
-            elif event.modifiers() == (Qt.ControlModifier | Qt.ShiftModifier):
-                if event.key() == Qt.Key_Z:
+            elif mods == _CTRL_SHIFT:
+                if key == Qt.Key_Z:
                     self.redo_action()
                     return True
             
             # DELキー・sキー処理
-            if event.key() == Qt.Key_Delete or event.key() == Qt.Key_S:
+            if key == Qt.Key_Delete or key == Qt.Key_S:
                 if self.canvas.selected_shape and self.actions.delete.isEnabled():
                     self.delete_selected_shape()
                     return True
                 return False
             
             # F1キー処理
-            if event.key() == Qt.Key_F1:
+            if key == Qt.Key_F1:
                 self.toggle_quick_id_selector()
                 return True
             
+            if mods == _ALT:
+                # Alt+1: Label1タブへ切り替え
+                if key == Qt.Key_1:
+                    if self.quick_id_selector.isVisible():
+                        self.quick_id_selector.tab_widget.setCurrentIndex(0)
+                    self.change_label1_checkbox.setChecked(True)
+                    return True
+                # Alt+2: Label2タブへ切り替え
+                if key == Qt.Key_2:
+                    if self.quick_id_selector.isVisible():
+                        self.quick_id_selector.tab_widget.setCurrentIndex(1)
+                    self.change_label2_checkbox.setChecked(True)
+                    return True
+                # Alt+3: 両方のラベルを変更をONにする
+                if key == Qt.Key_3:
+                    self.change_label1_checkbox.setChecked(True)
+                    self.change_label2_checkbox.setChecked(True)
+                    return True
+            
             # 数字キー処理
-            if Qt.Key_1 <= event.key() <= Qt.Key_9:
-                id_num = event.key() - Qt.Key_0
+            if Qt.Key_1 <= key <= Qt.Key_9:
+                id_num = key - Qt.Key_0
                 self.select_quick_id(str(id_num))
                 return True
-            elif event.key() == Qt.Key_0:
+            elif key == Qt.Key_0:
                 self.select_quick_id("10")
                 return True
             
         
         # ホイールイベント処理
-        elif event.type() == event.Wheel:
-            if event.modifiers() == Qt.ShiftModifier:
+        elif event_type == _WHEEL:
+            if event.modifiers() == _SHIFT:
                 delta = event.angleDelta().y()
                 if delta > 0:
                     self.prev_quick_id()
@@ -1157,18 +1239,28 @@ class MainWindow(QMainWindow, WindowMixin):
         self.statusBar().showMessage(message, delay)
 
     def reset_state(self):
+        self.reset_shapes_only()
+        self.label_coordinates.clear()
+        self.combo_box.update_items([])
+        self._image_cache.clear()
+        self._last_img_size = None
+        # Reset tracking information
+        self.prev_frame_shapes = []
+        self.tracker.reset()
+
+    def reset_shapes_only(self):
+        """Clear the per-image state but keep the combo box and tracking
+        state, for stepping between frames of the same directory."""
         self.items_to_shapes.clear()
         self.shapes_to_items.clear()
         self.label_list.clear()
+        self._item_texts.clear()
+        self._label_counts.clear()
+        self._combo_dirty = True
         self.file_path = None
         self.image_data = None
         self.label_file = None
         self.canvas.reset_state()
-        self.label_coordinates.clear()
-        self.combo_box.cb.clear()
-        # Reset tracking information
-        self.prev_frame_shapes = []
-        self.tracker.reset()
 
     def current_item(self):
         items = self.label_list.selectedItems()
@@ -1177,6 +1269,7 @@ class MainWindow(QMainWindow, WindowMixin):
         return None
 
     def add_recent_file(self, file_path):
+        self._exists_cache.pop(file_path, None)
         if file_path in self.recent_files:
             self.recent_files.remove(file_path)
         elif len(self.recent_files) >= self.max_recent:
@@ -1250,10 +1343,33 @@ class MainWindow(QMainWindow, WindowMixin):
         self.label_selection_changed()
 
     def update_file_menu(self):
+        """Fill the recent files menu from the last known existence checks
+        and re-check stale entries on the global thread pool."""
+        self.populate_recent_files_menu()
+        now = time.monotonic()
+        stale = [f for f in self.recent_files
+                 if f not in self._exists_cache or now - self._exists_cache[f][0] >= EXISTS_CACHE_TTL]
+        if stale:
+            QThreadPool.globalInstance().start(ExistsCheckJob(stale, self.recentFilesChecked.emit))
+
+    def recent_files_checked(self, results):
+        now = time.monotonic()
+        changed = False
+        for path, result in results:
+            cached = self._exists_cache.get(path)
+            if (cached[1] if cached is not None else True) != result:
+                changed = True
+            self._exists_cache[path] = (now, result)
+        if changed:
+            self.populate_recent_files_menu()
+
+    def populate_recent_files_menu(self):
         curr_file_path = self.file_path
 
         def exists(filename):
-            return os.path.exists(filename)
+            # Files not checked yet are listed until the check says otherwise
+            cached = self._exists_cache.get(filename)
+            return cached[1] if cached is not None else True
         menu = self.menus.recentFiles
         menu.clear()
         files = [f for f in self.recent_files if f !=
@@ -1295,7 +1411,7 @@ class MainWindow(QMainWindow, WindowMixin):
 
     # Tzutalin 20160906 : Add file list and dock to move faster
     def file_item_double_clicked(self, item=None):
-        self.cur_img_idx = self.m_img_list.index(ustr(item.text()))
+        self.cur_img_idx = self.m_img_index[ustr(item.text())]
         filename = self.m_img_list[self.cur_img_idx]
         if filename:
             self.load_file(filename)
@@ -1325,7 +1441,7 @@ class MainWindow(QMainWindow, WindowMixin):
             else:  # User probably changed item visibility
                 self.canvas.set_shape_visible(shape, item.checkState() == Qt.Checked)
         except AttributeError as e:
-            print(f"[DEBUG] Error updating item state: {e}")
+            logger.debug("Error updating item state: %s", e)
 
     # React to canvas signals.
     def shape_selection_changed(self, selected=False):
@@ -1338,7 +1454,7 @@ class MainWindow(QMainWindow, WindowMixin):
                 if shape in self.shapes_to_items:
                     self.shapes_to_items[shape].setSelected(True)
                 else:
-                    print(f"[Warning] Selected shape not found in shapes_to_items dictionary")
+                    logger.warning("Selected shape not found in shapes_to_items dictionary")
             else:
                 self.label_list.clearSelection()
         
@@ -1350,12 +1466,44 @@ class MainWindow(QMainWindow, WindowMixin):
         self.actions.shapeFillColor.setEnabled(selected)
 
     def add_label(self, shape):
-        shape.paint_label = self.display_label_option.isChecked()
-        shape.paint_id = self.draw_id_checkbox.isChecked()
+        item, display_text = self._make_label_item(shape)
+        self.items_to_shapes[item] = shape
+        self.shapes_to_items[shape] = item
+        self.label_list.addItem(item)
+        self._count_label_text(item, display_text)
+        for action in self.actions.onShapesPresent:
+            action.setEnabled(True)
+        self.update_combo_box()
         
+        # Quick ID Selectorの不足ラベルを更新
+        if hasattr(self, 'quick_id_selector') and self.quick_id_selector.isVisible():
+            self.quick_id_selector.update_missing_labels()
+
+    def _make_label_item(self, shape):
+        """Prepare shape for display and return its (label list item, text)."""
+        display_text, background = self._label_item_display(shape)
+        item = HashableQListWidgetItem(display_text)
+        item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+        item.setCheckState(Qt.Checked)
+        item.setBackground(background)
+        return item, display_text
+
+    def _label_display_flags(self):
+        """Return the (paint_label, paint_id, show_label1, show_label2) options."""
+        return (self.display_label_option.isChecked(),
+                self.draw_id_checkbox.isChecked(),
+                self.show_label1_checkbox.isChecked(),
+                self.show_label2_checkbox.isChecked())
+
+    def _label_item_display(self, shape, flags=None):
+        """Prepare shape for display and return its label list (text, color).
+
+        flags can hold a _label_display_flags() result shared by a batch.
+        """
+        if flags is None:
+            flags = self._label_display_flags()
         # Set label visibility based on checkboxes
-        shape.show_label1 = self.show_label1_checkbox.isChecked()
-        shape.show_label2 = self.show_label2_checkbox.isChecked()
+        shape.paint_label, shape.paint_id, shape.show_label1, shape.show_label2 = flags
         
         # Ensure shape.label1 and shape.label2 are properly set
         if not hasattr(shape, 'label1'):
@@ -1387,23 +1535,40 @@ class MainWindow(QMainWindow, WindowMixin):
         # Format: "label1 | label2" or just "label1"
         display_text = " | ".join(text_parts) if len(text_parts) > 1 else (text_parts[0] if text_parts else "")
         
-        item = HashableQListWidgetItem(display_text)
-        item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-        item.setCheckState(Qt.Checked)
-        
         # Use color mode to determine color
         color_label = self.get_color_label_for_shape(shape)
-        item.setBackground(generate_color_by_text(color_label))
-        
-        self.items_to_shapes[item] = shape
-        self.shapes_to_items[shape] = item
-        self.label_list.addItem(item)
-        for action in self.actions.onShapesPresent:
-            action.setEnabled(True)
+        return display_text, generate_color_by_text(color_label)
+
+    def update_label_items(self, shapes):
+        """Bring the label list in line with shapes without rebuilding it.
+
+        Items of shapes that are still present are updated in place, items of
+        shapes that are gone are removed and new shapes get a fresh item.
+        """
+        present = set(shapes)
+        stale = [shape for shape in self.shapes_to_items if shape not in present]
+        flags = self._label_display_flags()
+        self.label_list.setUpdatesEnabled(False)
+        self.label_list.blockSignals(True)
+        try:
+            for shape in stale:
+                self.remove_label(shape)
+            for shape in shapes:
+                item = self.shapes_to_items.get(shape)
+                if item is None:
+                    self.add_label(shape)
+                    continue
+                display_text, background = self._label_item_display(shape, flags)
+                if item.text() != display_text:
+                    self._uncount_label_text(item)
+                    item.setText(display_text)
+                    self._count_label_text(item, display_text)
+                item.setBackground(background)
+        finally:
+            self.label_list.blockSignals(False)
+            self.label_list.setUpdatesEnabled(True)
         self.update_combo_box()
-        
-        # Quick ID Selectorの不足ラベルを更新
-        if hasattr(self, 'quick_id_selector') and self.quick_id_selector.isVisible():
+        if self.quick_id_selector.isVisible():
             self.quick_id_selector.update_missing_labels()
 
     def remove_label(self, shape):
@@ -1413,16 +1578,64 @@ class MainWindow(QMainWindow, WindowMixin):
         
         # Check if shape exists in dictionary
         if shape not in self.shapes_to_items:
-            print(f"[Warning] Shape not found in shapes_to_items dictionary")
+            logger.warning("Shape not found in shapes_to_items dictionary")
             return
             
         item = self.shapes_to_items[shape]
         self.label_list.takeItem(self.label_list.row(item))
+        self._uncount_label_text(item)
         del self.shapes_to_items[shape]
         del self.items_to_shapes[item]
         self.update_combo_box()
 
+    def reload_label_list(self):
+        """Rebuild the label list from canvas.shapes, batched like load_labels."""
+        shapes = list(self.canvas.shapes)
+        self.label_list.setUpdatesEnabled(False)
+        self.label_list.blockSignals(True)
+        try:
+            self.label_list.clear()
+            made = [self._make_label_item(shape) for shape in shapes]
+            items = [item for item, _ in made]
+            texts = [text for _, text in made]
+            for item in items:
+                self.label_list.addItem(item)
+            # Fill the lookup maps in bulk instead of one add_label at a time
+            self.shapes_to_items.clear()
+            self.shapes_to_items.update(zip(shapes, items))
+            self.items_to_shapes.clear()
+            self.items_to_shapes.update(zip(items, shapes))
+            self._item_texts.clear()
+            self._item_texts.update(zip(items, texts))
+            self._label_counts.clear()
+            self._label_counts.update(texts)
+            self._combo_dirty = True
+        finally:
+            self.label_list.blockSignals(False)
+            self.label_list.setUpdatesEnabled(True)
+        if shapes:
+            for action in self.actions.onShapesPresent:
+                action.setEnabled(True)
+        self.update_combo_box()
+        if self.quick_id_selector.isVisible():
+            self.quick_id_selector.update_missing_labels()
+
     def load_labels(self, shapes):
+        # Populate the label list in one pass: no repaints, itemChanged
+        # re-entry or combo box rebuilds until every shape is added.
+        self.label_list.setUpdatesEnabled(False)
+        self.label_list.blockSignals(True)
+        self._defer_combo = True
+        try:
+            s = self._add_labels_from_data(shapes)
+        finally:
+            self._defer_combo = False
+            self.label_list.blockSignals(False)
+            self.label_list.setUpdatesEnabled(True)
+        self.update_combo_box()
+        self.canvas.load_shapes(s)
+
+    def _add_labels_from_data(self, shapes):
         s = []
         for shape_data in shapes:
             # Handle both old format (tuple) and new format (dict with label2)
@@ -1449,46 +1662,84 @@ class MainWindow(QMainWindow, WindowMixin):
             shape.show_label1 = self.show_label1_checkbox.isChecked()
             shape.show_label2 = self.show_label2_checkbox.isChecked()
             
-            for x, y in points:
-
-                # Ensure the labels are within the bounds of the image. If not, fix them.
-                x, y, snapped = self.canvas.snap_point_to_canvas(x, y)
-                if snapped:
-                    self.set_dirty()
+            # Ensure the labels are within the bounds of the image. If not, fix them.
+            points, snapped = self.canvas.snap_points_to_canvas(points)
+            if snapped:
+                self.set_dirty()
 
+            for x, y in points:
                 shape.add_point(QPointF(x, y))
             shape.difficult = difficult
             
             # Set colors based on current color mode
+            if not line_color or not fill_color:
+                # Use color mode to determine which label to use for color
+                color_label = self.get_color_label_for_shape(shape)
             if line_color:
                 shape.line_color = QColor(*line_color)
             else:
-                # Use color mode to determine which label to use for color
-                color_label = self.get_color_label_for_shape(shape)
                 shape.line_color = generate_color_by_text(color_label)
 
             if fill_color:
                 shape.fill_color = QColor(*fill_color)
             else:
-                # Use color mode to determine which label to use for color
-                color_label = self.get_color_label_for_shape(shape)
                 shape.fill_color = generate_color_by_text(color_label)
                 
             shape.close()
             s.append(shape)
 
             self.add_label(shape)
-        self.update_combo_box()
-        self.canvas.load_shapes(s)
+        return s
+
+    def _count_label_text(self, item, text):
+        self._item_texts[item] = text
+        if self._label_counts[text] == 0:
+            self._combo_dirty = True
+        self._label_counts[text] += 1
+
+    def _uncount_label_text(self, item):
+        text = self._item_texts.pop(item, None)
+        if text is None:
+            return
+        self._label_counts[text] -= 1
+        if self._label_counts[text] <= 0:
+            del self._label_counts[text]
+            self._combo_dirty = True
+
+    def _recount_label_texts(self):
+        """Rebuild the label counts from the label list widget."""
+        self._item_texts.clear()
+        self._label_counts.clear()
+        for i in range(self.label_list.count()):
+            self._count_label_text(self.label_list.item(i), str(self.label_list.item(i).text()))
+        self._combo_dirty = True
+        self._prune_label_maps()
+
+    def _prune_label_maps(self):
+        """Drop items_to_shapes/shapes_to_items entries for items that are no
+        longer in the label list."""
+        live = set(self._item_texts)
+        for item in [item for item in self.items_to_shapes if item not in live]:
+            shape = self.items_to_shapes.pop(item)
+            if self.shapes_to_items.get(shape) is item:
+                del self.shapes_to_items[shape]
 
     def update_combo_box(self):
-        # Get the unique labels and add them to the Combobox.
-        items_text_list = [str(self.label_list.item(i).text()) for i in range(self.label_list.count())]
+        if self._defer_combo:
+            return
+        # Items removed with label_list.clear()/takeItem() bypass remove_label
+        if len(self._item_texts) != self.label_list.count():
+            self._recount_label_texts()
+        if not self._combo_dirty:
+            return
+        self._combo_dirty = False
 
-        unique_text_list = list(set(items_text_list))
-        # Add a null row for showing all the labels
-        unique_text_list.append("")
-        unique_text_list.sort()
+        # Get the unique labels and add a null row for showing all the labels
+        unique_text_list = sorted(set(self._label_counts) | {""})
+        # Rebuilding the combo box resets its model and the label filter, skip
+        # it when the frame has the same labels and nothing is filtered
+        if unique_text_list == self.combo_box.items and self.combo_box.cb.currentIndex() <= 0:
+            return
 
         self.combo_box.update_items(unique_text_list)
 
@@ -1498,40 +1749,34 @@ class MainWindow(QMainWindow, WindowMixin):
             self.label_file = LabelFile()
             self.label_file.verified = self.canvas.verified
 
-        def format_shape(s):
-            result = dict(label=s.label,
-                        line_color=s.line_color.getRgb(),
-                        fill_color=s.fill_color.getRgb(),
-                        points=[(p.x(), p.y()) for p in s.points],
-                        # add chris
-                        difficult=s.difficult)
-            # Add label2 for dual label support
-            if hasattr(s, 'label2'):
-                result['label2'] = s.label2
-            return result
-
-        shapes = [format_shape(shape) for shape in self.canvas.shapes]
+        # label2 is always set by Shape.__init__ (dual label support)
+        shapes = [dict(label=s.label,
+                       line_color=s.line_color.getRgb(),
+                       fill_color=s.fill_color.getRgb(),
+                       points=[(p.x(), p.y()) for p in s.points],
+                       # add chris
+                       difficult=s.difficult,
+                       label2=s.label2)
+                  for s in self.canvas.shapes]
+        ext = LABEL_FILE_EXTS.get(self.label_file_format)
+        if ext and os.path.splitext(annotation_file_path)[1].lower() != ext:
+            annotation_file_path += ext
         # Can add different annotation formats here
         try:
             if self.label_file_format == LabelFileFormat.PASCAL_VOC:
-                if annotation_file_path[-4:].lower() != ".xml":
-                    annotation_file_path += XML_EXT
                 self.label_file.save_pascal_voc_format(annotation_file_path, shapes, self.file_path, self.image_data,
                                                        self.line_color.getRgb(), self.fill_color.getRgb())
             elif self.label_file_format == LabelFileFormat.YOLO:
-                if annotation_file_path[-4:].lower() != ".txt":
-                    annotation_file_path += TXT_EXT
                 self.label_file.save_yolo_format(annotation_file_path, shapes, self.file_path, self.image_data, self.label_hist,
                                                  self.line_color.getRgb(), self.fill_color.getRgb(), class_list2=self.label2_hist)
             elif self.label_file_format == LabelFileFormat.CREATE_ML:
-                if annotation_file_path[-5:].lower() != ".json":
-                    annotation_file_path += JSON_EXT
                 self.label_file.save_create_ml_format(annotation_file_path, shapes, self.file_path, self.image_data,
                                                       self.label_hist, self.line_color.getRgb(), self.fill_color.getRgb())
             else:
                 self.label_file.save(annotation_file_path, shapes, self.file_path, self.image_data,
                                      self.line_color.getRgb(), self.fill_color.getRgb())
-            print('Image:{0} -> Annotation:{1}'.format(self.file_path, annotation_file_path))
+            logger.info('Image:%s -> Annotation:%s', self.file_path, annotation_file_path)
+            self.annotation_file_saved(annotation_file_path)
             return True
         except LabelFileError as e:
             self.error_message(u'Error saving label data', u'<b>%s</b>' % e)
@@ -1546,13 +1791,24 @@ class MainWindow(QMainWindow, WindowMixin):
 
     def combo_selection_changed(self, index):
         text = self.combo_box.cb.itemText(index)
-        for i in range(self.label_list.count()):
-            if text == "":
-                self.label_list.item(i).setCheckState(2)
-            elif text != self.label_list.item(i).text():
-                self.label_list.item(i).setCheckState(0)
-            else:
-                self.label_list.item(i).setCheckState(2)
+        # Flip the check states with itemChanged blocked and apply the
+        # visibility in one canvas update instead of one repaint per item
+        checked, unchecked = Qt.Checked, Qt.Unchecked
+        changed = []
+        self.label_list.blockSignals(True)
+        try:
+            for i in range(self.label_list.count()):
+                item = self.label_list.item(i)
+                state = checked if text == "" or text == item.text() else unchecked
+                if item.checkState() != state:
+                    item.setCheckState(state)
+                    shape = self.items_to_shapes.get(item)
+                    if shape is not None:
+                        changed.append((shape, state == checked))
+        finally:
+            self.label_list.blockSignals(False)
+        if changed:
+            self.canvas.set_shapes_visible(changed)
 
     def default_label_combo_selection_changed(self, index):
         self.default_label = self.label_hist[index]
@@ -1574,6 +1830,10 @@ class MainWindow(QMainWindow, WindowMixin):
             self.diffc_button.setChecked(shape.difficult)
 
     def label_item_changed(self, item):
+        counted_text = self._item_texts.get(item)
+        if counted_text is not None and counted_text != item.text():
+            self._uncount_label_text(item)
+            self._count_label_text(item, item.text())
         shape = self.items_to_shapes[item]
         label = item.text()
         if label != shape.label:
@@ -1615,9 +1875,11 @@ class MainWindow(QMainWindow, WindowMixin):
         else:
             # Single label mode (backward compatibility)
             if not self.use_default_label_checkbox.isChecked():
-                if len(self.label_hist) > 0:
-                    self.label_dialog = LabelDialog(
-                        parent=self, list_item=self.label_hist)
+                # label_hist can also grow inside the YOLO writer, so compare
+                # against the items the dialog was last filled with
+                if self.label_hist != self._label_dialog_items:
+                    self.label_dialog.set_items(self.label_hist)
+                    self._label_dialog_items = list(self.label_hist)
 
                 # Sync single class mode from PR#106
                 if self.single_class_mode.isChecked() and self.lastLabel:
@@ -1731,11 +1993,11 @@ class MainWindow(QMainWindow, WindowMixin):
             
             # Apply region deletion if enabled
             if self.region_deletion_mode:
-                print(f"[new_shape] Region deletion mode is active")
+                logger.debug("Region deletion mode is active")
                 # The shape variable already contains the just-drawn region shape
                 # Get the region bounds from the shape that was just drawn
                 region_points = [(p.x(), p.y()) for p in shape.points]
-                print(f"[new_shape] Region shape has {len(region_points)} points")
+                logger.debug("Region shape has %d points", len(region_points))
                 
                 if len(region_points) >= 2:
                     x_coords = [p[0] for p in region_points]
@@ -1743,29 +2005,29 @@ class MainWindow(QMainWindow, WindowMixin):
                     region_x1, region_x2 = min(x_coords), max(x_coords)
                     region_y1, region_y2 = min(y_coords), max(y_coords)
                     
-                    print(f"[new_shape] Region bounds: ({region_x1:.1f}, {region_y1:.1f}) to ({region_x2:.1f}, {region_y2:.1f})")
-                    print(f"[new_shape] Canvas has {len(self.canvas.shapes)} shapes before removing region shape")
+                    logger.debug("Region bounds: (%.1f, %.1f) to (%.1f, %.1f)", region_x1, region_y1, region_x2, region_y2)
+                    logger.debug("Canvas has %d shapes before removing region shape", len(self.canvas.shapes))
                     
                     # Remove the temporary shape from canvas (we don't want to save it)
                     # It was just added by set_last_label, so remove it
                     if self.canvas.shapes and self.canvas.shapes[-1] == shape:
                         self.canvas.shapes.pop()
-                        print(f"[new_shape] Removed region shape, canvas now has {len(self.canvas.shapes)} shapes")
+                        logger.debug("Removed region shape, canvas now has %d shapes", len(self.canvas.shapes))
                     else:
-                        print(f"[new_shape] Warning: Could not find region shape to remove")
+                        logger.warning("Could not find region shape to remove")
                     
                     # Execute region deletion
-                    print(f"[new_shape] Calling delete_bbs_in_region...")
+                    logger.debug("Calling delete_bbs_in_region")
                     self.delete_bbs_in_region(region_x1, region_y1, region_x2, region_y2)
                     
                     # Update canvas
-                    print(f"[new_shape] Updating canvas display")
+                    logger.debug("Updating canvas display")
                     self.canvas.load_shapes(self.canvas.shapes)
                 else:
-                    print(f"[new_shape] Not enough points in region shape")
+                    logger.debug("Not enough points in region shape")
                 
                 # Don't continue with normal shape addition
-                print(f"[new_shape] Returning from new_shape (region deletion mode)")
+                logger.debug("Returning from new_shape (region deletion mode)")
                 return
             
             # Apply BB duplication if enabled
@@ -1817,6 +2079,18 @@ class MainWindow(QMainWindow, WindowMixin):
                 )
                 dup_commands.append(current_cmd)
                 
+                # Shape data for duplication, the same for every frame. The
+                # commands never modify it, so they share this one copy
+                # instead of each keeping its own.
+                dup_shape_data = copy.deepcopy({
+                    'label': shape.label,
+                    'label2': shape.label2 if hasattr(shape, 'label2') else None,
+                    'points': [(p.x(), p.y()) for p in shape.points],
+                    'difficult': shape.difficult if hasattr(shape, 'difficult') else False,
+                    'line_color': shape.line_color,
+                    'fill_color': shape.fill_color
+                })
+                
                 # Add commands for each subsequent frame
                 for i in range(1, num_frames + 1):
                     if progress.wasCanceled():
@@ -1831,22 +2105,14 @@ class MainWindow(QMainWindow, WindowMixin):
                     QApplication.processEvents()
                     
                     target_file = self.m_img_list[target_idx]
-                    # Create shape data for duplication
-                    dup_shape_data = {
-                        'label': shape.label,
-                        'label2': shape.label2 if hasattr(shape, 'label2') else None,
-                        'points': [(p.x(), p.y()) for p in shape.points],
-                        'difficult': shape.difficult if hasattr(shape, 'difficult') else False,
-                        'line_color': shape.line_color,
-                        'fill_color': shape.fill_color
-                    }
                     
                     # Use AddShapeWithIOUCheckCommand for IOU checking
                     dup_cmd = AddShapeWithIOUCheckCommand(
                         target_file, 
                         dup_shape_data,
                         iou_threshold=iou_threshold,
-                        overwrite_mode=overwrite_mode
+                        overwrite_mode=overwrite_mode,
+                        copy_data=False
                     )
                     dup_commands.append(dup_cmd)
                     end_frame = target_idx
@@ -1864,8 +2130,10 @@ class MainWindow(QMainWindow, WindowMixin):
                     f"BB duplication to {len(dup_commands)} frames (including current)"
                 )
                 
-                # Execute the duplication commands
-                self.undo_manager.execute_command(composite_cmd)
+                # Execute the duplication commands, decoding the target
+                # frames in the background while each one is processed
+                with self.read_ahead([cmd.frame_path for cmd in dup_commands[1:]]):
+                    self.undo_manager.execute_command(composite_cmd)
                 
             else:
                 # Normal mode - just track the shape addition for undo
@@ -1940,6 +2208,9 @@ class MainWindow(QMainWindow, WindowMixin):
         units = delta // (8 * 15)
         scale = 10
         self.add_zoom(scale * units)
+        # The scroll bar ranges below depend on the resized canvas
+        if self.paint_timer.isActive():
+            self.paint_canvas()
 
         # get the difference in scrollbar values
         # this is how far we can move
@@ -1978,17 +2249,23 @@ class MainWindow(QMainWindow, WindowMixin):
         self.set_light(self.light_widget.value() + increment)
 
     def toggle_polygons(self, value):
-        for item, shape in self.items_to_shapes.items():
-            item.setCheckState(Qt.Checked if value else Qt.Unchecked)
+        state = Qt.Checked if value else Qt.Unchecked
+        self.label_list.blockSignals(True)
+        try:
+            for item in self.items_to_shapes:
+                item.setCheckState(state)
+        finally:
+            self.label_list.blockSignals(False)
+        self.canvas.set_shapes_visible([(shape, bool(value)) for shape in self.items_to_shapes.values()])
 
     def load_file(self, file_path=None, clear_prev_shapes=False, preserve_zoom=False):
         """Load the specified file, or the last opened file if None."""
         # Save tracking info before reset
-        temp_prev_shapes = self.prev_frame_shapes if hasattr(self, 'prev_frame_shapes') and not clear_prev_shapes else []
-        temp_tracking_mode = self.continuous_tracking_mode if hasattr(self, 'continuous_tracking_mode') else False
+        temp_prev_shapes = self.prev_frame_shapes if not clear_prev_shapes else []
+        temp_tracking_mode = self.continuous_tracking_mode
         
         # Save zoom state before reset if requested
-        if preserve_zoom and hasattr(self, 'zoom_widget'):
+        if preserve_zoom:
             saved_zoom_value = self.zoom_widget.value()
             saved_zoom_mode = self.zoom_mode
             saved_h_scroll = self.scroll_bars[Qt.Horizontal].value()
@@ -1998,7 +2275,11 @@ class MainWindow(QMainWindow, WindowMixin):
         else:
             saved_zoom_value = None
         
-        self.reset_state()
+        if file_path is not None and self.file_path and \
+                os.path.dirname(os.path.abspath(ustr(file_path))) == os.path.dirname(self.file_path):
+            self.reset_shapes_only()
+        else:
+            self.reset_state()
         
         # Restore tracking info after reset
         self.prev_frame_shapes = temp_prev_shapes
@@ -2016,13 +2297,15 @@ class MainWindow(QMainWindow, WindowMixin):
         # Tzutalin 20160906 : Add file list and dock to move faster
         # Highlight the file item
         if unicode_file_path and self.file_list_widget.count() > 0:
-            if unicode_file_path in self.m_img_list:
-                index = self.m_img_list.index(unicode_file_path)
+            index = self.m_img_index.get(unicode_file_path)
+            if index is not None:
                 file_widget_item = self.file_list_widget.item(index)
                 file_widget_item.setSelected(True)
             else:
                 self.file_list_widget.clear()
                 self.m_img_list.clear()
+                self.m_img_index.clear()
+                self.m_img_stems.clear()
 
         if unicode_file_path and os.path.exists(unicode_file_path):
             if LabelFile.is_label_file(unicode_file_path):
@@ -2042,8 +2325,13 @@ class MainWindow(QMainWindow, WindowMixin):
                 self.canvas.verified = self.label_file.verified
             else:
                 # Load image:
-                # read data first and store for saving into label file.
-                self.image_data = read(unicode_file_path, None)
+                # decode straight from the file and keep the QImage for
+                # saving, the savers only need its size and depth.
+                self.image_data = self._image_cache.pop(unicode_file_path, None)
+                if self.image_data is None:
+                    self.image_data = self.take_read_ahead(unicode_file_path)
+                if self.image_data is None:
+                    self.image_data = read(unicode_file_path, None)
                 self.label_file = None
                 self.canvas.verified = False
 
@@ -2066,7 +2354,13 @@ class MainWindow(QMainWindow, WindowMixin):
             self.canvas.setEnabled(True)
             
             # Restore zoom state if requested, otherwise use initial scale
-            if preserve_zoom and saved_zoom_value is not None:
+            same_size = image.size() == self._last_img_size
+            self._last_img_size = image.size()
+            if preserve_zoom and same_size and saved_zoom_value == self.zoom_widget.value():
+                # Same zoom on a frame of the same size: the canvas geometry
+                # and scroll positions are still valid, a repaint is enough
+                self.canvas.update()
+            elif preserve_zoom and saved_zoom_value is not None:
                 self.zoom_mode = saved_zoom_mode
                 self.zoom_widget.setValue(saved_zoom_value)
                 self.paint_canvas()
@@ -2080,9 +2374,12 @@ class MainWindow(QMainWindow, WindowMixin):
             self.add_recent_file(self.file_path)
             self.toggle_actions(True)
             self.show_bounding_box_from_annotation_file(self.file_path)
+            # Frames without labels still need the previous frame's labels
+            # dropped from the combo box
+            self.update_combo_box()
             
             # Quick ID Selectorの不足ラベルを更新
-            if hasattr(self, 'quick_id_selector') and self.quick_id_selector.isVisible():
+            if self.quick_id_selector.isVisible():
                 self.quick_id_selector.update_missing_labels()
 
             counter = self.counter_str()
@@ -2095,11 +2392,70 @@ class MainWindow(QMainWindow, WindowMixin):
             #     self.label_list.item(self.label_list.count() - 1).setSelected(True)
 
             self.canvas.setFocus(True)
-            
+            self.preload_images()
             
             return True
         return False
 
+    def preload_images(self):
+        """Decode the frames around the current one in the background."""
+        index = self.m_img_index.get(self.file_path)
+        if index is None:
+            return
+        neighbours = self.m_img_list[index + 1:index + 1 + PRELOAD_AHEAD]
+        if index > 0:
+            # Stepping back with open_prev_image is almost as common
+            neighbours.append(self.m_img_list[index - 1])
+        paths = [path for path in neighbours
+                 if path not in self._image_cache and path not in self._preloading]
+        if paths:
+            self._preloading.update(paths)
+            QThreadPool.globalInstance().start(ImagePreloadJob(paths, self.imagePreloaded.emit))
+
+    @contextmanager
+    def read_ahead(self, paths):
+        """Decode paths on worker threads while a batch loads them in order.
+
+        Batch operations call load_file in a loop without returning to the
+        event loop, so preload_images results would never arrive in time.
+        """
+        pending = deque(paths)
+        futures = {}
+        with ThreadPoolExecutor(max_workers=READ_AHEAD_WORKERS) as pool:
+            def top_up():
+                while pending and len(futures) < 2 * READ_AHEAD_WORKERS:
+                    path = pending.popleft()
+                    futures[path] = pool.submit(read, path, QImage())
+            self._read_ahead = (futures, top_up)
+            top_up()
+            try:
+                yield
+            finally:
+                self._read_ahead = None
+                for future in futures.values():
+                    future.cancel()
+
+    def take_read_ahead(self, path):
+        """Return the image read_ahead decoded for path, or None."""
+        if self._read_ahead is None:
+            return None
+        futures, top_up = self._read_ahead
+        future = futures.pop(path, None)
+        if future is None:
+            return None
+        top_up()
+        image = future.result()
+        return None if image.isNull() else image
+
+    def image_preloaded(self, path, image):
+        self._preloading.discard(path)
+        if image.isNull():
+            return
+        self._image_cache[path] = image
+        self._image_cache.move_to_end(path)
+        while len(self._image_cache) > PRELOAD_CACHE_SIZE:
+            self._image_cache.popitem(last=False)
+
     def counter_str(self):
         """
         Converts image counter to string representation.
@@ -2109,42 +2465,92 @@ class MainWindow(QMainWindow, WindowMixin):
     def show_bounding_box_from_annotation_file(self, file_path):
         
         if self.default_save_dir is not None:
+            dir_path = self.default_save_dir
+        else:
+            dir_path = os.path.dirname(file_path)
+        index = self.m_img_index.get(file_path)
+        if index is not None:
+            basename = self.m_img_stems[index]
+        else:
             basename = os.path.basename(os.path.splitext(file_path)[0])
-            xml_path = os.path.join(self.default_save_dir, basename + XML_EXT)
-            txt_path = os.path.join(self.default_save_dir, basename + TXT_EXT)
-            json_path = os.path.join(self.default_save_dir, basename + JSON_EXT)
 
-            """Annotation file priority:
-            PascalXML > YOLO
-            """
-            if os.path.isfile(xml_path):
-                self.load_pascal_xml_by_filename(xml_path)
-            elif os.path.isfile(txt_path):
-                self.load_yolo_txt_by_filename(txt_path)
-            elif os.path.isfile(json_path):
-                self.load_create_ml_json_by_filename(json_path, file_path)
+        """Annotation file priority:
+        PascalXML > YOLO > CreateML
+        """
+        if self.has_annotation_file(dir_path, basename + XML_EXT):
+            self.load_pascal_xml_by_filename(os.path.join(dir_path, basename + XML_EXT))
+        elif self.has_annotation_file(dir_path, basename + TXT_EXT):
+            self.load_yolo_txt_by_filename(os.path.join(dir_path, basename + TXT_EXT))
+        elif self.has_annotation_file(dir_path, basename + JSON_EXT):
+            self.load_create_ml_json_by_filename(os.path.join(dir_path, basename + JSON_EXT), file_path)
+
+    def annotation_file_names(self, dir_path):
+        """Return the names of the annotation files in dir_path.
+
+        The listing is cached per directory and rescanned when the directory's
+        mtime changes, i.e. when a file is created, renamed or removed in it.
+        """
+        try:
+            mtime = os.stat(dir_path).st_mtime_ns
+        except OSError:
+            return frozenset()
+        cached = self._annotation_dirs.get(dir_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        names = set()
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith((XML_EXT, TXT_EXT, JSON_EXT)) and entry.is_file():
+                    names.add(entry.name)
+        folded = {name.lower() for name in names}
+        self._annotation_dirs[dir_path] = (mtime, names, folded)
+        return names
+
+    def has_annotation_file(self, dir_path, name):
+        """Return whether the annotation file name exists in dir_path.
+
+        Exact names are answered from the cached listing. A name that only
+        matches in case (IMG_001.XML for IMG_001.xml) is confirmed with
+        os.path.isfile, which finds it on case-insensitive file systems
+        (Windows, macOS) as the plain existence check did.
+        """
+        names = self.annotation_file_names(dir_path)
+        if name in names:
+            return True
+        cached = self._annotation_dirs.get(dir_path)
+        return (cached is not None and name.lower() in cached[2] and
+                os.path.isfile(os.path.join(dir_path, name)))
+
+    def annotation_file_saved(self, annotation_file_path):
+        """Drop the cached listing when save_labels created a new file.
+
+        Overwriting a listed file leaves the listing valid. A new file is not
+        just added to it, because other writers (propagation, undo) may have
+        changed the directory in the same mtime window.
+        """
+        dir_path, name = os.path.split(annotation_file_path)
+        cached = self._annotation_dirs.get(dir_path)
+        if cached is not None and name not in cached[1]:
+            del self._annotation_dirs[dir_path]
 
-        else:
-            xml_path = os.path.splitext(file_path)[0] + XML_EXT
-            txt_path = os.path.splitext(file_path)[0] + TXT_EXT
-            json_path = os.path.splitext(file_path)[0] + JSON_EXT
-
-            if os.path.isfile(xml_path):
-                self.load_pascal_xml_by_filename(xml_path)
-            elif os.path.isfile(txt_path):
-                self.load_yolo_txt_by_filename(txt_path)
-            elif os.path.isfile(json_path):
-                self.load_create_ml_json_by_filename(json_path, file_path)
-            
 
     def resizeEvent(self, event):
         if self.canvas and not self.image.isNull()\
-           and self.zoom_mode != self.MANUAL_ZOOM:
-            self.adjust_scale()
+           and self.zoom_mode != self.MANUAL_ZOOM\
+           and not self.resize_timer.isActive():
+            self.resize_timer.start()
         super(MainWindow, self).resizeEvent(event)
 
+    def adjust_scale_to_window(self):
+        if not self.image.isNull() and self.zoom_mode != self.MANUAL_ZOOM:
+            self.adjust_scale()
+
+    def schedule_paint_canvas(self):
+        self.paint_timer.start()
+
     def paint_canvas(self):
         assert not self.image.isNull(), "cannot paint null image"
+        self.paint_timer.stop()
         self.canvas.scale = 0.01 * self.zoom_widget.value()
         self.canvas.overlay_color = self.light_widget.color()
         self.canvas.label_font_size = int(0.02 * max(self.image.width(), self.image.height()))
@@ -2245,18 +2651,49 @@ class MainWindow(QMainWindow, WindowMixin):
             self.load_file(filename)
 
     def scan_all_images(self, folder_path):
-        extensions = ['.%s' % fmt.data().decode("ascii").lower() for fmt in QImageReader.supportedImageFormats()]
-        images = []
-
-        for root, dirs, files in os.walk(folder_path):
-            for file in files:
-                if file.lower().endswith(tuple(extensions)):
-                    relative_path = os.path.join(root, file)
-                    path = ustr(os.path.abspath(relative_path))
-                    images.append(path)
+        folder_path = os.path.abspath(folder_path)
+        # Split off the top level so that each subfolder tree can be
+        # scanned in its own thread, scandir releases the GIL while it waits
+        # on the file system.
+        paths, sub_dirs = self._scan_dir(folder_path)
+        if sub_dirs:
+            with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(sub_dirs))) as pool:
+                for sub_paths in pool.map(lambda path: list(self._iter_images(path)), sub_dirs):
+                    paths.extend(sub_paths)
+        images = [ustr(path) for path in paths]
         natural_sort(images, key=lambda x: x.lower())
         return images
 
+    def _scan_dir(self, folder_path):
+        """Return the image paths and subfolders directly in folder_path."""
+        paths = []
+        sub_dirs = []
+        try:
+            entries = os.scandir(folder_path)
+        except OSError:
+            return paths, sub_dirs
+        with entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if not entry.is_symlink():
+                        sub_dirs.append(entry.path)
+                elif entry.name.lower().endswith(self._img_exts):
+                    paths.append(entry.path)
+        return paths, sub_dirs
+
+    def _iter_images(self, folder_path):
+        """Yield the image paths under folder_path. Like os.walk, symlinked
+        directories are not followed and unreadable ones are skipped."""
+        stack = [folder_path]
+        while stack:
+            paths, sub_dirs = self._scan_dir(stack.pop())
+            stack.extend(sub_dirs)
+            yield from paths
+
     def change_save_dir_dialog(self, _value=False):
         if self.default_save_dir is not None:
             path = ustr(self.default_save_dir)
@@ -2335,11 +2772,22 @@ class MainWindow(QMainWindow, WindowMixin):
         self.file_path = None
         self.file_list_widget.clear()
         self.m_img_list = self.scan_all_images(dir_path)
+        self.m_img_index = {path: i for i, path in enumerate(self.m_img_list)}
+        self.m_img_stems = [os.path.splitext(os.path.basename(path))[0]
+                            for path in self.m_img_list]
         self.img_count = len(self.m_img_list)
+        # The placeholders are per video: a new folder can have other sizes
+        # and another depth
+        self._yolo_size_images.clear()
+        self._voc_size_images.clear()
         self.open_next_image()
-        for imgPath in self.m_img_list:
-            item = QListWidgetItem(imgPath)
-            self.file_list_widget.addItem(item)
+        self.file_list_widget.setUpdatesEnabled(False)
+        self.file_list_widget.blockSignals(True)
+        try:
+            self.file_list_widget.addItems(self.m_img_list)
+        finally:
+            self.file_list_widget.blockSignals(False)
+            self.file_list_widget.setUpdatesEnabled(True)
 
     def verify_image(self, _value=False):
         # Proceeding next image without dialog if having any label
@@ -2383,7 +2831,7 @@ class MainWindow(QMainWindow, WindowMixin):
             filename = self.m_img_list[self.cur_img_idx]
             if filename:
                 # When going to previous frame, load with clear_prev_shapes=True and preserve_zoom=True
-                print(f"[Navigation] Going to previous frame {self.cur_img_idx}")
+                logger.debug("Going to previous frame %d", self.cur_img_idx)
                 self.load_file(filename, clear_prev_shapes=True, preserve_zoom=True)
 
     def open_next_image(self, _value=False):
@@ -2422,9 +2870,7 @@ class MainWindow(QMainWindow, WindowMixin):
         if not self.may_continue():
             return
         path = os.path.dirname(ustr(self.file_path)) if self.file_path else '.'
-        formats = ['*.%s' % fmt.data().decode("ascii").lower() for fmt in QImageReader.supportedImageFormats()]
-        filters = "Image & Label files (%s)" % ' '.join(formats + ['*%s' % LabelFile.suffix])
-        filename,_ = QFileDialog.getOpenFileName(self, '%s - Choose Image or Label file' % __appname__, path, filters)
+        filename,_ = QFileDialog.getOpenFileName(self, '%s - Choose Image or Label file' % __appname__, path, self._open_filter)
         if filename:
             if isinstance(filename, (tuple, list)):
                 filename = filename[0]
@@ -2693,7 +3139,7 @@ class MainWindow(QMainWindow, WindowMixin):
         self.canvas.verified = create_ml_parse_reader.verified
 
     def copy_previous_bounding_boxes(self):
-        current_index = self.m_img_list.index(self.file_path)
+        current_index = self.m_img_index[self.file_path]
         if current_index - 1 >= 0:
             prev_file_path = self.m_img_list[current_index - 1]
             self.show_bounding_box_from_annotation_file(prev_file_path)
@@ -2726,15 +3172,17 @@ class MainWindow(QMainWindow, WindowMixin):
             'shapes': []
         }
         
+        # difficult/paint_label/paint_id are set in Shape.__init__ and the
+        # colours have class-level defaults, so they can be read directly
         for shape in self.canvas.shapes:
             shape_data = {
                 'label': shape.label if shape.label else "",
                 'points': [(p.x(), p.y()) for p in shape.points],
-                'difficult': getattr(shape, 'difficult', False),
-                'paint_label': getattr(shape, 'paint_label', False),
-                'paint_id': getattr(shape, 'paint_id', True),
-                'line_color': shape.line_color.getRgb() if hasattr(shape, 'line_color') and shape.line_color else None,
-                'fill_color': shape.fill_color.getRgb() if hasattr(shape, 'fill_color') and shape.fill_color else None,
+                'difficult': shape.difficult,
+                'paint_label': shape.paint_label,
+                'paint_id': shape.paint_id,
+                'line_color': shape.line_color.getRgb() if shape.line_color else None,
+                'fill_color': shape.fill_color.getRgb() if shape.fill_color else None,
             }
             # Track IDがあれば保存
             if hasattr(shape, 'is_tracked'):
@@ -2747,15 +3195,9 @@ class MainWindow(QMainWindow, WindowMixin):
         """Undo the last action"""
         
         if self.undo_manager.undo():
+            # load_shapes repaints the canvas
             self.canvas.load_shapes(self.canvas.shapes)
-            self.canvas.repaint()
-            
-            # Update label list
-            self.label_list.clear()
-            self.shapes_to_items.clear()
-            self.items_to_shapes.clear()
-            for shape in self.canvas.shapes:
-                self.add_label(shape)
+            self.reload_label_list()
             
             self.statusBar().showMessage('Undo successful', 2000)
         else:
@@ -2766,19 +3208,9 @@ class MainWindow(QMainWindow, WindowMixin):
         
         if self.undo_manager.redo():
             
-            # Reload shapes and update UI
+            # Reload shapes and update UI, load_shapes repaints the canvas
             self.canvas.load_shapes(self.canvas.shapes)
-            self.canvas.repaint()
-            
-            # Update label list by clearing and re-adding all items
-            # Clear existing label list
-            self.label_list.clear()
-            self.shapes_to_items.clear()
-            self.items_to_shapes.clear()
-            
-            # Re-add all shapes to label list
-            for shape in self.canvas.shapes:
-                self.add_label(shape)
+            self.reload_label_list()
             
             self.statusBar().showMessage('Redo successful', 2000)
         else:
@@ -2809,12 +3241,12 @@ class MainWindow(QMainWindow, WindowMixin):
         """Handle tracking mode change (IOU/ID)."""
         mode = self.tracking_mode_group.checkedId()
         self.tracking_mode = "IOU" if mode == 0 else "ID"
-        print(f"[Tracking] Mode changed to: {self.tracking_mode}")
+        logger.debug("Mode changed to: %s", self.tracking_mode)
     
     def on_max_frames_changed(self, value):
         """Handle max frames value change."""
         self.max_tracking_frames = value
-        print(f"[Tracking] Max frames set to: {value}")
+        logger.debug("Max frames set to: %s", value)
     
     def on_change_label1_toggled(self, state):
         """Toggle label 1 change mode."""
@@ -2913,8 +3345,8 @@ class MainWindow(QMainWindow, WindowMixin):
     
     def delete_bbs_in_region(self, region_x1, region_y1, region_x2, region_y2):
         """Delete all bounding boxes completely contained within the specified region."""
-        print(f"[delete_bbs_in_region] Called with region: ({region_x1:.1f}, {region_y1:.1f}) to ({region_x2:.1f}, {region_y2:.1f})")
-        print(f"[delete_bbs_in_region] Current canvas has {len(self.canvas.shapes)} shapes")
+        logger.debug("Called with region: (%.1f, %.1f) to (%.1f, %.1f)", region_x1, region_y1, region_x2, region_y2)
+        logger.debug("Current canvas has %s shapes", len(self.canvas.shapes))
         
         from PyQt5.QtWidgets import QProgressDialog, QApplication
         from libs.undo.commands.region_deletion_commands import RegionDeletionCommand
@@ -2924,21 +3356,21 @@ class MainWindow(QMainWindow, WindowMixin):
         # Ensure region coordinates are in correct order
         if region_x1 > region_x2:
             region_x1, region_x2 = region_x2, region_x1
-            print(f"[delete_bbs_in_region] Swapped X coordinates")
+            logger.debug("Swapped X coordinates")
         if region_y1 > region_y2:
             region_y1, region_y2 = region_y2, region_y1
-            print(f"[delete_bbs_in_region] Swapped Y coordinates")
+            logger.debug("Swapped Y coordinates")
         
-        print(f"[delete_bbs_in_region] Final region bounds: ({region_x1:.1f}, {region_y1:.1f}) to ({region_x2:.1f}, {region_y2:.1f})")
+        logger.debug("Final region bounds: (%.1f, %.1f) to (%.1f, %.1f)", region_x1, region_y1, region_x2, region_y2)
         
         # Get number of frames to process
         num_frames = self.region_deletion_frames_spinbox.value()
         current_idx = self.cur_img_idx
         
-        print(f"[delete_bbs_in_region] Spinbox value: {num_frames}")
-        print(f"[delete_bbs_in_region] Spinbox enabled: {self.region_deletion_frames_spinbox.isEnabled()}")
-        print(f"[delete_bbs_in_region] Processing {num_frames} frames starting from frame {current_idx}")
-        print(f"[delete_bbs_in_region] Total images available: {self.img_count}")
+        logger.debug("Spinbox value: %s", num_frames)
+        logger.debug("Spinbox enabled: %s", self.region_deletion_frames_spinbox.isEnabled())
+        logger.debug("Processing %s frames starting from frame %s", num_frames, current_idx)
+        logger.debug("Total images available: %s", self.img_count)
         
         # Create progress dialog if processing multiple frames
         progress = None
@@ -2967,10 +3399,10 @@ class MainWindow(QMainWindow, WindowMixin):
                 
             target_idx = current_idx + frame_offset
             if target_idx >= self.img_count:
-                print(f"[Region Deletion] Reached end of images at frame {target_idx}")
+                logger.debug("Reached end of images at frame %s", target_idx)
                 break
             
-            print(f"[Region Deletion] Processing frame offset {frame_offset}, target index {target_idx}")
+            logger.debug("Processing frame offset %s, target index %s", frame_offset, target_idx)
             
             if progress:
                 progress.setValue(frame_offset)
@@ -2979,26 +3411,26 @@ class MainWindow(QMainWindow, WindowMixin):
             
             # Get the target file
             target_file = self.m_img_list[target_idx] if frame_offset > 0 else self.file_path
-            print(f"[Region Deletion] Target file: {target_file}")
+            logger.debug("Target file: %s", target_file)
             
             # Find shapes to delete in this frame
             if frame_offset == 0:
                 # Current frame - check current canvas shapes
-                print(f"[delete_bbs_in_region] Processing current frame (offset 0)")
-                print(f"[delete_bbs_in_region] Checking {len(self.canvas.shapes)} shapes in current canvas")
+                logger.debug("Processing current frame (offset 0)")
+                logger.debug("Checking %s shapes in current canvas", len(self.canvas.shapes))
                 
                 shapes_to_delete = []
                 for i, current_shape in enumerate(self.canvas.shapes):
                     shape_label = current_shape.label if hasattr(current_shape, 'label') else 'unknown'
-                    print(f"[delete_bbs_in_region] Checking shape {i}: {shape_label}")
+                    logger.debug("Checking shape %s: %s", i, shape_label)
                     
                     if self.is_shape_contained_in_region(current_shape, region_x1, region_y1, region_x2, region_y2):
                         shapes_to_delete.append((i, current_shape))
-                        print(f"[delete_bbs_in_region] -> Shape {i} ({shape_label}) WILL BE DELETED")
+                        logger.debug("-> Shape %s (%s) WILL BE DELETED", i, shape_label)
                     else:
-                        print(f"[delete_bbs_in_region] -> Shape {i} ({shape_label}) will be kept")
+                        logger.debug("-> Shape %s (%s) will be kept", i, shape_label)
                 
-                print(f"[delete_bbs_in_region] Found {len(shapes_to_delete)} shapes to delete in current frame out of {len(self.canvas.shapes)} total shapes")
+                logger.debug("Found %s shapes to delete in current frame out of %s total shapes", len(shapes_to_delete), len(self.canvas.shapes))
                 
                 # Use RegionDeletionCommand for current frame
                 if shapes_to_delete:
@@ -3007,7 +3439,7 @@ class MainWindow(QMainWindow, WindowMixin):
                     total_deleted += len(shapes_to_delete)
             else:
                 # Other frames - use specialized command
-                print(f"[Region Deletion] Creating deletion command for other frame: {target_file}")
+                logger.debug("Creating deletion command for other frame: %s", target_file)
                 from libs.undo.commands.region_deletion_other_frame_commands import RegionDeletionOtherFrameCommand
                 
                 other_frame_cmd = RegionDeletionOtherFrameCommand(
@@ -3026,58 +3458,47 @@ class MainWindow(QMainWindow, WindowMixin):
         
         # Execute all delete commands as a composite
         if all_delete_commands:
-            print(f"[delete_bbs_in_region] Creating composite command with {len(all_delete_commands)} commands")
+            logger.debug("Creating composite command with %s commands", len(all_delete_commands))
             composite_cmd = CompositeCommand(
                 all_delete_commands,
                 f"Region deletion: {total_deleted} BBs from {frames_processed} frame(s)"
             )
             
             # Execute the composite command
-            print(f"[delete_bbs_in_region] Executing composite command...")
+            logger.debug("Executing composite command...")
             success = self.undo_manager.execute_command(composite_cmd)
             
             if not success:
-                print(f"[delete_bbs_in_region] Warning: Some deletions may have failed")
+                logger.warning("Some deletions may have failed")
             else:
-                print(f"[delete_bbs_in_region] Successfully deleted {total_deleted} shapes")
-                print(f"[delete_bbs_in_region] Canvas now has {len(self.canvas.shapes)} shapes after deletion")
+                logger.debug("Successfully deleted %s shapes", total_deleted)
+                logger.debug("Canvas now has %s shapes after deletion", len(self.canvas.shapes))
             
             # Save if auto-saving is enabled
             if self.auto_saving.isChecked():
                 self.save_file()
             
             # Update display - need to reload shapes properly
-            print(f"[delete_bbs_in_region] Before update: Canvas has {len(self.canvas.shapes)} shapes")
+            logger.debug("Before update: Canvas has %s shapes", len(self.canvas.shapes))
             
             # Update canvas display without reloading shapes
             if hasattr(self.canvas, 'update'):
-                print(f"[delete_bbs_in_region] Updating canvas display...")
+                logger.debug("Updating canvas display...")
                 self.canvas.update()
             
-            print(f"[delete_bbs_in_region] After canvas.load_shapes: Canvas has {len(self.canvas.shapes)} shapes")
+            logger.debug("After canvas.load_shapes: Canvas has %s shapes", len(self.canvas.shapes))
             
             # List remaining shapes
-            print(f"[delete_bbs_in_region] Remaining shapes:")
+            logger.debug("Remaining shapes:")
             for i, shape in enumerate(self.canvas.shapes):
                 shape_label = shape.label if hasattr(shape, 'label') else 'unknown'
-                print(f"[delete_bbs_in_region]   {i}: {shape_label}")
+                logger.debug("  %s: %s", i, shape_label)
             
             # Rebuild label list
-            print(f"[delete_bbs_in_region] Rebuilding label list for {len(self.canvas.shapes)} shapes")
-            self.label_list.clear()
+            logger.debug("Rebuilding label list for %s shapes", len(self.canvas.shapes))
+            self.reload_label_list()
             
-            # Clear mappings before rebuilding
-            self.items_to_shapes.clear()
-            self.shapes_to_items.clear()
-            
-            # Manually add labels
-            if len(self.canvas.shapes) > 0:
-                print(f"[delete_bbs_in_region] Adding labels for {len(self.canvas.shapes)} shapes...")
-                for shape in self.canvas.shapes:
-                    self.add_label(shape)
-                    print(f"[delete_bbs_in_region] Added label for shape: {shape.label if hasattr(shape, 'label') else 'unknown'}")
-            
-            print(f"[delete_bbs_in_region] Display updated. Label list has {self.label_list.count()} items")
+            logger.debug("Display updated. Label list has %s items", self.label_list.count())
             
             # Show status message
             if frames_processed > 1:
@@ -3096,7 +3517,7 @@ class MainWindow(QMainWindow, WindowMixin):
         # Get shape bounds
         points = shape.points
         if len(points) < 2:
-            print(f"[is_shape_contained_in_region] Shape has less than 2 points, skipping")
+            logger.debug("Shape has less than 2 points, skipping")
             return False
         
         x_coords = [p.x() for p in points]
@@ -3106,8 +3527,8 @@ class MainWindow(QMainWindow, WindowMixin):
         
         shape_label = shape.label if hasattr(shape, 'label') else 'unknown'
         
-        print(f"[is_shape_contained_in_region] Shape '{shape_label}' bounds: ({shape_x1:.1f}, {shape_y1:.1f}) to ({shape_x2:.1f}, {shape_y2:.1f})")
-        print(f"[is_shape_contained_in_region] Region bounds: ({region_x1:.1f}, {region_y1:.1f}) to ({region_x2:.1f}, {region_y2:.1f})")
+        logger.debug("Shape '%s' bounds: (%.1f, %.1f) to (%.1f, %.1f)", shape_label, shape_x1, shape_y1, shape_x2, shape_y2)
+        logger.debug("Region bounds: (%.1f, %.1f) to (%.1f, %.1f)", region_x1, region_y1, region_x2, region_y2)
         
         # Check each condition separately for debugging
         x1_ok = region_x1 <= shape_x1
@@ -3115,14 +3536,14 @@ class MainWindow(QMainWindow, WindowMixin):
         x2_ok = region_x2 >= shape_x2
         y2_ok = region_y2 >= shape_y2
         
-        print(f"[is_shape_contained_in_region] Containment check: x1={x1_ok}, y1={y1_ok}, x2={x2_ok}, y2={y2_ok}")
+        logger.debug("Containment check: x1=%s, y1=%s, x2=%s, y2=%s", x1_ok, y1_ok, x2_ok, y2_ok)
         
         contained = x1_ok and y1_ok and x2_ok and y2_ok
         
         if contained:
-            print(f"[is_shape_contained_in_region] Shape '{shape_label}' is CONTAINED in region")
+            logger.debug("Shape '%s' is CONTAINED in region", shape_label)
         else:
-            print(f"[is_shape_contained_in_region] Shape '{shape_label}' is NOT contained in region")
+            logger.debug("Shape '%s' is NOT contained in region", shape_label)
         
         return contained
     
@@ -3213,10 +3634,10 @@ class MainWindow(QMainWindow, WindowMixin):
             if class_name1:
                 self.current_label1 = class_name1
                 self.default_label = class_name1
-                print(f"[QuickID] Updated current_label1: {class_name1}")
+                logger.debug("Updated current_label1: %s", class_name1)
             if class_name2:
                 self.current_label2 = class_name2
-                print(f"[QuickID] Updated current_label2: {class_name2}")
+                logger.debug("Updated current_label2: %s", class_name2)
             
             self.apply_quick_id_to_selected_shape()
     
@@ -3236,7 +3657,7 @@ class MainWindow(QMainWindow, WindowMixin):
     
     def on_quick_label1_selected(self, class_name):
         """Quick ID SelectorからのLabel1シグナルを受信"""
-        print(f"[QuickID] Label1 selected from selector: {class_name}")
+        logger.debug("Label1 selected from selector: %s", class_name)
         
         # current_label1を更新（これが実際に使用される値）
         self.current_label1 = class_name
@@ -3252,7 +3673,7 @@ class MainWindow(QMainWindow, WindowMixin):
     
     def on_quick_label2_selected(self, class_name):
         """Quick ID SelectorからのLabel2シグナルを受信"""
-        print(f"[QuickID] Label2 selected from selector: {class_name}")
+        logger.debug("Label2 selected from selector: %s", class_name)
         
         # current_label2を更新（これが実際に使用される値）
         self.current_label2 = class_name
@@ -3273,7 +3694,7 @@ class MainWindow(QMainWindow, WindowMixin):
         # ステータスバーの表示を更新
         self.update_current_id_display()
         
-        print(f"[QuickID] ID selected from selector: {id_str}")
+        logger.debug("ID selected from selector: %s", id_str)
         
         # デフォルトラベルコンボボックスも同期更新
         try:
@@ -3293,7 +3714,7 @@ class MainWindow(QMainWindow, WindowMixin):
             # 実際のクラス名を取得して表示
             class_name = self.get_class_name_for_quick_id(self.current_quick_id)
             self.label_current_id.setText(f'{class_name}')
-            print(f"[QuickID] Status bar updated: {class_name}")
+            logger.debug("Status bar updated: %s", class_name)
     
     def apply_quick_id_to_selected_shape(self):
         """選択中のBBに現在のQuick IDを適用"""
@@ -3327,7 +3748,7 @@ class MainWindow(QMainWindow, WindowMixin):
                 if label1_changed or label2_changed:
                     # 連続ID付けモードの場合はマルチフレーム操作として処理
                     if self.continuous_tracking_mode:
-                        print(f"[QuickID] Starting continuous tracking with Quick ID")
+                        logger.debug("Starting continuous tracking with Quick ID")
                         # Create the appropriate label change and propagate
                         if label1_changed and label2_changed:
                             # Both labels changed
@@ -3364,18 +3785,17 @@ class MainWindow(QMainWindow, WindowMixin):
                             color_label = self.get_color_label_for_shape(shape)
                             item.setBackground(generate_color_by_text(color_label))
                         
-                        # Update canvas to reflect color changes
-                        self.canvas.load_shapes(self.canvas.shapes)
-                        self.canvas.repaint()
+                        # Only colours changed, the shape list is the same
+                        self.canvas.update()
                         
                         # UIを更新
                         self.set_dirty()
                         self.update_combo_box()
                         
                         if label1_changed:
-                            print(f"[QuickID] Applied label1 {new_label1} to shape")
+                            logger.debug("Applied label1 %s to shape", new_label1)
                         if label2_changed:
-                            print(f"[QuickID] Applied label2 {new_label2} to shape")
+                            logger.debug("Applied label2 %s to shape", new_label2)
             else:
                 # Original behavior for single label mode
                 # Quick IDに対応する実際のクラス名を取得（IDサフィックスなし）
@@ -3386,7 +3806,7 @@ class MainWindow(QMainWindow, WindowMixin):
                 if old_label != new_label:
                     # 連続ID付けモードの場合はマルチフレーム操作として処理
                     if self.continuous_tracking_mode:
-                        print(f"[QuickID] Starting continuous ID assignment: {old_label} -> {new_label}")
+                        logger.debug("Starting continuous ID assignment: %s -> %s", old_label, new_label)
                         
                         # マルチフレーム操作として処理
                         self.apply_quick_id_with_propagation(shape, new_label, old_label)
@@ -3407,17 +3827,16 @@ class MainWindow(QMainWindow, WindowMixin):
                             # Update item background color
                             item.setBackground(generate_color_by_text(new_label))
                         
-                        # Update canvas to reflect color changes
-                        self.canvas.load_shapes(self.canvas.shapes)
-                        self.canvas.repaint()
+                        # Only colours changed, the shape list is the same
+                        self.canvas.update()
                         
                         # UIを更新
                         self.set_dirty()
                         self.update_combo_box()
                         
-                        print(f"[QuickID] Applied ID {self.current_quick_id} to shape: {old_label} -> {new_label}")
+                        logger.debug("Applied ID %s to shape: %s -> %s", self.current_quick_id, old_label, new_label)
         else:
-            print("[QuickID] No shape selected for ID application")
+            logger.debug("No shape selected for ID application")
     
     def apply_quick_id_with_propagation(self, shape, new_label, old_label):
         """連続ID付けモードでラベルを適用し、後続フレームに伝播させる（マルチフレーム操作）"""
@@ -3445,7 +3864,7 @@ class MainWindow(QMainWindow, WindowMixin):
         if self.auto_saving.isChecked() and self.default_save_dir:
             self.save_file()
         
-        print(f"[QuickID] Applied to current frame: {old_label} -> {new_label}")
+        logger.debug("Applied to current frame: %s -> %s", old_label, new_label)
         
         # 後続フレームに伝播
         frames_processed = self._propagate_label_to_subsequent_frames_multi(shape, new_label, "QuickID")
@@ -3490,7 +3909,7 @@ class MainWindow(QMainWindow, WindowMixin):
         if self.auto_saving.isChecked() and self.default_save_dir:
             self.save_file()
         
-        print(f"[QuickID] Applied label2 to current frame: {old_id} -> {new_id}")
+        logger.debug("Applied label2 to current frame: %s -> %s", old_id, new_id)
         
         # 後続フレームに伝播 - label2用の伝播関数を使用
         frames_processed = self._propagate_label2_to_subsequent_frames_multi(shape, new_id, "QuickID")
@@ -3521,38 +3940,8 @@ class MainWindow(QMainWindow, WindowMixin):
     
     def calculate_iou(self, box1, box2):
         """Calculate Intersection over Union between two bounding boxes."""
-        # Get coordinates from all points to find bounding box
         # Handle both QPointF objects and tuples/lists
-        x1_coords = [p[0] if isinstance(p, (list, tuple)) else p.x() for p in box1]
-        y1_coords = [p[1] if isinstance(p, (list, tuple)) else p.y() for p in box1]
-        x2_coords = [p[0] if isinstance(p, (list, tuple)) else p.x() for p in box2]
-        y2_coords = [p[1] if isinstance(p, (list, tuple)) else p.y() for p in box2]
-        
-        x1_min, x1_max = min(x1_coords), max(x1_coords)
-        y1_min, y1_max = min(y1_coords), max(y1_coords)
-        x2_min, x2_max = min(x2_coords), max(x2_coords)
-        y2_min, y2_max = min(y2_coords), max(y2_coords)
-        
-        # Calculate intersection area
-        inter_x_min = max(x1_min, x2_min)
-        inter_y_min = max(y1_min, y2_min)
-        inter_x_max = min(x1_max, x2_max)
-        inter_y_max = min(y1_max, y2_max)
-        
-        if inter_x_max < inter_x_min or inter_y_max < inter_y_min:
-            return 0.0
-        
-        inter_area = (inter_x_max - inter_x_min) * (inter_y_max - inter_y_min)
-        
-        # Calculate union area
-        box1_area = (x1_max - x1_min) * (y1_max - y1_min)
-        box2_area = (x2_max - x2_min) * (y2_max - y2_min)
-        union_area = box1_area + box2_area - inter_area
-        
-        if union_area == 0:
-            return 0.0
-        
-        return inter_area / union_area
+        return bbox_iou(points_bbox(box1), points_bbox(box2))
     
     def get_annotation_path(self, image_path):
         """Get annotation file path for given image path."""
@@ -3613,11 +4002,11 @@ class MainWindow(QMainWindow, WindowMixin):
                     pass
                 else:
                     # If image can't be loaded, skip
-                    print(f"[Warning] Could not load image for YOLO annotation: {image_path}")
+                    logger.warning("Could not load image for YOLO annotation: %s", image_path)
                     return shapes
                 
                 if img.isNull():
-                    print(f"[Warning] Image is null for YOLO annotation: {image_path}")
+                    logger.warning("Image is null for YOLO annotation: %s", image_path)
                     return shapes
                     
                 # YoloReader expects the QImage object, not the shape
@@ -3658,7 +4047,7 @@ class MainWindow(QMainWindow, WindowMixin):
                             'fill_color': fill_color
                         }
                     else:
-                        print(f"[Warning] Unknown shape format with {len(shape_item)} elements")
+                        logger.warning("Unknown shape format with %s elements", len(shape_item))
                         continue
                     shapes.append(shape)
         except Exception as e:
@@ -3671,8 +4060,8 @@ class MainWindow(QMainWindow, WindowMixin):
         if not self.bb_duplication_mode or not source_shape:
             return
         
-        print(f"[BB Duplication] Starting BB duplication from frame {self.cur_img_idx}")
-        print(f"[BB Duplication] Source shape points: {[(p.x(), p.y()) for p in source_shape.points]}")
+        logger.debug("Starting BB duplication from frame %s", self.cur_img_idx)
+        logger.debug("Source shape points: %s", [(p.x(), p.y()) for p in source_shape.points])
         
         # Get number of frames to duplicate to
         num_frames = self.bb_dup_frame_count.value()
@@ -3702,6 +4091,18 @@ class MainWindow(QMainWindow, WindowMixin):
         progress.show()
         QApplication.processEvents()
         
+        # The source box and threshold are the same for every frame
+        source_bbox = points_bbox(source_shape.points) if len(source_shape.points) == 4 else None
+        iou_threshold = self.bb_dup_iou_threshold.value()
+        from libs.undo.commands.bb_duplication_commands import is_same_shape
+        # Compare against the fields the loop writes; the copy gets no label2
+        source_data = {
+            'label': source_shape.label,
+            'label2': "",
+            'points': [(p.x(), p.y()) for p in source_shape.points],
+            'difficult': getattr(source_shape, 'difficult', False)
+        }
+        
         for i in range(1, num_frames + 1):
             if progress.wasCanceled():
                 break
@@ -3723,39 +4124,39 @@ class MainWindow(QMainWindow, WindowMixin):
             shapes_to_remove = []
             should_add_shape = True
             
-            for existing_shape in self.canvas.shapes:
-                # Only check IoU if both shapes have 4 points (rectangles)
-                if len(source_shape.points) == 4 and len(existing_shape.points) == 4:
-                    iou = self.calculate_iou(source_shape.points, existing_shape.points)
-                    print(f"[BB Duplication] Checking IOU with existing shape: {iou:.3f}")
-                    if iou >= self.bb_dup_iou_threshold.value():
-                        if overwrite_mode:
-                            # Mark shape for removal
-                            shapes_to_remove.append(existing_shape)
-                            print(f"[BB Duplication] Frame {target_idx}: Overwriting existing BB (IOU={iou:.2f})")
-                        else:
-                            # Skip this frame if any overlap found
-                            should_add_shape = False
-                            frames_with_conflicts += 1
-                            print(f"[BB Duplication] Frame {target_idx}: Skipping due to overlap (IOU={iou:.2f})")
-                            break  # In skip mode, one overlap is enough to skip
+            # Only check IoU if both shapes have 4 points (rectangles)
+            candidates = [shape for shape in self.canvas.shapes if len(shape.points) == 4] \
+                if source_bbox is not None else []
+            ious = bbox_ious(source_bbox, [points_bbox(shape.points) for shape in candidates])
+            for existing_shape, iou in zip(candidates, ious):
+                logger.debug("Checking IOU with existing shape: %.3f", iou)
+                if iou >= iou_threshold:
+                    if overwrite_mode:
+                        # Mark shape for removal
+                        shapes_to_remove.append(existing_shape)
+                        logger.debug("Frame %s: Overwriting existing BB (IOU=%.2f)", target_idx, iou)
+                    else:
+                        # Skip this frame if any overlap found
+                        should_add_shape = False
+                        frames_with_conflicts += 1
+                        logger.debug("Frame %s: Skipping due to overlap (IOU=%.2f)", target_idx, iou)
+                        break  # In skip mode, one overlap is enough to skip
+            
+            # Overwriting a single identical BB would change nothing
+            if len(shapes_to_remove) == 1 and is_same_shape(shapes_to_remove[0], source_data):
+                shapes_to_remove = []
+                should_add_shape = False
             
             # Perform modifications
             modified = False
             
             # Remove all overlapping shapes if in overwrite mode
             if shapes_to_remove:
+                removed = set(shapes_to_remove)
+                self.canvas.shapes[:] = [s for s in self.canvas.shapes if s not in removed]
                 for shape_to_remove in shapes_to_remove:
-                    self.canvas.shapes.remove(shape_to_remove)
-                    # Remove from label list
-                    for i in range(self.label_list.count()):
-                        item = self.label_list.item(i)
-                        if item and item in self.items_to_shapes:
-                            if self.items_to_shapes[item] == shape_to_remove:
-                                self.label_list.takeItem(i)
-                                del self.items_to_shapes[item]
-                                del self.shapes_to_items[shape_to_remove]
-                                break
+                    # Remove from label list via the shape -> item map
+                    self.remove_label(shape_to_remove)
                 modified = True
             
             # Add duplicated shape
@@ -3884,7 +4285,7 @@ class MainWindow(QMainWindow, WindowMixin):
         # If continuous tracking mode is ON, propagate label using selected tracking mode
         if self.continuous_tracking_mode:
             tracking_mode_text = "IOU-based" if self.tracking_mode == "IOU" else "ID-based"
-            print(f"[ContinuousTracking] Starting {tracking_mode_text} label propagation: '{old_label1}' -> '{new_label1}'")
+            logger.debug("Starting %s label propagation: '%s' -> '%s'", tracking_mode_text, old_label1, new_label1)
             
             # Create progress dialog
             from PyQt5.QtWidgets import QProgressDialog, QApplication
@@ -3928,13 +4329,14 @@ class MainWindow(QMainWindow, WindowMixin):
                     # Fallback to label1 for safety
                     change_cmd = ChangeLabelCommand(self.file_path, shape_index, old_label1, new_label1, direct_file_edit=True)
             change_commands.append(change_cmd)
-            print(f"[ContinuousTracking] Changed current frame {current_idx}: '{old_label1}' -> '{new_label1}'")
+            logger.debug("Changed current frame %s: '%s' -> '%s'", current_idx, old_label1, new_label1)
             
             # Get current shape's points for IOU matching
             current_shape_points = [(p.x(), p.y()) for p in shape.points]
             
             # Find and prepare commands for subsequent frames with matching shapes
             prev_shape_points = current_shape_points
+            prev_bbox = points_bbox(prev_shape_points) if len(prev_shape_points) == 4 else None
             
             # Track through subsequent frames
             frames_processed = 0
@@ -3958,11 +4360,11 @@ class MainWindow(QMainWindow, WindowMixin):
                 # Load target frame's annotation without changing current view
                 import os
                 annotation_path = self.get_annotation_path(target_file)
-                print(f"[ContinuousTracking] Checking frame {target_idx}: {annotation_path}")
+                logger.debug("Checking frame %s: %s", target_idx, annotation_path)
                 if annotation_path and os.path.exists(annotation_path):
                     # Load shapes from annotation file directly, pass the image path
                     shapes_in_target = self.load_shapes_from_annotation_file(annotation_path, target_file)
-                    print(f"[ContinuousTracking] Found {len(shapes_in_target)} shapes in frame {target_idx}")
+                    logger.debug("Found %s shapes in frame %s", len(shapes_in_target), target_idx)
                     
                     # Find matching shape based on tracking mode
                     best_match_idx = -1
@@ -3972,14 +4374,14 @@ class MainWindow(QMainWindow, WindowMixin):
                     if self.tracking_mode == "ID":
                         # ID tracking mode - find shape with matching Label1
                         target_id = old_label1 if self.change_label1_enabled else new_label1
-                        print(f"[ContinuousTracking] ID mode: searching for ID '{target_id}'")
+                        logger.debug("ID mode: searching for ID '%s'", target_id)
                         
                         for idx, target_shape_data in enumerate(shapes_in_target):
                             shape_label = target_shape_data.get('label')
                             if shape_label == target_id:
                                 best_match_idx = idx
                                 best_match_label = shape_label
-                                print(f"[ContinuousTracking] Found matching ID at shape {idx}")
+                                logger.debug("Found matching ID at shape %s", idx)
                                 break
                     else:
                         # IOU tracking mode - find shape with best overlap
@@ -3989,13 +4391,13 @@ class MainWindow(QMainWindow, WindowMixin):
                             
                             # Debug: Print first point of each shape to see coordinate ranges
                             if idx == 0 and len(target_points) > 0 and len(prev_shape_points) > 0:
-                                print(f"[DEBUG] Prev shape first point: {prev_shape_points[0]}")
-                                print(f"[DEBUG] Target shape first point: {target_points[0]}")
+                                logger.debug("Prev shape first point: %s", prev_shape_points[0])
+                                logger.debug("Target shape first point: %s", target_points[0])
                             
                             # Calculate IOU regardless of label
-                            if len(target_points) == 4 and len(prev_shape_points) == 4:
-                                iou = self.calculate_iou(prev_shape_points, target_points)
-                                print(f"[ContinuousTracking] Shape {idx} (label='{shape_label}'): IOU={iou:.3f}")
+                            if len(target_points) == 4 and prev_bbox is not None:
+                                iou = bbox_iou(prev_bbox, points_bbox(target_points))
+                                logger.debug("Shape %s (label='%s'): IOU=%.3f", idx, shape_label, iou)
                             
                             # Use IOU threshold of 0.4 as per specification
                             if iou > best_iou and iou >= 0.4:
@@ -4022,11 +4424,11 @@ class MainWindow(QMainWindow, WindowMixin):
                         
                         # Check if we hit the target label (stop condition)
                         if best_match_label == target_new_label:
-                            print(f"[ContinuousTracking] Found shape with target label '{target_new_label}' at frame {target_idx}, stopping")
+                            logger.debug("Found shape with target label '%s' at frame %s, stopping", target_new_label, target_idx)
                             break
                         
                         # Found matching shape, change its label to target_new_label
-                        print(f"[ContinuousTracking] Tracking successful at frame {target_idx}")
+                        logger.debug("Tracking successful at frame %s", target_idx)
                         
                         # Print appropriate debug message based on what's being changed
                         if self.dual_label_mode:
@@ -4037,9 +4439,9 @@ class MainWindow(QMainWindow, WindowMixin):
                                 changes.append(f"label1: '{old_l1}' -> '{new_label1}'")
                             if self.change_label2_enabled:
                                 changes.append(f"label2: '{old_l2}' -> '{new_label2}'")
-                            print(f"[ContinuousTracking]   - Shape {best_match_idx}: {', '.join(changes)} (IOU={best_iou:.3f})")
+                            logger.debug("  - Shape %s: %s (IOU=%.3f)", best_match_idx, ', '.join(changes), best_iou)
                         else:
-                            print(f"[ContinuousTracking]   - Shape {best_match_idx}: '{best_match_label}' -> '{target_new_label}' (IOU={best_iou:.3f})")
+                            logger.debug("  - Shape %s: '%s' -> '%s' (IOU=%.3f)", best_match_idx, best_match_label, target_new_label, best_iou)
                         
                         # Create change command based on mode
                         if self.dual_label_mode:
@@ -4064,15 +4466,16 @@ class MainWindow(QMainWindow, WindowMixin):
                         
                         # Update tracking for next frame
                         prev_shape_points = shapes_in_target[best_match_idx].get('points', [])
+                        prev_bbox = points_bbox(prev_shape_points) if len(prev_shape_points) == 4 else None
                         end_frame = target_idx
                         frames_processed += 1
                     else:
                         # No matching shape found (IOU < 0.4), stop propagation
-                        print(f"[ContinuousTracking] No matching shape found in frame {target_idx} (IOU < 0.4), stopping")
+                        logger.debug("No matching shape found in frame %s (IOU < 0.4), stopping", target_idx)
                         break
                 else:
                     # No annotation file, stop propagation
-                    print(f"[ContinuousTracking] No annotation found in frame {target_idx}, stopping")
+                    logger.debug("No annotation found in frame %s, stopping", target_idx)
                     break
             
             progress.close()
@@ -4171,16 +4574,16 @@ class MainWindow(QMainWindow, WindowMixin):
         shape.line_color = generate_color_by_text(shape.label)
         item.setBackground(generate_color_by_text(shape.label))
         
-        # Mark as dirty and update
+        # Mark as dirty and update; only the label changed, so repaint in place
         self.set_dirty()
-        self.canvas.load_shapes(self.canvas.shapes)
+        self.canvas.update()
         self.update_combo_box()
         
         # 現在のフレームを保存（必要なら）
         if self.auto_saving.isChecked() and self.default_save_dir:
             self.save_file()
         
-        print(f"[ClickChange] Applied to current frame: {old_label} -> {new_label}")
+        logger.debug("Applied to current frame: %s -> %s", old_label, new_label)
         
         # 後続フレームに伝播
         frames_processed = self._propagate_label_to_subsequent_frames_multi(shape, new_label, "ClickChange")
@@ -4206,7 +4609,7 @@ class MainWindow(QMainWindow, WindowMixin):
             'file_path': self.file_path
         }
         
-        prev_shape = source_shape.copy()
+        prev_bbox = self._get_bbox_from_shape(source_shape)
         frame_idx = current_state['frame_idx'] + 1
         frames_processed = 0
         
@@ -4223,28 +4626,29 @@ class MainWindow(QMainWindow, WindowMixin):
         progress.setMinimumDuration(0)
         progress.show()
         
-        while frame_idx < self.img_count:
+        # 次のフレームのアノテーションは先読みされる
+        annotations = self._iter_annotation_shapes(frame_idx, image_size)
+        last_ui_tick = 0.0
+        for next_file, annotation_paths, shapes_data in annotations:
+            # プログレス更新（イベント処理はPROGRESS_UPDATE_INTERVALごと）
+            now = time.monotonic()
+            if now - last_ui_tick >= PROGRESS_UPDATE_INTERVAL:
+                last_ui_tick = now
+                progress.setValue(frame_idx - current_state['frame_idx'])
+                progress.setLabelText(f"処理中: フレーム {frame_idx + 1}/{self.img_count}")
+                QApplication.processEvents()
+            
             # キャンセルチェック
             if progress.wasCanceled():
-                print(f"[{prefix}] Cancelled by user at frame {frame_idx}")
+                logger.debug("%s: Cancelled by user at frame %s", prefix, frame_idx)
                 break
             
-            # プログレス更新
-            progress.setValue(frame_idx - current_state['frame_idx'])
-            progress.setLabelText(f"処理中: フレーム {frame_idx + 1}/{self.img_count}")
-            QApplication.processEvents()
-            
-            # 次のフレームのアノテーションを読み込む
-            next_file = self.m_img_list[frame_idx]
-            annotation_paths = self._get_annotation_paths(next_file)
-            shapes_data = self._load_annotation_shapes_with_size(annotation_paths, next_file, image_size)
-            
             if not shapes_data:
-                print(f"[{prefix}] No annotation found at frame {frame_idx}, stopping")
+                logger.debug("%s: No annotation found at frame %s, stopping", prefix, frame_idx)
                 break
             
             # マッチする形状を探す
-            best_match_idx, best_iou = self._find_best_match(shapes_data, prev_shape)
+            best_match_idx, best_iou = self._find_best_match(shapes_data, prev_bbox)
             
             if best_match_idx >= 0:
                 # 現在のラベルをチェック
@@ -4252,38 +4656,38 @@ class MainWindow(QMainWindow, WindowMixin):
                 
                 # 既に同じラベルの場合は停止
                 if current_label == new_label:
-                    print(f"[{prefix}] Already has label '{new_label}' at frame {frame_idx}, stopping")
+                    logger.debug("%s: Already has label '%s' at frame %s, stopping", prefix, new_label, frame_idx)
                     break
                 
                 # ラベルを更新
-                print(f"[{prefix}] Found match at frame {frame_idx} with IOU {best_iou:.2f} (current: {current_label})")
+                logger.debug("%s: Found match at frame %s with IOU %.2f (current: %s)",
+                             prefix, frame_idx, best_iou, current_label)
                 shapes_data[best_match_idx] = self._update_shape_label(shapes_data[best_match_idx], new_label)
                 
                 # アノテーションを保存
-                if self._save_propagated_annotation_with_size(annotation_paths, shapes_data, next_file, image_size):
+                if self._save_propagated_annotation(annotation_paths, shapes_data, next_file, image_size):
                     
-                    # 次の反復用にprev_shapeを更新
-                    points = shapes_data[best_match_idx][1]
-                    prev_shape = Shape(label=new_label)
-                    for x, y in points:
-                        prev_shape.add_point(QPointF(x, y))
-                    prev_shape.close()
+                    # 次の反復用にprev_bboxを更新
+                    prev_bbox = points_bbox(shapes_data[best_match_idx][1])
                     frames_processed += 1
                 else:
-                    print(f"[{prefix}] Failed to save annotation at frame {frame_idx}")
+                    logger.warning("%s: Failed to save annotation at frame %s", prefix, frame_idx)
                     break
             else:
-                print(f"[{prefix}] No matching shape found at frame {frame_idx}, stopping")
+                logger.debug("%s: No matching shape found at frame %s, stopping", prefix, frame_idx)
                 break
             
             frame_idx += 1
+        annotations.close()
+        # 間引きで反映されなかった最後のフレーム分を表示
+        progress.setValue(min(frame_idx - current_state['frame_idx'], progress.maximum()))
         
         progress.close()
         
         # 状態を復元
         self._restore_state(current_state)
         
-        print(f"[{prefix}] Propagated to {frames_processed} subsequent frames")
+        logger.debug("%s: Propagated to %s subsequent frames", prefix, frames_processed)
         return frames_processed
     
     def _propagate_label2_to_subsequent_frames_multi(self, source_shape, new_label2, prefix="Propagate"):
@@ -4295,7 +4699,7 @@ class MainWindow(QMainWindow, WindowMixin):
             'file_path': self.file_path
         }
         
-        prev_shape = source_shape.copy()
+        prev_bbox = self._get_bbox_from_shape(source_shape)
         frame_idx = current_state['frame_idx'] + 1
         frames_processed = 0
         
@@ -4317,28 +4721,29 @@ class MainWindow(QMainWindow, WindowMixin):
         progress.show()
         QApplication.processEvents()
         
-        while frame_idx < self.img_count:
+        # 次のフレームのアノテーションは先読みされる
+        annotations = self._iter_annotation_shapes(frame_idx, image_size)
+        last_ui_tick = 0.0
+        for next_file, annotation_paths, shapes_data in annotations:
+            # プログレス更新（イベント処理はPROGRESS_UPDATE_INTERVALごと）
+            now = time.monotonic()
+            if now - last_ui_tick >= PROGRESS_UPDATE_INTERVAL:
+                last_ui_tick = now
+                progress.setValue(frame_idx - current_state['frame_idx'])
+                progress.setLabelText(f"処理中: フレーム {frame_idx + 1}/{self.img_count}")
+                QApplication.processEvents()
+            
             # キャンセルチェック
             if progress.wasCanceled():
-                print(f"[{prefix}] Cancelled by user at frame {frame_idx}")
+                logger.debug("%s: Cancelled by user at frame %s", prefix, frame_idx)
                 break
             
-            # プログレス更新
-            progress.setValue(frame_idx - current_state['frame_idx'])
-            progress.setLabelText(f"処理中: フレーム {frame_idx + 1}/{self.img_count}")
-            QApplication.processEvents()
-            
-            # 次のフレームのアノテーションを読み込む
-            next_file = self.m_img_list[frame_idx]
-            annotation_paths = self._get_annotation_paths(next_file)
-            shapes_data = self._load_annotation_shapes_with_size(annotation_paths, next_file, image_size)
-            
             if not shapes_data:
-                print(f"[{prefix}] No annotation found at frame {frame_idx}, stopping")
+                logger.debug("%s: No annotation found at frame %s, stopping", prefix, frame_idx)
                 break
             
             # マッチする形状を探す (IOU based)
-            best_match_idx, best_iou = self._find_best_match(shapes_data, prev_shape)
+            best_match_idx, best_iou = self._find_best_match(shapes_data, prev_bbox)
             
             if best_match_idx >= 0:
                 # Get current label2 (if it exists)
@@ -4346,40 +4751,38 @@ class MainWindow(QMainWindow, WindowMixin):
                 
                 # 既に同じIDの場合は停止
                 if current_label2 == new_label2:
-                    print(f"[{prefix}] Already has ID '{new_label2}' at frame {frame_idx}, stopping")
+                    logger.debug("%s: Already has ID '%s' at frame %s, stopping", prefix, new_label2, frame_idx)
                     break
                 
                 # label2を更新
-                print(f"[{prefix}] Found match at frame {frame_idx} with IOU {best_iou:.2f} (current ID: {current_label2})")
+                logger.debug("%s: Found match at frame %s with IOU %.2f (current ID: %s)",
+                             prefix, frame_idx, best_iou, current_label2)
                 shapes_data[best_match_idx] = self._update_shape_label2(shapes_data[best_match_idx], new_label2)
                 
                 # アノテーションを保存
-                if self._save_propagated_annotation_with_size(annotation_paths, shapes_data, next_file, image_size):
+                if self._save_propagated_annotation(annotation_paths, shapes_data, next_file, image_size):
                     
-                    # 次の反復用にprev_shapeを更新
-                    points = shapes_data[best_match_idx][1]
-                    prev_shape = Shape(label=shapes_data[best_match_idx][0])
-                    if hasattr(prev_shape, 'label2'):
-                        prev_shape.label2 = new_label2
-                    for x, y in points:
-                        prev_shape.add_point(QPointF(x, y))
-                    prev_shape.close()
+                    # 次の反復用にprev_bboxを更新
+                    prev_bbox = points_bbox(shapes_data[best_match_idx][1])
                     frames_processed += 1
                 else:
-                    print(f"[{prefix}] Failed to save annotation at frame {frame_idx}")
+                    logger.warning("%s: Failed to save annotation at frame %s", prefix, frame_idx)
                     break
             else:
-                print(f"[{prefix}] No matching shape found at frame {frame_idx}, stopping")
+                logger.debug("%s: No matching shape found at frame %s, stopping", prefix, frame_idx)
                 break
             
             frame_idx += 1
+        annotations.close()
+        # 間引きで反映されなかった最後のフレーム分を表示
+        progress.setValue(min(frame_idx - current_state['frame_idx'], progress.maximum()))
         
         progress.close()
         
         # 状態を復元
         self._restore_state(current_state)
         
-        print(f"[{prefix}] Propagated label2 to {frames_processed} subsequent frames")
+        logger.debug("%s: Propagated label2 to %s subsequent frames", prefix, frames_processed)
         return frames_processed
     
     def propagate_label_change(self, shape, new_label, old_label, is_label2=False):
@@ -4405,8 +4808,8 @@ class MainWindow(QMainWindow, WindowMixin):
         if not self.continuous_tracking_mode or not source_shape:
             return
         
-        print(f"[Propagate] Starting label propagation from frame {self.cur_img_idx}")
-        print(f"[Propagate] Will stop when encountering label: {source_shape.label}")
+        logger.debug("Starting label propagation from frame %s", self.cur_img_idx)
+        logger.debug("Will stop when encountering label: %s", source_shape.label)
         
         # Create progress dialog
         progress = self._create_progress_dialog()
@@ -4447,7 +4850,7 @@ class MainWindow(QMainWindow, WindowMixin):
     def _process_propagation(self, source_shape, progress, current_state, stop_label=None):
         """Process label propagation to subsequent frames."""
         source_label = source_shape.label
-        prev_shape = source_shape.copy()
+        prev_bbox = self._get_bbox_from_shape(source_shape)
         
         frame_idx = current_state['frame_idx'] + 1
         frames_processed = 0
@@ -4457,232 +4860,177 @@ class MainWindow(QMainWindow, WindowMixin):
         if hasattr(self, 'image') and self.image and not self.image.isNull():
             image_size = self.image.size()
         
-        while frame_idx < self.img_count:
+        last_ui_tick = 0.0
+        annotations = self._iter_annotation_shapes(frame_idx, image_size)
+        for next_file, annotation_paths, shapes_data in annotations:
+            # Update progress and pump events at most every PROGRESS_UPDATE_INTERVAL
+            now = time.monotonic()
+            if now - last_ui_tick >= PROGRESS_UPDATE_INTERVAL:
+                last_ui_tick = now
+                progress.setValue(frame_idx - current_state['frame_idx'])
+                progress.setLabelText(f"処理中: フレーム {frame_idx + 1}/{self.img_count}")
+                QApplication.processEvents()
+            
             # Check if cancelled
             if progress.wasCanceled():
-                print(f"[Propagate] Cancelled by user at frame {frame_idx}")
+                logger.debug("Cancelled by user at frame %s", frame_idx)
                 break
             
-            # Update progress
-            progress.setValue(frame_idx - current_state['frame_idx'])
-            progress.setLabelText(f"処理中: フレーム {frame_idx + 1}/{self.img_count}")
-            QApplication.processEvents()
-            # Load the next frame's annotation
-            next_file = self.m_img_list[frame_idx]
-            annotation_paths = self._get_annotation_paths(next_file)
-            shapes_data = self._load_annotation_shapes_with_size(annotation_paths, next_file, image_size)
-            
             if not shapes_data:
-                print(f"[Propagate] No annotation found at frame {frame_idx}, stopping")
+                logger.debug("No annotation found at frame %s, stopping", frame_idx)
                 break
             
             # Find matching shape in next frame
-            best_match_idx, best_iou = self._find_best_match(shapes_data, prev_shape)
+            best_match_idx, best_iou = self._find_best_match(shapes_data, prev_bbox)
             
             if best_match_idx >= 0:
                 # Check if the matched shape already has the same label (stop condition)
                 current_label = shapes_data[best_match_idx][0]
                 if stop_label and current_label == stop_label:
-                    print(f"[Propagate] Encountered same label '{stop_label}' at frame {frame_idx}, stopping")
+                    logger.debug("Encountered same label '%s' at frame %s, stopping", stop_label, frame_idx)
                     break
                 
                 # Update the matched shape's label
-                print(f"[Propagate] Found match at frame {frame_idx} with IOU {best_iou:.2f} (current label: {current_label})")
+                logger.debug("Found match at frame %s with IOU %.2f (current label: %s)", frame_idx, best_iou, current_label)
                 shapes_data[best_match_idx] = self._update_shape_label(shapes_data[best_match_idx], source_label)
                 
                 # Save the updated annotation
-                if self._save_propagated_annotation_with_size(annotation_paths, shapes_data, next_file, image_size):
-                    # Update prev_shape for next iteration
-                    # Directly update prev_shape points without creating all shapes
-                    points = shapes_data[best_match_idx][1]
-                    prev_shape = Shape(label=source_label)
-                    for x, y in points:
-                        prev_shape.add_point(QPointF(x, y))
-                    prev_shape.close()
+                if self._save_propagated_annotation(annotation_paths, shapes_data, next_file, image_size):
+                    # Track only the matched box for the next iteration
+                    prev_bbox = points_bbox(shapes_data[best_match_idx][1])
                     frames_processed += 1
                 else:
-                    print(f"[Propagate] Failed to save annotation at frame {frame_idx}")
+                    logger.warning("Failed to save annotation at frame %s", frame_idx)
                     break
                 
                 frame_idx += 1
             else:
-                print(f"[Propagate] No match found at frame {frame_idx}, stopping")
+                logger.debug("No match found at frame %s, stopping", frame_idx)
                 break
+        annotations.close()
+        # Show the frames the throttled updates skipped
+        progress.setValue(min(frame_idx - current_state['frame_idx'], progress.maximum()))
         
         return frames_processed
     
+    def _iter_annotation_shapes(self, frame_idx, image_size):
+        """Yield (next_file, annotation_paths, shapes_data) from frame_idx on.
+
+        Annotations of the following frames are parsed on worker threads
+        while the caller matches and saves the current one; closing the
+        generator cancels whatever has not started yet.
+        """
+        pending = deque(self.m_img_list[frame_idx:])
+        futures = deque()
+        with ThreadPoolExecutor(max_workers=READ_AHEAD_WORKERS) as pool:
+            def load(image_file):
+                annotation_paths = self._get_annotation_paths(image_file)
+                return image_file, annotation_paths, self._load_annotation_shapes_with_size(
+                    annotation_paths, image_file, image_size)
+            try:
+                while pending or futures:
+                    while pending and len(futures) < 2 * READ_AHEAD_WORKERS:
+                        futures.append(pool.submit(load, pending.popleft()))
+                    yield futures.popleft().result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
     def _get_annotation_paths(self, image_file):
-        """Get annotation file paths for given image file."""
-        basename = os.path.basename(os.path.splitext(image_file)[0])
-        
-        if self.default_save_dir:
-            base_path = self.default_save_dir
-        else:
-            base_path = os.path.dirname(image_file)
-        
-        return {
-            'xml': os.path.join(base_path, basename + XML_EXT),
-            'txt': os.path.join(base_path, basename + TXT_EXT),
-            'json': os.path.join(base_path, basename + JSON_EXT)
-        }
-    
-    def _load_annotation_shapes(self, annotation_paths, image_file):
-        """Load shapes from annotation file."""
-        # Try Pascal VOC format
-        if os.path.isfile(annotation_paths['xml']):
-            from libs.pascal_voc_io import PascalVocReader
-            reader = PascalVocReader(annotation_paths['xml'])
-            return reader.get_shapes()
-        
-        # Try YOLO format
-        elif os.path.isfile(annotation_paths['txt']):
-            if os.path.isfile(image_file):
-                image = QImage()
-                image.load(image_file)
-                if not image.isNull():
-                    from libs.yolo_io import YoloReader
-                    reader = YoloReader(annotation_paths['txt'], image)
-                    return reader.get_shapes()
-                else:
-                    print(f"[Propagate] Failed to load image: {image_file}")
-            else:
-                print(f"[Propagate] Image file not found: {image_file}")
-        
-        # Try CreateML format
-        elif os.path.isfile(annotation_paths['json']):
-            from libs.create_ml_io import CreateMLReader
-            reader = CreateMLReader(annotation_paths['json'], image_file)
-            return reader.get_shapes()
-        
-        return None
+        """Get annotation file paths for given image file (shared, do not modify)."""
+        return annotation_paths_for(image_file, self.default_save_dir)
     
     def _load_annotation_shapes_with_size(self, annotation_paths, image_file, image_size):
         """Load shapes from annotation file with pre-determined image size for YOLO."""
+        annotation_format = self._detect_annotation_format(annotation_paths)[0]
+        
         # Try Pascal VOC format
-        if os.path.isfile(annotation_paths['xml']):
+        if annotation_format == LabelFileFormat.PASCAL_VOC:
             from libs.pascal_voc_io import PascalVocReader
             reader = PascalVocReader(annotation_paths['xml'])
             return reader.get_shapes()
         
         # Try YOLO format with pre-determined size
-        elif os.path.isfile(annotation_paths['txt']):
+        elif annotation_format == LabelFileFormat.YOLO:
             if image_size and image_size.isValid():
-                # Create minimal QImage with the known size
-                minimal_image = QImage(image_size.width(), image_size.height(), QImage.Format_Mono)
                 from libs.yolo_io import YoloReader
-                reader = YoloReader(annotation_paths['txt'], minimal_image)
+                reader = YoloReader(annotation_paths['txt'], self._yolo_size_image(image_size))
                 return reader.get_shapes()
             else:
-                print(f"[Propagate] No valid image size available for YOLO format")
+                logger.warning("No valid image size available for YOLO format")
                 return None
         
         # Try CreateML format
-        elif os.path.isfile(annotation_paths['json']):
+        elif annotation_format == LabelFileFormat.CREATE_ML:
             from libs.create_ml_io import CreateMLReader
             reader = CreateMLReader(annotation_paths['json'], image_file)
             return reader.get_shapes()
         
         return None
     
-    def _load_annotation_shapes_with_cache(self, annotation_paths, image_file, image_cache):
-        """Load shapes from annotation file with image caching for YOLO."""
-        # Try Pascal VOC format
-        if os.path.isfile(annotation_paths['xml']):
-            from libs.pascal_voc_io import PascalVocReader
-            reader = PascalVocReader(annotation_paths['xml'])
-            return reader.get_shapes()
-        
-        # Try YOLO format with caching
-        elif os.path.isfile(annotation_paths['txt']):
-            if os.path.isfile(image_file):
-                # Check cache first
-                if image_file not in image_cache:
-                    image = QImage()
-                    image.load(image_file)
-                    if not image.isNull():
-                        image_cache[image_file] = image
-                    else:
-                        print(f"[Propagate] Failed to load image: {image_file}")
-                        return None
-                
-                if image_file in image_cache:
-                    from libs.yolo_io import YoloReader
-                    reader = YoloReader(annotation_paths['txt'], image_cache[image_file])
-                    return reader.get_shapes()
-            else:
-                print(f"[Propagate] Image file not found: {image_file}")
-        
-        # Try CreateML format
-        elif os.path.isfile(annotation_paths['json']):
-            from libs.create_ml_io import CreateMLReader
-            reader = CreateMLReader(annotation_paths['json'], image_file)
-            return reader.get_shapes()
-        
-        return None
+    def _yolo_size_image(self, image_size):
+        """Return a minimal QImage of image_size for the YOLO reader.
+
+        It only reads the dimensions, so one image is shared by every frame
+        of that size instead of decoding the real frame.
+        """
+        key = (image_size.width(), image_size.height())
+        minimal_image = self._yolo_size_images.get(key)
+        if minimal_image is None:
+            minimal_image = QImage(key[0], key[1], QImage.Format_Mono)
+            self._yolo_size_images[key] = minimal_image
+        return minimal_image
     
-    def _find_best_match(self, shapes_data, prev_shape):
-        """Find best matching shape using IOU."""
-        best_match_idx = -1
-        best_iou = 0.0
-        
-        # Early filtering based on bounding box size and position
-        prev_bbox = self._get_bbox_from_shape(prev_shape)
+    def _image_file_size(self, image_file):
+        """Return the size read() would give image_file, from its header only."""
+        reader = QImageReader(image_file)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if not size.isValid():
+            return None
+        if reader.transformation() & QImageIOHandler.TransformationRotate90:
+            size.transpose()
+        return size
+    
+    def _voc_size_image(self, image_file, image_size):
+        """Return a minimal QImage with the size and depth of image_file.
+
+        The first frame of each size and header format is decoded once to
+        tell whether it is grayscale, which the VOC writer records as the
+        image depth.
+        """
+        header_format = QImageReader(image_file).imageFormat()
+        key = (image_size.width(), image_size.height(), header_format)
+        minimal_image = self._voc_size_images.get(key)
+        if minimal_image is None:
+            frame = QImage(image_file)
+            grayscale = not frame.isNull() and frame.isGrayscale()
+            # isGrayscale() is answered from the format for both, Mono is
+            # never grayscale
+            image_format = QImage.Format_Grayscale8 if grayscale else QImage.Format_Mono
+            minimal_image = QImage(key[0], key[1], image_format)
+            # Indexed frames are grayscale only if their colour table is,
+            # which the header format does not tell
+            if header_format not in (QImage.Format_Invalid, QImage.Format_Indexed8):
+                self._voc_size_images[key] = minimal_image
+        return minimal_image
+    
+    def _find_best_match(self, shapes_data, prev_bbox):
+        """Find best matching shape using IOU against prev_bbox (x1, y1, x2, y2)."""
         if not prev_bbox:
             return -1, 0.0
         
-        px1, py1, px2, py2 = prev_bbox
-        prev_width = px2 - px1
-        prev_height = py2 - py1
-        prev_center_x = (px1 + px2) / 2
-        prev_center_y = (py1 + py2) / 2
-        
-        for idx, shape_data in enumerate(shapes_data):
-            # shape_data is (label, points, line_color, fill_color, difficult)
-            points = shape_data[1]
-            
-            # Quick rejection based on bounding box
-            if len(points) >= 4:
-                x_coords = [p[0] for p in points]
-                y_coords = [p[1] for p in points]
-                x1, y1 = min(x_coords), min(y_coords)
-                x2, y2 = max(x_coords), max(y_coords)
-                
-                # Check if size difference is too large (>50% difference)
-                curr_width = x2 - x1
-                curr_height = y2 - y1
-                if (abs(curr_width - prev_width) / prev_width > 0.5 or 
-                    abs(curr_height - prev_height) / prev_height > 0.5):
-                    continue
-                
-                # Check if center distance is too large
-                curr_center_x = (x1 + x2) / 2
-                curr_center_y = (y1 + y2) / 2
-                center_dist = ((curr_center_x - prev_center_x) ** 2 + 
-                              (curr_center_y - prev_center_y) ** 2) ** 0.5
-                if center_dist > max(prev_width, prev_height):
-                    continue
-            
-            # Only calculate IOU for candidates that pass quick checks
-            curr_shape = Shape()
-            for x, y in points:
-                curr_shape.add_point(QPointF(x, y))
-            
-            iou = self.tracker.calculate_iou(prev_shape, curr_shape)
-            if iou > best_iou and iou >= self.tracker.iou_threshold:
-                best_iou = iou
-                best_match_idx = idx
-        
-        return best_match_idx, best_iou
+        # shape_data is (label, points, line_color, fill_color, difficult)
+        boxes = [points_bbox(shape_data[1]) if len(shape_data[1]) >= 2 else None
+                 for shape_data in shapes_data]
+        return best_bbox_match(prev_bbox, boxes, self.tracker.iou_threshold)
     
     def _get_bbox_from_shape(self, shape):
         """Extract bounding box from shape."""
         if not hasattr(shape, 'points') or len(shape.points) < 2:
             return None
         
-        x_coords = [p.x() for p in shape.points]
-        y_coords = [p.y() for p in shape.points]
-        
-        return (min(x_coords), min(y_coords), max(x_coords), max(y_coords))
+        return points_bbox(shape.points)
     
     def _update_shape_label(self, shape_data, new_label):
         """Update shape data with new label."""
@@ -4700,230 +5048,79 @@ class MainWindow(QMainWindow, WindowMixin):
             # Add label2
             return (shape_data[0], shape_data[1], shape_data[2], shape_data[3], shape_data[4], new_label2)
     
-    def _create_shapes_from_data(self, shapes_data):
-        """Create Shape objects from shape data."""
-        shapes = []
-        for shape_data in shapes_data:
-            label, points, line_color, fill_color, difficult = shape_data
-            shape = Shape(label=label)
-            for x, y in points:
-                shape.add_point(QPointF(x, y))
-            shape.difficult = difficult
-            
-            if line_color:
-                shape.line_color = QColor(*line_color)
-            else:
-                shape.line_color = generate_color_by_text(label)
-            
-            if fill_color:
-                shape.fill_color = QColor(*fill_color)
-            else:
-                shape.fill_color = generate_color_by_text(label)
-            
-            shape.close()
-            shapes.append(shape)
-        return shapes
-    
-    def _save_propagated_annotation(self, annotation_paths, shapes_data, image_file):
-        """Save propagated annotation to file."""
-        # Determine which format to save
-        save_format = None
-        save_path = None
-        
-        if os.path.isfile(annotation_paths['xml']):
-            save_format = LabelFileFormat.PASCAL_VOC
-            save_path = annotation_paths['xml']
-        elif os.path.isfile(annotation_paths['txt']):
-            save_format = LabelFileFormat.YOLO
-            save_path = annotation_paths['txt']
-        elif os.path.isfile(annotation_paths['json']):
-            save_format = LabelFileFormat.CREATE_ML
-            save_path = annotation_paths['json']
-        
-        if not save_format or not save_path:
-            return False
-        
-        # Create shapes for saving
-        shapes = self._create_shapes_from_data(shapes_data)
-        shapes_for_save = [self._format_shape_for_save(s) for s in shapes]
-        
-        # Save using appropriate format
-        temp_label_file = LabelFile()
-        try:
-            if save_format == LabelFileFormat.PASCAL_VOC:
-                temp_label_file.save_pascal_voc_format(save_path, shapes_for_save, image_file, None,
-                                                      self.line_color.getRgb(), self.fill_color.getRgb())
-            elif save_format == LabelFileFormat.YOLO:
-                # For YOLO, we need the image
-                image_data = read(image_file, None)
-                if image_data:
-                    temp_label_file.save_yolo_format(save_path, shapes_for_save, image_file, image_data, 
-                                                   self.label_hist, self.line_color.getRgb(), self.fill_color.getRgb())
-                else:
-                    return False
-            elif save_format == LabelFileFormat.CREATE_ML:
-                temp_label_file.save_create_ml_format(save_path, shapes_for_save, image_file, None,
-                                                     self.label_hist, self.line_color.getRgb(), self.fill_color.getRgb())
-            
-            print(f"[Propagate] Saved updated annotation to {save_path}")
-            return True
-        except Exception as e:
-            print(f"[Propagate] Error saving annotation: {str(e)}")
-            return False
+    def _detect_annotation_format(self, annotation_paths):
+        """Return (format, path) of the existing annotation file, or (None, None).
+
+        Existence is looked up with has_annotation_file, so a frame usually
+        costs one stat of its directory instead of one per format.
+        """
+        dir_path = os.path.dirname(annotation_paths['xml'])
+        for save_format, key in ((LabelFileFormat.PASCAL_VOC, 'xml'),
+                                 (LabelFileFormat.YOLO, 'txt'),
+                                 (LabelFileFormat.CREATE_ML, 'json')):
+            path = annotation_paths[key]
+            if self.has_annotation_file(dir_path, os.path.basename(path)):
+                return save_format, path
+        return None, None
     
-    def _save_propagated_annotation_with_size(self, annotation_paths, shapes_data, image_file, image_size):
-        """Save propagated annotation to file with pre-determined image size."""
-        # Determine which format to save
-        save_format = None
-        save_path = None
-        
-        if os.path.isfile(annotation_paths['xml']):
-            save_format = LabelFileFormat.PASCAL_VOC
-            save_path = annotation_paths['xml']
-        elif os.path.isfile(annotation_paths['txt']):
-            save_format = LabelFileFormat.YOLO
-            save_path = annotation_paths['txt']
-        elif os.path.isfile(annotation_paths['json']):
-            save_format = LabelFileFormat.CREATE_ML
-            save_path = annotation_paths['json']
-        
-        if not save_format or not save_path:
-            return False
-        
-        # Create shapes for saving only once
-        shapes_for_save = []
-        for shape_data in shapes_data:
-            label, points, line_color, fill_color, difficult = shape_data
-            shapes_for_save.append({
+    def _shapes_for_save(self, shapes_data):
+        """Build LabelFile shape dicts from (label, points, line, fill, difficult) tuples."""
+        shapes = []
+        for label, points, line_color, fill_color, difficult in shapes_data:
+            shapes.append({
                 'label': label,
                 'points': points,
-                'line_color': line_color or generate_color_by_text(label).getRgb(),
-                'fill_color': fill_color or generate_color_by_text(label).getRgb(),
+                'line_color': line_color or rgba_by_text(label),
+                'fill_color': fill_color or rgba_by_text(label),
                 'difficult': difficult
             })
-        
-        # Save using appropriate format
-        temp_label_file = LabelFile()
-        try:
-            if save_format == LabelFileFormat.PASCAL_VOC:
-                temp_label_file.save_pascal_voc_format(save_path, shapes_for_save, image_file, None,
-                                                      self.line_color.getRgb(), self.fill_color.getRgb())
-            elif save_format == LabelFileFormat.YOLO:
-                # For YOLO, create minimal image data with known size
-                if image_size and image_size.isValid():
-                    # Create minimal image for YOLO format
-                    minimal_image = QImage(image_size.width(), image_size.height(), QImage.Format_Mono)
-                    buffer = QByteArray()
-                    buffer_io = QBuffer(buffer)
-                    buffer_io.open(QIODevice.WriteOnly)
-                    minimal_image.save(buffer_io, "PNG")
-                    image_data = buffer.data()
-                    
-                    temp_label_file.save_yolo_format(save_path, shapes_for_save, image_file, image_data, 
-                                                   self.label_hist, self.line_color.getRgb(), self.fill_color.getRgb())
-                else:
-                    print(f"[Propagate] Cannot save YOLO format without image size")
-                    return False
-            elif save_format == LabelFileFormat.CREATE_ML:
-                temp_label_file.save_create_ml_format(save_path, shapes_for_save, image_file, None,
-                                                     self.label_hist, self.line_color.getRgb(), self.fill_color.getRgb())
-            
-            return True
-        except Exception as e:
-            print(f"[Propagate] Error saving annotation: {str(e)}")
-            return False
+        return shapes
     
-    def _save_propagated_annotation_with_cache(self, annotation_paths, shapes_data, image_file, image_cache):
-        """Save propagated annotation to file with image cache."""
+    def _save_propagated_annotation(self, annotation_paths, shapes_data, image_file, image_size=None):
+        """Save propagated annotation to file.
+
+        The writers only need the frame size (and depth for VOC), which is
+        taken from image_size or else the image file header, so frames are
+        not decoded just to save them.
+        """
         # Determine which format to save
-        save_format = None
-        save_path = None
-        
-        if os.path.isfile(annotation_paths['xml']):
-            save_format = LabelFileFormat.PASCAL_VOC
-            save_path = annotation_paths['xml']
-        elif os.path.isfile(annotation_paths['txt']):
-            save_format = LabelFileFormat.YOLO
-            save_path = annotation_paths['txt']
-        elif os.path.isfile(annotation_paths['json']):
-            save_format = LabelFileFormat.CREATE_ML
-            save_path = annotation_paths['json']
-        
-        if not save_format or not save_path:
+        save_format, save_path = self._detect_annotation_format(annotation_paths)
+        if not save_format:
             return False
         
         # Create shapes for saving only once
-        shapes_for_save = []
-        for shape_data in shapes_data:
-            label, points, line_color, fill_color, difficult = shape_data
-            shapes_for_save.append({
-                'label': label,
-                'points': points,
-                'line_color': line_color or generate_color_by_text(label).getRgb(),
-                'fill_color': fill_color or generate_color_by_text(label).getRgb(),
-                'difficult': difficult
-            })
+        shapes_for_save = self._shapes_for_save(shapes_data)
+        
+        if image_size is None or not image_size.isValid():
+            image_size = self._image_file_size(image_file)
         
         # Save using appropriate format
-        temp_label_file = LabelFile()
+        temp_label_file = self._propagated_label_file
         try:
             if save_format == LabelFileFormat.PASCAL_VOC:
-                temp_label_file.save_pascal_voc_format(save_path, shapes_for_save, image_file, None,
+                image_data = None
+                if image_size is not None:
+                    image_data = self._voc_size_image(image_file, image_size)
+                temp_label_file.save_pascal_voc_format(save_path, shapes_for_save, image_file, image_data,
                                                       self.line_color.getRgb(), self.fill_color.getRgb())
             elif save_format == LabelFileFormat.YOLO:
-                # Use cached image if available
-                if image_file in image_cache:
-                    # Convert QImage to bytes for saving
-                    buffer = QByteArray()
-                    buffer_io = QBuffer(buffer)
-                    buffer_io.open(QIODevice.WriteOnly)
-                    image_cache[image_file].save(buffer_io, "PNG")
-                    image_data = buffer.data()
-                else:
-                    image_data = read(image_file, None)
-                
-                if image_data:
-                    temp_label_file.save_yolo_format(save_path, shapes_for_save, image_file, image_data, 
-                                                   self.label_hist, self.line_color.getRgb(), self.fill_color.getRgb())
-                else:
+                # For YOLO, pass the known size instead of any image
+                if image_size is None:
+                    logger.debug("Cannot save YOLO format without image size")
                     return False
+                temp_label_file.save_yolo_format(save_path, shapes_for_save, image_file, None,
+                                               self.label_hist, self.line_color.getRgb(), self.fill_color.getRgb(),
+                                               image_size=(image_size.width(), image_size.height()))
             elif save_format == LabelFileFormat.CREATE_ML:
                 temp_label_file.save_create_ml_format(save_path, shapes_for_save, image_file, None,
                                                      self.label_hist, self.line_color.getRgb(), self.fill_color.getRgb())
             
+            logger.debug("Saved updated annotation to %s", save_path)
             return True
         except Exception as e:
-            print(f"[Propagate] Error saving annotation: {str(e)}")
+            logger.error("Error saving annotation: %s", e)
             return False
     
-    def _format_shape_for_save(self, shape):
-        """Format shape object for saving."""
-        return dict(
-            label=shape.label,
-            line_color=shape.line_color.getRgb(),
-            fill_color=shape.fill_color.getRgb(),
-            points=[(p.x(), p.y()) for p in shape.points],
-            difficult=shape.difficult
-        )
-    
-    def _create_state_from_shapes_data(self, file_path, shapes_data):
-        """shapes_dataから状態オブジェクトを作成（フレームをロードせずに）"""
-        shapes = []
-        for shape_data in shapes_data:
-            label, points, line_color, fill_color, difficult = shape_data
-            shapes.append({
-                'label': label,
-                'points': points,
-                'line_color': line_color or generate_color_by_text(label).getRgb(),
-                'fill_color': fill_color or generate_color_by_text(label).getRgb(),
-                'difficult': difficult
-            })
-        
-        return {
-            'file_path': file_path,
-            'shapes': shapes
-        }
-    
     def _restore_state(self, state):
         """Restore application state."""
         self.cur_img_idx = state['frame_idx']
@@ -4932,7 +5129,7 @@ class MainWindow(QMainWindow, WindowMixin):
     
     def _show_completion_message(self, frames_processed):
         """Show completion message in status bar."""
-        print(f"[Propagate] Completed. Propagated to {frames_processed} frames")
+        logger.debug("Completed. Propagated to %s frames", frames_processed)
         
         if frames_processed > 0:
             self.statusBar().showMessage(f'連続ID付けが完了しました。{frames_processed}フレームに伝播しました。', 3000)
@@ -4943,11 +5140,12 @@ class MainWindow(QMainWindow, WindowMixin):
     def store_current_shapes(self):
         """Store current frame shapes for tracking."""
         if self.canvas.shapes:
-            self.prev_frame_shapes = [shape.copy() for shape in self.canvas.shapes]
-            print(f"[Store] Stored {len(self.prev_frame_shapes)} shapes from frame {self.cur_img_idx}")
+            # Tracking only reads labels and boxes, so no full copies are kept
+            self.prev_frame_shapes = [self.tracker.snapshot(shape) for shape in self.canvas.shapes]
+            logger.debug("Stored %s shapes from frame %s", len(self.prev_frame_shapes), self.cur_img_idx)
         else:
             self.prev_frame_shapes = []
-            print(f"[Store] No shapes to store from frame {self.cur_img_idx}")
+            logger.debug("No shapes to store from frame %s", self.cur_img_idx)
     
     def apply_tracking(self):
         """Apply tracking to current frame shapes."""
@@ -4962,38 +5160,32 @@ class MainWindow(QMainWindow, WindowMixin):
         if not curr_shapes:
             return
         
-        
-        # Debug: Print before tracking
-        print(f"[Tracking] Applying tracking to frame {self.cur_img_idx}")
-        print(f"[Tracking] Prev shapes: {[s.label for s in self.prev_frame_shapes]}")
-        print(f"[Tracking] Curr shapes before: {[s.label for s in curr_shapes]}")
+        # The label lists are only built when debug logging is on
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Applying tracking to frame %s", self.cur_img_idx)
+            logger.debug("Prev shapes: %s", [s.label for s in self.prev_frame_shapes])
+            logger.debug("Curr shapes before: %s", [s.label for s in curr_shapes])
         
         # Apply tracking
         self.tracker.track_shapes(self.prev_frame_shapes, curr_shapes)
         
-        # Debug: Print after tracking
-        print(f"[Tracking] Curr shapes after: {[s.label for s in curr_shapes]}")
+        if debug:
+            logger.debug("Curr shapes after: %s", [s.label for s in curr_shapes])
         
-        # Update colors for tracked shapes
-        for shape in curr_shapes:
-            if getattr(shape, 'is_tracked', False) and shape.label:
-                shape.line_color = generate_color_by_text(shape.label)
+        # Update colors for tracked shapes, one color per distinct label
+        tracked = [shape for shape in curr_shapes
+                   if getattr(shape, 'is_tracked', False) and shape.label]
+        color_map = {label: generate_color_by_text(label)
+                     for label in {shape.label for shape in tracked}}
+        for shape in tracked:
+            shape.line_color = color_map[shape.label]
         
         # Update canvas
         self.canvas.load_shapes(curr_shapes)
         
-        # Update label list properly
-        self.label_list.clear()
-        self.items_to_shapes.clear()
-        self.shapes_to_items.clear()
-        
-        for shape in curr_shapes:
-            # Ensure shape has proper paint_label setting
-            shape.paint_label = self.display_label_option.isChecked()
-            self.add_label(shape)
-        
-        # Update combo box
-        self.update_combo_box()
+        # Tracking mostly relabels existing shapes, so only changed items are touched
+        self.update_label_items(curr_shapes)
 
 def inverted(color):
     return QColor(*[255 - v for v in color.getRgb()])
@@ -5008,6 +5200,22 @@ def read(filename, default=None):
         return default
 
 
+@lru_cache(maxsize=16384)
+def annotation_paths_for(image_file, save_dir=None):
+    """Return the xml/txt/json annotation paths of image_file.
+
+    Propagation and duplication look these up for every frame they visit,
+    so the joined paths are computed once per (image, save dir).
+    """
+    basename = os.path.basename(os.path.splitext(image_file)[0])
+    base_path = save_dir if save_dir else os.path.dirname(image_file)
+    return {
+        'xml': os.path.join(base_path, basename + XML_EXT),
+        'txt': os.path.join(base_path, basename + TXT_EXT),
+        'json': os.path.join(base_path, basename + JSON_EXT)
+    }
+
+
 def get_main_app(argv=None):
     """
     Standard boilerplate Qt application code.
@@ -5041,6 +5249,13 @@ def get_main_app(argv=None):
 
 def main():
     """construct main app and run it"""
+    # LABELIMG_LOG_LEVEL=DEBUG shows the propagation and tracking logs
+    level_name = os.environ.get('LABELIMG_LOG_LEVEL', 'WARNING')
+    level = getattr(logging, level_name.strip().upper(), None)
+    logging.basicConfig(level=level if isinstance(level, int) else logging.WARNING,
+                        format='%(levelname)s %(name)s: %(message)s')
+    if not isinstance(level, int):
+        logger.warning("Unknown LABELIMG_LOG_LEVEL %r, using WARNING", level_name)
     app, _win = get_main_app(sys.argv)
     return app.exec_()
 
@@ -7,11 +7,15 @@ except ImportError:
     from PyQt4.QtGui import *
     from PyQt4.QtCore import *
 
+import logging
+
 # from PyQt4.QtOpenGL import *
 
 from libs.shape import Shape
 from libs.utils import distance
 
+logger = logging.getLogger(__name__)
+
 CURSOR_DEFAULT = Qt.ArrowCursor
 CURSOR_POINT = Qt.PointingHandCursor
 CURSOR_DRAW = Qt.CrossCursor
@@ -54,6 +58,9 @@ class Canvas(QWidget):
         self.overlay_color = None
         self.label_font_size = 8
         self.pixmap = QPixmap()
+        # Cached result of overlaid_pixmap() and the (pixmap, colour) it was built for
+        self._overlay_pixmap = None
+        self._overlay_key = None
         self.visible = {}
         self._hide_background = False
         self.hide_background = False
@@ -479,6 +486,23 @@ class Canvas(QWidget):
 
         return x, y, False
 
+    def snap_points_to_canvas(self, points):
+        """
+        Batch version of snap_point_to_canvas for a list of (x, y) points.
+        :return: (points, snapped) where snapped is True if any point was changed.
+        """
+        w = self.pixmap.width()
+        h = self.pixmap.height()
+        snapped = False
+        result = []
+        for x, y in points:
+            if x < 0 or x > w or y < 0 or y > h:
+                x = min(max(x, 0), w)
+                y = min(max(y, 0), h)
+                snapped = True
+            result.append((x, y))
+        return result, snapped
+
     def bounded_move_vertex(self, pos):
         index, shape = self.h_vertex, self.h_shape
         point = shape[index]
@@ -587,15 +611,7 @@ class Canvas(QWidget):
         p.scale(self.scale, self.scale)
         p.translate(self.offset_to_center())
 
-        temp = self.pixmap
-        if self.overlay_color:
-            temp = QPixmap(self.pixmap)
-            painter = QPainter(temp)
-            painter.setCompositionMode(painter.CompositionMode_Overlay)
-            painter.fillRect(temp.rect(), self.overlay_color)
-            painter.end()
-
-        p.drawPixmap(0, 0, temp)
+        p.drawPixmap(0, 0, self.overlaid_pixmap())
         Shape.scale = self.scale
         Shape.label_font_size = self.label_font_size
         for shape in self.shapes:
@@ -801,6 +817,22 @@ class Canvas(QWidget):
         self.drawingPolygon.emit(False)
         self.update()
 
+    def overlaid_pixmap(self):
+        """Return the pixmap with the brightness overlay applied, composing it
+        only when the pixmap or the overlay colour changed since last time."""
+        if not self.overlay_color:
+            return self.pixmap
+        key = (self.pixmap.cacheKey(), self.overlay_color.rgba())
+        if self._overlay_key != key:
+            temp = QPixmap(self.pixmap)
+            painter = QPainter(temp)
+            painter.setCompositionMode(painter.CompositionMode_Overlay)
+            painter.fillRect(temp.rect(), self.overlay_color)
+            painter.end()
+            self._overlay_pixmap = temp
+            self._overlay_key = key
+        return self._overlay_pixmap
+
     def load_pixmap(self, pixmap):
         self.pixmap = pixmap
         self.shapes = []
@@ -815,6 +847,12 @@ class Canvas(QWidget):
         self.visible[shape] = value
         self.repaint()
 
+    def set_shapes_visible(self, visibility):
+        """Apply several (shape, value) visibility changes with a single update."""
+        for shape, value in visibility:
+            self.visible[shape] = value
+        self.update()
+
     def current_cursor(self):
         cursor = QApplication.overrideCursor()
         if cursor is not None:
@@ -838,6 +876,8 @@ class Canvas(QWidget):
 
         self.restore_cursor()
         self.pixmap = None
+        self._overlay_pixmap = None
+        self._overlay_key = None
         self.update()
 
     def set_drawing_shape_to_square(self, status):
@@ -857,9 +897,9 @@ class Canvas(QWidget):
                     new_points
                 )
                 main_window.undo_manager.execute_command(move_cmd)
-                print(f"[DEBUG] Move command executed for shape at index {self.selected_shape_index}")
+                logger.debug("Move command executed for shape at index %s", self.selected_shape_index)
         except Exception as e:
-            print(f"[DEBUG] Error creating move command: {e}")
+            logger.error("Error creating move command: %s", e)
     
     def create_resize_command(self, old_points, new_points):
         """Create and execute a resize command through the main window"""
@@ -875,6 +915,6 @@ class Canvas(QWidget):
                     new_points
                 )
                 main_window.undo_manager.execute_command(resize_cmd)
-                print(f"[DEBUG] Resize command executed for shape at index {self.selected_shape_index}")
+                logger.debug("Resize command executed for shape at index %s", self.selected_shape_index)
         except Exception as e:
-            print(f"[DEBUG] Error creating resize command: {e}")
+            logger.error("Error creating resize command: %s", e)
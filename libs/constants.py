@@ -18,3 +18,9 @@ FORMAT_CREATEML='CreateML'
 SETTING_DRAW_SQUARE = 'draw/square'
 SETTING_LABEL_FILE_FORMAT= 'labelFileFormat'
 DEFAULT_ENCODING = 'utf-8'
+EXISTS_CACHE_TTL = 2.0  # seconds a recent file existence check stays valid
+PRELOAD_AHEAD = 2  # frames decoded in the background after the current one
+PRELOAD_CACHE_SIZE = 4  # decoded frames kept for load_file
+SCAN_WORKERS = 8  # threads scanning subfolders in scan_all_images
+READ_AHEAD_WORKERS = 4  # threads decoding frames ahead of a batch operation
+PROGRESS_UPDATE_INTERVAL = 0.05  # seconds between progress dialog refreshes in batch loops
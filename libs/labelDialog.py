@@ -21,10 +21,10 @@ class LabelDialog(QDialog):
         self.edit.setValidator(label_validator())
         self.edit.editingFinished.connect(self.post_process)
 
-        model = QStringListModel()
-        model.setStringList(list_item)
+        self.model = QStringListModel()
+        self.model.setStringList(list_item)
         completer = QCompleter()
-        completer.setModel(model)
+        completer.setModel(self.model)
         self.edit.setCompleter(completer)
 
         self.button_box = bb = BB(BB.Ok | BB.Cancel, Qt.Horizontal, self)
@@ -37,15 +37,23 @@ class LabelDialog(QDialog):
         layout.addWidget(bb, alignment=Qt.AlignmentFlag.AlignLeft)
         layout.addWidget(self.edit)
 
-        if list_item is not None and len(list_item) > 0:
+        self.list_widget = None
+        self.setLayout(layout)
+        self.set_items(list_item)
+
+    def set_items(self, list_item):
+        """Refresh the completer and the label list without rebuilding the dialog."""
+        list_item = list(list_item) if list_item is not None else []
+        self.model.setStringList(list_item)
+        if self.list_widget is None:
+            if not list_item:
+                return
             self.list_widget = QListWidget(self)
-            for item in list_item:
-                self.list_widget.addItem(item)
             self.list_widget.itemClicked.connect(self.list_item_click)
             self.list_widget.itemDoubleClicked.connect(self.list_item_double_click)
-            layout.addWidget(self.list_widget)
-
-        self.setLayout(layout)
+            self.layout().addWidget(self.list_widget)
+        self.list_widget.clear()
+        self.list_widget.addItems(list_item)
 
     def validate(self):
         if trimmed(self.edit.text()):
@@ -82,20 +82,25 @@ class LabelFile(object):
         return
 
     def save_yolo_format(self, filename, shapes, image_path, image_data, class_list,
-                         line_color=None, fill_color=None, database_src=None, class_list2=None):
+                         line_color=None, fill_color=None, database_src=None, class_list2=None,
+                         image_size=None):
         img_folder_path = os.path.dirname(image_path)
         img_folder_name = os.path.split(img_folder_path)[-1]
         img_file_name = os.path.basename(image_path)
         # imgFileNameWithoutExt = os.path.splitext(img_file_name)[0]
-        # Read from file path because self.imageData might be empty if saving to
-        # Pascal format
-        if isinstance(image_data, QImage):
-            image = image_data
+        if image_size is not None:
+            # YOLO coordinates only need (width, height); no image is touched
+            image_shape = [image_size[1], image_size[0], 3]
         else:
-            image = QImage()
-            image.load(image_path)
-        image_shape = [image.height(), image.width(),
-                       1 if image.isGrayscale() else 3]
+            # Read from file path because self.imageData might be empty if saving to
+            # Pascal format
+            if isinstance(image_data, QImage):
+                image = image_data
+            else:
+                image = QImage()
+                image.load(image_path)
+            image_shape = [image.height(), image.width(),
+                           1 if image.isGrayscale() else 3]
         writer = YOLOWriter(img_folder_name, img_file_name,
                             image_shape, local_img_path=image_path)
         writer.verified = self.verified
@@ -5,13 +5,17 @@ Quick ID Selector - フローティングID選択ウィンドウ
 動物のIDを素早く切り替えるためのフローティングツールバー
 """
 
+import logging
+
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QGridLayout, QPushButton, QSizePolicy,
     QLabel, QWidget, QFrame, QTabWidget
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QPoint
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QKeyEvent
 
+logger = logging.getLogger(__name__)
+
 
 class QuickIDSelector(QDialog):
     """
@@ -40,6 +44,66 @@ class QuickIDSelector(QDialog):
         font-weight: bold;
     """
     
+    # 選択中ボタンのルール（selectedプロパティで切り替え、ダイアログ全体で一度だけ解析）
+    SELECTED_BUTTON_QSS = f'#idButton[selected="true"] {{ {SELECTED_BUTTON_STYLE} }}'
+    
+    # 不足・重複ラベル表示のスタイル
+    MISSING_LABELS_STYLE = """
+        QLabel {
+            background-color: rgba(255, 255, 200, 180);
+            border: 1px solid #ccc;
+            border-radius: 4px;
+            padding: 4px;
+            color: #333;
+            min-height: 25px;
+        }
+    """
+    
+    MISSING_LABELS_FOUND_STYLE = """
+        QLabel {
+            background-color: rgba(255, 220, 200, 180);
+            border: 1px solid #f88;
+            border-radius: 4px;
+            padding: 4px;
+            color: #800;
+            min-height: 25px;
+        }
+    """
+    
+    MISSING_LABELS_NONE_STYLE = """
+        QLabel {
+            background-color: rgba(200, 255, 200, 180);
+            border: 1px solid #8f8;
+            border-radius: 4px;
+            padding: 4px;
+            color: #080;
+            min-height: 25px;
+        }
+    """
+    
+    DUPLICATE_LABELS_FOUND_STYLE = """
+        QLabel {
+            background-color: rgba(255, 200, 200, 180);
+            border: 1px solid #f66;
+            border-radius: 4px;
+            padding: 4px;
+            color: #800;
+            min-height: 25px;
+            font-weight: bold;
+        }
+    """
+    
+    DUPLICATE_LABELS_NONE_STYLE = """
+        QLabel {
+            background-color: rgba(200, 200, 255, 180);
+            border: 1px solid #aac;
+            border-radius: 4px;
+            padding: 4px;
+            color: #333;
+            min-height: 25px;
+        }
+    """
+    
     DIALOG_STYLE = """
         QDialog {
             background-color: rgba(240, 240, 240, 230);
@@ -82,38 +146,44 @@ class QuickIDSelector(QDialog):
         
         self.parent_window = parent
         self.max_ids = max_ids
-        self.current_id = self.DEFAULT_ID
+        self.current_id = int(self.DEFAULT_ID)  # IDは内部では整数で保持
         self.current_label1 = self.DEFAULT_ID
         self.current_label2 = "ID-001"
-        self.id_buttons = {}
         self.label1_buttons = {}
         self.label2_buttons = {}
-        self.class_names = self._get_class_names()
-        self.class_names1 = self._get_class_names1()
-        self.class_names2 = self._get_class_names2()
+        self.class_names, self.class_names1, self.class_names2 = self._load_class_names()
+        # 不足ラベル表示用：クラス名の並び順と集合（毎回作り直さない）
+        self._class_name_order = {}
+        for i, name in enumerate(self.class_names):
+            self._class_name_order.setdefault(name, i)
+        self._class_name_set = frozenset(self.class_names)
+        # 前回表示したフレームのラベル（同じなら表示を作り直さない）
+        self._last_labels_key = None
         self.current_tab = 0  # 0: Label1, 1: Label2
         
         self._setup_window()
-        self._setup_ui()
+        # スタイルを先に設定してボタンは作成後に一度だけ整形させ、
+        # 構築中は再描画しない
         self._apply_styles()
+        self.setUpdatesEnabled(False)
+        try:
+            self._setup_ui()
+        finally:
+            self.setUpdatesEnabled(True)
     
-    def _get_class_names(self):
-        """親ウィンドウからクラス名リストを取得"""
-        if self.parent_window and hasattr(self.parent_window, 'label_hist'):
-            return self.parent_window.label_hist[:self.max_ids]
-        return []
-    
-    def _get_class_names1(self):
-        """親ウィンドウからLabel1用クラス名リストを取得"""
-        if self.parent_window and hasattr(self.parent_window, 'label1_hist'):
-            return self.parent_window.label1_hist[:self.max_ids]
-        return self._get_class_names()
-    
-    def _get_class_names2(self):
-        """親ウィンドウからLabel2用クラス名リストを取得"""
-        if self.parent_window and hasattr(self.parent_window, 'label2_hist'):
-            return self.parent_window.label2_hist[:self.max_ids]
-        return []
+    def _load_class_names(self):
+        """
+        親ウィンドウからクラス名リストを取得
+        
+        Returns:
+            (全体, Label1用, Label2用) のクラス名リスト。Label1用がなければ全体を使う
+        """
+        parent = self.parent_window
+        class_names = getattr(parent, 'label_hist', [])[:self.max_ids]
+        label1_hist = getattr(parent, 'label1_hist', None)
+        class_names1 = label1_hist[:self.max_ids] if label1_hist is not None else class_names
+        class_names2 = getattr(parent, 'label2_hist', [])[:self.max_ids]
+        return class_names, class_names1, class_names2
     
     def _setup_window(self):
         """ウィンドウの基本設定"""
@@ -158,13 +228,12 @@ class QuickIDSelector(QDialog):
         label1_widget.setLayout(label1_layout)
         self.tab_widget.addTab(label1_widget, "Label 1")
         
-        # Label2タブ
+        # Label2タブ（ボタンは初めて開かれた時に作成）
         label2_widget = QWidget()
-        label2_layout = QVBoxLayout()
-        label2_grid = self._create_id_grid_for_label2()
-        label2_layout.addLayout(label2_grid)
-        label2_widget.setLayout(label2_layout)
+        self._label2_layout = QVBoxLayout()
+        label2_widget.setLayout(self._label2_layout)
         self.tab_widget.addTab(label2_widget, "Label 2")
+        self._label2_built = False
         
         # タブ切り替えシグナル
         self.tab_widget.currentChanged.connect(self._on_tab_changed)
@@ -190,16 +259,7 @@ class QuickIDSelector(QDialog):
         
         self.missing_labels_text = QLabel("なし")
         self.missing_labels_text.setWordWrap(True)
-        self.missing_labels_text.setStyleSheet("""
-            QLabel {
-                background-color: rgba(255, 255, 200, 180);
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                padding: 4px;
-                color: #333;
-                min-height: 25px;
-            }
-        """)
+        self.missing_labels_text.setStyleSheet(self.MISSING_LABELS_STYLE)
         layout.addWidget(self.missing_labels_text)
         
         # 重複ラベル
@@ -209,16 +269,8 @@ class QuickIDSelector(QDialog):
         
         self.duplicate_labels_text = QLabel("なし")
         self.duplicate_labels_text.setWordWrap(True)
-        self.duplicate_labels_text.setStyleSheet("""
-            QLabel {
-                background-color: rgba(200, 200, 255, 180);
-                border: 1px solid #aac;
-                border-radius: 4px;
-                padding: 4px;
-                color: #333;
-                min-height: 25px;
-            }
-        """)
+        self.duplicate_labels_text.setStyleSheet(self.DUPLICATE_LABELS_NONE_STYLE)
+        self.duplicate_labels_text.setProperty("qss_state", "nodup")
         layout.addWidget(self.duplicate_labels_text)
         
         widget.setLayout(layout)
@@ -232,9 +284,10 @@ class QuickIDSelector(QDialog):
         # ボタン作成範囲を決定
         button_count = min(self.max_ids, max(len(self.class_names1), 1))
         
+        columns = self.MAX_COLUMNS
         for i in range(button_count):
             button = self._create_label1_button(i)
-            row, col = self._calculate_grid_position(i + 1)
+            row, col = divmod(i, columns)
             grid_layout.addWidget(button, row, col)
         
         return grid_layout
@@ -247,9 +300,10 @@ class QuickIDSelector(QDialog):
         # ボタン作成範囲を決定
         button_count = min(self.max_ids, max(len(self.class_names2), 1))
         
+        columns = self.MAX_COLUMNS
         for i in range(button_count):
             button = self._create_label2_button(i)
-            row, col = self._calculate_grid_position(i + 1)
+            row, col = divmod(i, columns)
             grid_layout.addWidget(button, row, col)
         
         return grid_layout
@@ -279,9 +333,11 @@ class QuickIDSelector(QDialog):
         button.setMinimumSize(self.BUTTON_MIN_WIDTH, self.BUTTON_MIN_HEIGHT)
         button.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         button.setToolTip(tooltip)
+        button.setProperty("selected", False)
+        button.setProperty("class_name", class_name)
         
-        # クリックイベント接続
-        button.clicked.connect(lambda checked, cn=class_name: self.select_label1(cn))
+        # クリックイベント接続（全ボタンで1つのスロットを共有）
+        button.clicked.connect(self._on_label1_button_clicked)
         
         # ボタンを辞書に保存
         self.label1_buttons[class_name] = button
@@ -313,9 +369,11 @@ class QuickIDSelector(QDialog):
         button.setMinimumSize(self.BUTTON_MIN_WIDTH, self.BUTTON_MIN_HEIGHT)
         button.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         button.setToolTip(tooltip)
+        button.setProperty("selected", False)
+        button.setProperty("class_name", class_name)
         
-        # クリックイベント接続
-        button.clicked.connect(lambda checked, cn=class_name: self.select_label2(cn))
+        # クリックイベント接続（全ボタンで1つのスロットを共有）
+        button.clicked.connect(self._on_label2_button_clicked)
         
         # ボタンを辞書に保存
         self.label2_buttons[class_name] = button
@@ -334,31 +392,58 @@ class QuickIDSelector(QDialog):
             return f"{base_text} (キー: {index})"
         return base_text
     
-    def _calculate_grid_position(self, index):
-        """グリッド内の位置を計算"""
-        row = (index - 1) // self.MAX_COLUMNS
-        col = (index - 1) % self.MAX_COLUMNS
-        return row, col
-    
     def _apply_styles(self):
         """スタイルシートを適用"""
-        self.setStyleSheet(self.DIALOG_STYLE)
+        # 選択ルールはhover/pressedより後に置いて優先させる
+        self.setStyleSheet(self.DIALOG_STYLE + self.SELECTED_BUTTON_QSS)
     
     def _update_button_states(self):
-        """全ボタンの表示状態を更新"""
-        # Label1ボタンの状態更新
-        for class_name, button in self.label1_buttons.items():
-            if class_name == self.current_label1:
-                button.setStyleSheet(f"#idButton {{ {self.SELECTED_BUTTON_STYLE} }}")
-            else:
-                button.setStyleSheet("")
+        """全ボタンの表示状態を更新（選択状態が変わるボタンだけ再設定）"""
+        for buttons, current in ((self.label1_buttons, self.current_label1),
+                                 (self.label2_buttons, self.current_label2)):
+            for class_name, button in buttons.items():
+                self._set_selected(button, class_name == current)
+    
+    @staticmethod
+    def _set_selected(button, selected):
+        """selectedプロパティを切り替えてボタンのスタイルを再適用"""
+        if button.property("selected") == selected:
+            return
+        button.setProperty("selected", selected)
+        style = button.style()
+        style.unpolish(button)
+        style.polish(button)
+    
+    @staticmethod
+    def _set_label(label, text, state, style):
+        """
+        表示ラベルのテキストとスタイルを変わった時だけ設定
         
-        # Label2ボタンの状態更新
-        for class_name, button in self.label2_buttons.items():
-            if class_name == self.current_label2:
-                button.setStyleSheet(f"#idButton {{ {self.SELECTED_BUTTON_STYLE} }}")
-            else:
-                button.setStyleSheet("")
+        Args:
+            label: 設定するQLabel
+            text: 表示テキスト
+            state: スタイルの状態名（同じならスタイルを再解析しない）
+            style: stateに対応するスタイルシート
+        """
+        if label.text() != text:
+            label.setText(text)
+        if label.property("qss_state") != state:
+            label.setStyleSheet(style)
+            label.setProperty("qss_state", state)
+    
+    def _move_selection(self, buttons, old_name, new_name):
+        """選択が変わった2つのボタンだけスタイルを更新"""
+        if old_name in buttons:
+            self._set_selected(buttons[old_name], False)
+        self._set_selected(buttons[new_name], True)
+    
+    def _on_label1_button_clicked(self):
+        """Label1ボタンのクリック（押されたボタンのクラス名で選択）"""
+        self.select_label1(self.sender().property("class_name"))
+    
+    def _on_label2_button_clicked(self):
+        """Label2ボタンのクリック（押されたボタンのクラス名で選択）"""
+        self.select_label2(self.sender().property("class_name"))
     
     def select_label1(self, class_name):
         """
@@ -368,10 +453,10 @@ class QuickIDSelector(QDialog):
             class_name: 選択するクラス名
         """
         if class_name != self.current_label1 and class_name in self.label1_buttons:
+            self._move_selection(self.label1_buttons, self.current_label1, class_name)
             self.current_label1 = class_name
-            self._update_button_states()
             self.label1_selected.emit(class_name)
-            print(f"[QuickID] Label1 選択: {class_name}")
+            logger.debug("Label1 選択: %s", class_name)
     
     def select_label2(self, class_name):
         """
@@ -380,15 +465,25 @@ class QuickIDSelector(QDialog):
         Args:
             class_name: 選択するクラス名
         """
+        self._build_label2_grid()
         if class_name != self.current_label2 and class_name in self.label2_buttons:
+            self._move_selection(self.label2_buttons, self.current_label2, class_name)
             self.current_label2 = class_name
-            self._update_button_states()
             self.label2_selected.emit(class_name)
-            print(f"[QuickID] Label2 選択: {class_name}")
+            logger.debug("Label2 選択: %s", class_name)
     
     def _on_tab_changed(self, index):
         """タブが切り替わった時の処理"""
         self.current_tab = index
+        if index == 1:
+            self._build_label2_grid()
+    
+    def _build_label2_grid(self):
+        """Label2タブのボタンを未作成なら作成"""
+        if self._label2_built:
+            return
+        self._label2_built = True
+        self._label2_layout.addLayout(self._create_id_grid_for_label2())
         self._update_button_states()
     
     def set_current_id(self, id_str):
@@ -398,33 +493,35 @@ class QuickIDSelector(QDialog):
         Args:
             id_str: 設定するID文字列
         """
-        if id_str in self.id_buttons and id_str != self.current_id:
-            self.current_id = id_str
-            self._update_button_states()
+        try:
+            id_num = int(id_str)
+        except ValueError:
+            return
+        if 1 <= id_num <= self.max_ids:
+            self.current_id = id_num
     
     def get_current_id(self):
         """現在選択中のIDを取得"""
-        return self.current_id
+        return str(self.current_id)
+    
+    def select_id(self, id_num):
+        """
+        IDを選択して信号を発信
+        
+        Args:
+            id_num: 選択するID（整数）
+        """
+        if id_num != self.current_id:
+            self.current_id = id_num
+            self.id_selected.emit(str(id_num))
     
     def next_id(self):
         """次のIDに切り替え"""
-        try:
-            current_num = int(self.current_id)
-            next_num = current_num + 1 if current_num < self.max_ids else 1
-            self.select_id(str(next_num))
-        except ValueError:
-            # 数値でないIDの場合は無視
-            pass
+        self.select_id(self.current_id % self.max_ids + 1)
     
     def prev_id(self):
         """前のIDに切り替え"""
-        try:
-            current_num = int(self.current_id)
-            prev_num = current_num - 1 if current_num > 1 else self.max_ids
-            self.select_id(str(prev_num))
-        except ValueError:
-            # 数値でないIDの場合は無視
-            pass
+        self.select_id((self.current_id - 2) % self.max_ids + 1)
     
     def keyPressEvent(self, event: QKeyEvent):
         """
@@ -439,13 +536,13 @@ class QuickIDSelector(QDialog):
         if Qt.Key_1 <= key <= Qt.Key_9:
             id_num = key - Qt.Key_0
             if id_num <= self.max_ids:
-                self.select_id(str(id_num))
+                self.select_id(id_num)
                 return
         
         # 0キーで10を選択
         elif key == Qt.Key_0:
             if 10 <= self.max_ids:
-                self.select_id("10")
+                self.select_id(10)
                 return
         
         # Escapeで閉じる
@@ -471,44 +568,31 @@ class QuickIDSelector(QDialog):
             # 親ウィンドウから現在のフレームのラベルを取得
             current_frame_labels = self._get_current_frame_labels()
         
-        # 不足しているラベルを検出
-        existing_labels = set(current_frame_labels) if current_frame_labels else set()
-        all_labels = set(self.class_names)
-        missing_labels = all_labels - existing_labels
+        key = tuple(current_frame_labels) if current_frame_labels else ()
+        if key == self._last_labels_key:
+            return
+        self._last_labels_key = key
+        
+        # 存在ラベルと重複ラベルを1回の走査で集め、不足ラベルを検出
+        existing_labels = set()
+        duplicate_labels = {}
+        for label in current_frame_labels or ():
+            if label in existing_labels:
+                duplicate_labels[label] = duplicate_labels.get(label, 1) + 1
+            else:
+                existing_labels.add(label)
+        missing_labels = self._class_name_set - existing_labels
         
         # 不足ラベルの表示
         if missing_labels:
             # 不足ラベルをソートして表示（ラベル名のみ）
-            sorted_missing = sorted(missing_labels, key=lambda x: self.class_names.index(x))
+            sorted_missing = sorted(missing_labels, key=self._class_name_order.__getitem__)
             display_text = ", ".join(sorted_missing)
-            self.missing_labels_text.setText(display_text)
-            self.missing_labels_text.setStyleSheet("""
-                QLabel {
-                    background-color: rgba(255, 220, 200, 180);
-                    border: 1px solid #f88;
-                    border-radius: 4px;
-                    padding: 4px;
-                    color: #800;
-                    min-height: 25px;
-                }
-            """)
+            self._set_label(self.missing_labels_text, display_text,
+                            "missing", self.MISSING_LABELS_FOUND_STYLE)
         else:
-            self.missing_labels_text.setText("すべて存在")
-            self.missing_labels_text.setStyleSheet("""
-                QLabel {
-                    background-color: rgba(200, 255, 200, 180);
-                    border: 1px solid #8f8;
-                    border-radius: 4px;
-                    padding: 4px;
-                    color: #080;
-                    min-height: 25px;
-                }
-            """)
-        
-        # 重複しているラベルを検出
-        from collections import Counter
-        label_counts = Counter(current_frame_labels) if current_frame_labels else Counter()
-        duplicate_labels = {label: count for label, count in label_counts.items() if count > 1}
+            self._set_label(self.missing_labels_text, "すべて存在",
+                            "ok", self.MISSING_LABELS_NONE_STYLE)
         
         # 重複ラベルの表示
         if duplicate_labels:
@@ -517,30 +601,11 @@ class QuickIDSelector(QDialog):
             for label, count in sorted(duplicate_labels.items()):
                 duplicate_items.append(f"{label}({count})")
             display_text = ", ".join(duplicate_items)
-            self.duplicate_labels_text.setText(display_text)
-            self.duplicate_labels_text.setStyleSheet("""
-                QLabel {
-                    background-color: rgba(255, 200, 200, 180);
-                    border: 1px solid #f66;
-                    border-radius: 4px;
-                    padding: 4px;
-                    color: #800;
-                    min-height: 25px;
-                    font-weight: bold;
-                }
-            """)
+            self._set_label(self.duplicate_labels_text, display_text,
+                            "dup", self.DUPLICATE_LABELS_FOUND_STYLE)
         else:
-            self.duplicate_labels_text.setText("なし")
-            self.duplicate_labels_text.setStyleSheet("""
-                QLabel {
-                    background-color: rgba(200, 200, 255, 180);
-                    border: 1px solid #aac;
-                    border-radius: 4px;
-                    padding: 4px;
-                    color: #333;
-                    min-height: 25px;
-                }
-            """)
+            self._set_label(self.duplicate_labels_text, "なし",
+                            "nodup", self.DUPLICATE_LABELS_NONE_STYLE)
     
     def _get_current_frame_labels(self):
         """親ウィンドウから現在のフレームのラベルを取得"""
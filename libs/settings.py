@@ -8,6 +8,8 @@ class Settings(object):
         home = os.path.expanduser("~")
         self.data = {}
         self.path = os.path.join(home, '.labelImgSettings.pkl')
+        # Pickled bytes last read from or written to self.path
+        self._saved = None
 
     def __setitem__(self, key, value):
         self.data[key] = value
@@ -22,17 +24,23 @@ class Settings(object):
 
     def save(self):
         if self.path:
-            with open(self.path, 'wb') as f:
-                pickle.dump(self.data, f, pickle.HIGHEST_PROTOCOL)
-                return True
+            data = pickle.dumps(self.data, pickle.HIGHEST_PROTOCOL)
+            # Skip rewriting the file when no setting changed
+            if data != self._saved or not os.path.exists(self.path):
+                with open(self.path, 'wb') as f:
+                    f.write(data)
+                self._saved = data
+            return True
         return False
 
     def load(self):
         try:
             if os.path.exists(self.path):
                 with open(self.path, 'rb') as f:
-                    self.data = pickle.load(f)
-                    return True
+                    saved = f.read()
+                self.data = pickle.loads(saved)
+                self._saved = saved
+                return True
         except:
             print('Loading setting failed')
         return False
@@ -43,3 +51,4 @@ class Settings(object):
             print('Remove setting pkl file ${0}'.format(self.path))
         self.data = {}
         self.path = None
+        self._saved = None
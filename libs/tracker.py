@@ -5,6 +5,13 @@ Continuous tracking module for labelImg.
 Provides IOU calculation utilities for shape matching.
 """
 
+from collections import namedtuple
+
+
+# What tracking reads of a previous frame shape; bbox is (x1, y1, x2, y2)
+# or None when the shape has fewer than two points
+ShapeSnapshot = namedtuple('ShapeSnapshot', ['label', 'bbox', 'track_id'])
+
 
 class Tracker:
     """
@@ -61,16 +68,31 @@ class Tracker:
         
         return intersection / union if union > 0 else 0.0
     
+    def snapshot(self, shape):
+        """
+        Take a lightweight snapshot of a shape for use as a previous frame shape.
+        
+        Args:
+            shape: Shape object with points attribute
+            
+        Returns:
+            ShapeSnapshot: label, bounding box and track id of the shape
+        """
+        return ShapeSnapshot(shape.label, self._get_bbox_from_shape(shape),
+                             getattr(shape, 'track_id', None))
+    
     def _get_bbox_from_shape(self, shape):
         """
         Extract bounding box coordinates from shape points.
         
         Args:
-            shape: Shape object with points attribute
+            shape: Shape object with points attribute, or a ShapeSnapshot
             
         Returns:
             tuple: (x1, y1, x2, y2) or None if shape has no points
         """
+        if isinstance(shape, ShapeSnapshot):
+            return shape.bbox
         if not hasattr(shape, 'points') or len(shape.points) < 2:
             return None
         
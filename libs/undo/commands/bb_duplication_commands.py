@@ -7,17 +7,27 @@ BB duplication commands with IOU checking for Undo/Redo system
 from typing import Any, List, Optional, Dict
 import logging
 import copy
+from itertools import starmap
 from ..command import Command
 from .shape_commands import AddShapeCommand
 
 logger = logging.getLogger(__name__)
 
 
+def is_same_shape(shape, shape_data: dict) -> bool:
+    """Check whether shape already matches the shape described by shape_data"""
+    return (shape.label == shape_data.get('label', '') and
+            getattr(shape, 'label2', None) == shape_data.get('label2') and
+            getattr(shape, 'difficult', False) == shape_data.get('difficult', False) and
+            [(p.x(), p.y()) for p in shape.points] == [tuple(p) for p in shape_data.get('points', [])])
+
+
 class AddShapeWithIOUCheckCommand(AddShapeCommand):
     """Command to add shape with IOU overlap checking"""
     
     def __init__(self, frame_path: str, shape_data: dict, 
-                 iou_threshold: float = 0.5, overwrite_mode: bool = False):
+                 iou_threshold: float = 0.5, overwrite_mode: bool = False,
+                 copy_data: bool = True):
         """
         Initialize AddShapeWithIOUCheckCommand
         
@@ -26,8 +36,9 @@ class AddShapeWithIOUCheckCommand(AddShapeCommand):
             shape_data: Dictionary containing shape properties
             iou_threshold: IOU threshold for overlap detection
             overwrite_mode: If True, overwrite overlapping shapes; if False, skip
+            copy_data: If False, share shape_data instead of copying it
         """
-        super().__init__(frame_path, shape_data)
+        super().__init__(frame_path, shape_data, copy_data)
         self.iou_threshold = iou_threshold
         self.overwrite_mode = overwrite_mode
         self.removed_shapes = []  # Store shapes that were removed due to overlap
@@ -98,21 +109,28 @@ class AddShapeWithIOUCheckCommand(AddShapeCommand):
                     existing_points = [(p.x(), p.y()) for p in existing_shape.points]
                     iou = self.calculate_iou(new_points, existing_points)
                     
-                    logger.debug(f"[BB Duplication] Checking IOU with existing shape: {iou:.3f}")
+                    logger.debug("Checking IOU with existing shape: %.3f", iou)
                     
                     if iou >= self.iou_threshold:
                         if self.overwrite_mode:
                             # Mark shape for removal
                             shapes_to_remove.append(existing_shape)
-                            logger.debug(f"[BB Duplication] Overwriting existing BB (IOU={iou:.2f})")
-                            print(f"[DEBUG BB Duplication] Overwriting existing BB with label '{existing_shape.label}' (IOU={iou:.2f})")
+                            logger.debug("Overwriting existing BB with label '%s' (IOU=%.2f)", existing_shape.label, iou)
                         else:
                             # Skip this frame if any overlap found
                             should_add_shape = False
                             self.skipped = True
-                            logger.debug(f"[BB Duplication] Skipping due to overlap (IOU={iou:.2f})")
+                            logger.debug("Skipping due to overlap (IOU=%.2f)", iou)
                             break  # In skip mode, one overlap is enough to skip
             
+            # Overwriting a single identical BB would change nothing, so the
+            # frame is left alone and not rewritten
+            if len(shapes_to_remove) == 1 and is_same_shape(shapes_to_remove[0], self.shape_data):
+                logger.debug("Identical BB already present, leaving frame unchanged")
+                shapes_to_remove = []
+                should_add_shape = False
+                self.skipped = True
+            
             # Remove overlapping shapes if in overwrite mode
             if shapes_to_remove:
                 for shape_to_remove in shapes_to_remove:
@@ -130,12 +148,13 @@ class AddShapeWithIOUCheckCommand(AddShapeCommand):
                     
                     self.removed_shapes.append(shape_data)
                     
-                    # Remove from canvas
-                    app.canvas.shapes.remove(shape_to_remove)
-                    
                     # Remove from label list
                     if hasattr(app, 'remove_label'):
                         app.remove_label(shape_to_remove)
+                
+                # Remove from canvas in one pass (Shape hashes by identity)
+                removed = set(shapes_to_remove)
+                app.canvas.shapes[:] = [s for s in app.canvas.shapes if s not in removed]
             
             # Add new shape if not skipped
             if should_add_shape:
@@ -181,7 +200,7 @@ class AddShapeWithIOUCheckCommand(AddShapeCommand):
             
             # Then restore any shapes that were removed
             if self.removed_shapes:
-                print(f"[DEBUG BB Duplication] Restoring {len(self.removed_shapes)} removed shapes during undo")
+                logger.debug("Restoring %s removed shapes during undo", len(self.removed_shapes))
             self.restore_removed_shapes(app)
             
             self.executed = False
@@ -254,7 +273,7 @@ class AddShapeWithIOUCheckCommand(AddShapeCommand):
             shape.label = shape_data.get('label', '')
             shape.label1 = shape.label  # Set label1 same as label
             shape.label2 = shape_data.get('label2', None)
-            shape.points = [QPointF(x, y) for x, y in shape_data.get('points', [])]
+            shape.points = list(starmap(QPointF, shape_data.get('points', [])))
             shape.close()
             
             if 'line_color' in shape_data:
@@ -344,8 +344,24 @@ class ChangeDualLabelCommand(Command):
     
     def can_merge_with(self, other: 'Command') -> bool:
         """Check if this command can be merged with another"""
-        return False
+        if type(other) is not ChangeDualLabelCommand:
+            return False
+        
+        # Same shape, same labels being changed, both applied in the UI
+        return (not self.direct_file_edit and not other.direct_file_edit and
+                self.frame_path == other.frame_path and
+                self.shape_index == other.shape_index and
+                self.change_label1 == other.change_label1 and
+                self.change_label2 == other.change_label2)
     
     def merge(self, other: 'Command') -> 'Command':
         """Merge this command with another"""
-        return self
\ No newline at end of file
+        # Keep the original labels and the final ones
+        merged = ChangeDualLabelCommand(
+            self.frame_path, self.shape_index,
+            self.old_label1, other.new_label1,
+            self.old_label2, other.new_label2,
+            self.change_label1, self.change_label2
+        )
+        merged.executed = other.executed
+        return merged
\ No newline at end of file
@@ -284,12 +284,25 @@ class ChangeLabelCommand(Command):
         return f"Change label '{self.old_label}' to '{self.new_label}'"
     
     def can_merge_with(self, other: Command) -> bool:
-        """ChangeLabelCommand doesn't merge"""
-        return False
-    
-    def merge(self, other: Command) -> Command:
-        """Merge is not supported"""
-        raise NotImplementedError("ChangeLabelCommand does not support merging")
+        """Check if can merge with a following label change of the same shape"""
+        if type(other) is not ChangeLabelCommand:
+            return False
+        
+        return (not self.direct_file_edit and not other.direct_file_edit and
+                self.frame_path == other.frame_path and
+                self.shape_index == other.shape_index)
+    
+    def merge(self, other: 'ChangeLabelCommand') -> 'ChangeLabelCommand':
+        """Merge with another label change"""
+        # Keep the original label and the final one
+        merged = ChangeLabelCommand(
+            self.frame_path,
+            self.shape_index,
+            self.old_label,
+            other.new_label
+        )
+        merged.executed = other.executed
+        return merged
     
     @property
     def affects_save_state(self) -> bool:
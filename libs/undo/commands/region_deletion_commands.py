@@ -3,6 +3,7 @@ Region deletion commands for undo/redo functionality
 """
 
 import logging
+from itertools import starmap
 from typing import Any, List, Tuple, Dict
 from ..command import Command
 
@@ -60,14 +61,14 @@ class RegionDeletionCommand(Command):
             bool: True if successful, False otherwise
         """
         try:
-            print(f"[RegionDeletionCommand] Executing deletion of {len(self.deleted_shapes)} shapes")
+            logger.debug("Executing deletion of %s shapes", len(self.deleted_shapes))
             
             # Load target frame if different
             if app.file_path != self.frame_path:
-                print(f"[RegionDeletionCommand] Loading frame: {self.frame_path}")
+                logger.debug("Loading frame: %s", self.frame_path)
                 app.load_file(self.frame_path, preserve_zoom=True)
             
-            print(f"[RegionDeletionCommand] Canvas has {len(app.canvas.shapes)} shapes before deletion")
+            logger.debug("Canvas has %s shapes before deletion", len(app.canvas.shapes))
             
             # Delete shapes in reverse order (highest index first) to maintain indices
             deleted_count = 0
@@ -80,12 +81,12 @@ class RegionDeletionCommand(Command):
                     # Remove from canvas
                     app.canvas.shapes.remove(shape_ref)
                     deleted_count += 1
-                    print(f"[RegionDeletionCommand] Deleted shape: {shape_data.get('label', 'unknown')}")
+                    logger.debug("Deleted shape: %s", shape_data.get('label', 'unknown'))
                 else:
-                    print(f"[RegionDeletionCommand] Warning: Shape {shape_data.get('label', 'unknown')} not found in canvas")
+                    logger.warning("Shape %s not found in canvas", shape_data.get('label', 'unknown'))
             
-            print(f"[RegionDeletionCommand] Actually deleted {deleted_count} shapes")
-            print(f"[RegionDeletionCommand] Canvas has {len(app.canvas.shapes)} shapes after deletion")
+            logger.debug("Actually deleted %s shapes", deleted_count)
+            logger.debug("Canvas has %s shapes after deletion", len(app.canvas.shapes))
             
             # Update canvas display
             if hasattr(app.canvas, 'update'):
@@ -97,7 +98,7 @@ class RegionDeletionCommand(Command):
             # Save the changes to file
             if hasattr(app, 'save_file'):
                 app.save_file()
-                print(f"[RegionDeletionCommand] Saved changes to file")
+                logger.debug("Saved changes to file")
             
             self.executed = True
             return True
@@ -131,7 +132,7 @@ class RegionDeletionCommand(Command):
                 # Create new shape
                 shape = Shape()
                 shape.label = shape_data.get('label', '')
-                shape.points = [QPointF(x, y) for x, y in shape_data.get('points', [])]
+                shape.points = list(starmap(QPointF, shape_data.get('points', [])))
                 shape.difficult = shape_data.get('difficult', False)
                 
                 # Restore dual label if present
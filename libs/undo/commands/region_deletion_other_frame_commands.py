@@ -3,6 +3,7 @@ Region deletion commands for other frames
 """
 
 import logging
+from itertools import starmap
 import os
 from typing import Any, List, Tuple, Dict
 from ..command import Command
@@ -32,6 +33,7 @@ class RegionDeletionOtherFrameCommand(Command):
         self.region_x2 = region_x2
         self.region_y2 = region_y2
         self.deleted_shapes_data = []  # Will store deleted shapes for undo
+        self.scanned = False  # Set once execute has looked at the frame
         self._description = f"Delete shapes in region for {os.path.basename(frame_path)}"
     
     def execute(self, app: Any) -> bool:
@@ -45,7 +47,7 @@ class RegionDeletionOtherFrameCommand(Command):
             bool: True if successful, False otherwise
         """
         try:
-            print(f"[RegionDeletionOtherFrame] Executing deletion for frame: {self.frame_path}")
+            logger.debug("Executing deletion for frame: %s", self.frame_path)
             
             # Save current frame path
             original_frame = app.file_path
@@ -53,7 +55,7 @@ class RegionDeletionOtherFrameCommand(Command):
             # Load the target frame
             app.load_file(self.frame_path, preserve_zoom=True)
             
-            print(f"[RegionDeletionOtherFrame] Loaded frame with {len(app.canvas.shapes)} shapes")
+            logger.debug("Loaded frame with %s shapes", len(app.canvas.shapes))
             
             # Find and delete shapes in region
             self.deleted_shapes_data = []
@@ -83,7 +85,7 @@ class RegionDeletionOtherFrameCommand(Command):
                     
                     self.deleted_shapes_data.append(shape_data)
                     shapes_to_delete.append(shape)
-                    print(f"[RegionDeletionOtherFrame] Will delete shape: {shape.label}")
+                    logger.debug("Will delete shape: %s", shape.label)
             
             # Delete shapes in reverse order
             for shape in reversed(shapes_to_delete):
@@ -91,12 +93,13 @@ class RegionDeletionOtherFrameCommand(Command):
                     app.remove_label(shape)
                 app.canvas.shapes.remove(shape)
             
-            print(f"[RegionDeletionOtherFrame] Deleted {len(shapes_to_delete)} shapes")
+            logger.debug("Deleted %s shapes", len(shapes_to_delete))
+            self.scanned = True
             
             # Save the modified frame
             if len(shapes_to_delete) > 0:
                 app.save_file()
-                print(f"[RegionDeletionOtherFrame] Saved frame")
+                logger.debug("Saved frame")
             
             # Return to original frame
             if original_frame != self.frame_path:
@@ -140,6 +143,11 @@ class RegionDeletionOtherFrameCommand(Command):
             bool: True if successful, False otherwise
         """
         try:
+            # If nothing was deleted, the frame does not need to be loaded
+            if not self.deleted_shapes_data:
+                self.executed = False
+                return True
+            
             # Save current frame path
             original_frame = app.file_path
             
@@ -154,7 +162,7 @@ class RegionDeletionOtherFrameCommand(Command):
                 # Create new shape
                 shape = Shape()
                 shape.label = shape_data.get('label', '')
-                shape.points = [QPointF(x, y) for x, y in shape_data.get('points', [])]
+                shape.points = list(starmap(QPointF, shape_data.get('points', [])))
                 shape.difficult = shape_data.get('difficult', False)
                 
                 # Restore dual label if present
@@ -199,6 +207,10 @@ class RegionDeletionOtherFrameCommand(Command):
         """
         Re-execute the deletion
         """
+        # A frame that had nothing in the region still has nothing there
+        if self.scanned and not self.deleted_shapes_data:
+            self.executed = True
+            return True
         return self.execute(app)
     
     @property
@@ -7,6 +7,7 @@ Shape-related commands for Undo/Redo system
 from typing import Dict, Any, List, Tuple, Optional
 import logging
 import copy
+from itertools import starmap
 from PyQt5.QtCore import QPointF
 from ..command import Command
 from .composite_command import CompositeCommand
@@ -17,17 +18,19 @@ logger = logging.getLogger(__name__)
 class AddShapeCommand(Command):
     """Command to add a shape to the canvas"""
     
-    def __init__(self, frame_path: str, shape_data: Dict[str, Any]):
+    def __init__(self, frame_path: str, shape_data: Dict[str, Any], copy_data: bool = True):
         """
         Initialize AddShapeCommand
         
         Args:
             frame_path: Path to the frame/image file
             shape_data: Dictionary containing shape information
+            copy_data: If False, keep shape_data as given. For callers that
+                share one private copy between many commands
         """
         super().__init__()
         self.frame_path = frame_path
-        self.shape_data = copy.deepcopy(shape_data)
+        self.shape_data = copy.deepcopy(shape_data) if copy_data else shape_data
         self.shape_index = None
         self.shape_id = None
         self.added_shape = None
@@ -65,7 +68,7 @@ class AddShapeCommand(Command):
             
             # Convert points to QPointF
             points = self.shape_data.get('points', [])
-            shape.points = [QPointF(x, y) for x, y in points]
+            shape.points = list(starmap(QPointF, points))
             shape.close()
             
             # Set additional properties
@@ -290,7 +293,7 @@ class DeleteShapeCommand(Command):
             
             # Convert points to QPointF
             points = self.shape_data.get('points', [])
-            shape.points = [QPointF(x, y) for x, y in points]
+            shape.points = list(starmap(QPointF, points))
             shape.close()
             
             # Restore additional properties
@@ -387,7 +390,7 @@ class MoveShapeCommand(Command):
             # Update shape points
             if self.shape_index < len(app.canvas.shapes):
                 shape = app.canvas.shapes[self.shape_index]
-                shape.points = [QPointF(x, y) for x, y in self.new_points]
+                shape.points = list(starmap(QPointF, self.new_points))
                 
                 # Refresh canvas
                 if hasattr(app.canvas, 'load_shapes'):
@@ -427,7 +430,7 @@ class MoveShapeCommand(Command):
             # Restore original points
             if self.shape_index < len(app.canvas.shapes):
                 shape = app.canvas.shapes[self.shape_index]
-                shape.points = [QPointF(x, y) for x, y in self.old_points]
+                shape.points = list(starmap(QPointF, self.old_points))
                 
                 # Refresh canvas
                 if hasattr(app.canvas, 'load_shapes'):
@@ -848,7 +851,7 @@ class MoveShapeCommand(Command):
             # Update shape points
             if self.shape_index < len(app.canvas.shapes):
                 shape = app.canvas.shapes[self.shape_index]
-                shape.points = [QPointF(x, y) for x, y in self.new_points]
+                shape.points = list(starmap(QPointF, self.new_points))
                 
                 # Update canvas
                 if hasattr(app.canvas, 'load_shapes'):
@@ -882,7 +885,7 @@ class MoveShapeCommand(Command):
             # Restore original points
             if self.shape_index < len(app.canvas.shapes):
                 shape = app.canvas.shapes[self.shape_index]
-                shape.points = [QPointF(x, y) for x, y in self.old_points]
+                shape.points = list(starmap(QPointF, self.old_points))
                 
                 # Update canvas
                 if hasattr(app.canvas, 'load_shapes'):
@@ -940,7 +943,7 @@ class ResizeShapeCommand(Command):
             # Update all vertex positions
             if self.shape_index < len(app.canvas.shapes):
                 shape = app.canvas.shapes[self.shape_index]
-                shape.points = [QPointF(x, y) for x, y in self.new_points]
+                shape.points = list(starmap(QPointF, self.new_points))
                 
                 # Update canvas
                 if hasattr(app.canvas, 'load_shapes'):
@@ -974,7 +977,7 @@ class ResizeShapeCommand(Command):
             # Restore original vertex positions
             if self.shape_index < len(app.canvas.shapes):
                 shape = app.canvas.shapes[self.shape_index]
-                shape.points = [QPointF(x, y) for x, y in self.old_points]
+                shape.points = list(starmap(QPointF, self.old_points))
                 
                 # Update canvas
                 if hasattr(app.canvas, 'load_shapes'):
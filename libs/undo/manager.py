@@ -4,7 +4,8 @@
 UndoManager for managing command history
 """
 
-from typing import List, Optional, Any
+from collections import deque
+from typing import Deque, List, Optional, Any
 import time
 import logging
 from .command import Command
@@ -24,11 +25,14 @@ class UndoManager:
             max_history: Maximum number of commands to keep in history
         """
         self.app = app
-        self.history: List[Command] = []
+        # The deque drops the oldest command itself once max_history is reached
+        self.history: Deque[Command] = deque(maxlen=max_history)
         self.current_index = -1
         self.max_history = max_history
         self.merge_timeout = 500  # milliseconds
         self.last_merge_time = 0
+        # (undo, redo) actions, looked up once the app has built them
+        self._ui_actions = None
     
     def execute_command(self, command: Command) -> bool:
         """
@@ -43,14 +47,20 @@ class UndoManager:
         try:
             # Check if we can merge with the last command
             if self.can_merge_last(command):
+                # The change itself still has to happen, only its history
+                # entry is folded into the previous one
+                if not command.execute(self.app):
+                    return False
                 merged = self.merge_with_last(command)
                 if merged:
                     # The merge already updated history, just update time
                     self.last_merge_time = time.time() * 1000
+                    self.update_ui()
                     return True
-            
-            # Truncate history after current position
-            self.history = self.history[:self.current_index + 1]
+                # Keep the executed command as its own history entry
+                command.timestamp = time.time()
+                self._append(command)
+                return True
             
             # Execute the command
             if not command.execute(self.app):
@@ -58,17 +68,7 @@ class UndoManager:
             
             # Add to history
             command.timestamp = time.time()
-            self.history.append(command)
-            self.current_index += 1
-            self.last_merge_time = time.time() * 1000
-            
-            # Limit history size
-            if len(self.history) > self.max_history:
-                self.history.pop(0)
-                self.current_index -= 1
-            
-            # Update UI
-            self.update_ui()
+            self._append(command)
             
             logger.debug(f"Executed command: {command.description}")
             return True
@@ -77,6 +77,20 @@ class UndoManager:
             logger.error(f"Error executing command: {e}")
             return False
     
+    def _append(self, command: Command):
+        """Push an executed command, dropping any redo entries"""
+        # Truncate history after current position
+        while len(self.history) > self.current_index + 1:
+            self.history.pop()
+        # A full history evicts its oldest command, keeping the index
+        if len(self.history) < self.max_history:
+            self.current_index += 1
+        self.history.append(command)
+        self.last_merge_time = time.time() * 1000
+        
+        # Update UI
+        self.update_ui()
+    
     def undo(self) -> bool:
         """
         Undo the last command
@@ -190,6 +204,10 @@ class UndoManager:
             last_command = self.history[self.current_index]
             merged = last_command.merge(command)
             
+            # A new change after an undo drops the redo entries, as in _append
+            while len(self.history) > self.current_index + 1:
+                self.history.pop()
+            
             # Replace the last command with the merged one
             self.history[self.current_index] = merged
             self.last_merge_time = time.time() * 1000
@@ -202,11 +220,17 @@ class UndoManager:
     
     def update_ui(self):
         """Update UI elements based on current state"""
-        if hasattr(self.app, 'actions'):
-            if hasattr(self.app.actions, 'undo') and self.app.actions.undo:
-                self.app.actions.undo.setEnabled(self.can_undo())
-            if hasattr(self.app.actions, 'redo') and self.app.actions.redo:
-                self.app.actions.redo.setEnabled(self.can_redo())
+        if self._ui_actions is None:
+            actions = getattr(self.app, 'actions', None)
+            if actions is None:
+                # The manager is created before the app's actions
+                return
+            self._ui_actions = (getattr(actions, 'undo', None), getattr(actions, 'redo', None))
+        undo_action, redo_action = self._ui_actions
+        if undo_action:
+            undo_action.setEnabled(self.can_undo())
+        if redo_action:
+            redo_action.setEnabled(self.can_redo())
     
     def clear(self):
         """Clear all history"""
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from math import sqrt
 from libs.ustr import ustr
 import hashlib
@@ -74,13 +75,98 @@ def distance(p):
     return sqrt(p.x() * p.x() + p.y() * p.y())
 
 
+def points_bbox(points):
+    """Return (x_min, y_min, x_max, y_max) of QPointF or (x, y) points."""
+    xs = [p[0] if isinstance(p, (list, tuple)) else p.x() for p in points]
+    ys = [p[1] if isinstance(p, (list, tuple)) else p.y() for p in points]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def bbox_iou(box1, box2):
+    """Intersection over union of two (x_min, y_min, x_max, y_max) boxes."""
+    return bbox_ious(box1, (box2,))[0]
+
+
+def bbox_ious(box, boxes):
+    """Return the IoU of box against each box in boxes."""
+    x_min, y_min, x_max, y_max = box
+    area = (x_max - x_min) * (y_max - y_min)
+    ious = []
+    for bx_min, by_min, bx_max, by_max in boxes:
+        inter_w = min(x_max, bx_max) - max(x_min, bx_min)
+        inter_h = min(y_max, by_max) - max(y_min, by_min)
+        if inter_w < 0 or inter_h < 0:
+            ious.append(0.0)
+            continue
+        inter_area = inter_w * inter_h
+        union_area = area + (bx_max - bx_min) * (by_max - by_min) - inter_area
+        ious.append(inter_area / union_area if union_area else 0.0)
+    return ious
+
+
+def best_bbox_match(box, boxes, min_iou):
+    """Return (index, iou) of the box in boxes that best overlaps box.
+
+    Candidates whose width or height differ by more than half of box's, or
+    whose center lies further away than box's larger side, are rejected
+    before the IoU is computed. None entries are skipped; (-1, 0.0) means no
+    candidate reached min_iou.
+    """
+    x_min, y_min, x_max, y_max = box
+    width = x_max - x_min
+    height = y_max - y_min
+    area = width * height
+    half_w = width * 0.5
+    half_h = height * 0.5
+    radius = max(width, height)
+    radius_sq = radius * radius
+    cx2 = x_min + x_max
+    cy2 = y_min + y_max
+    best_idx = -1
+    best_iou = 0.0
+    for idx, candidate in enumerate(boxes):
+        if candidate is None:
+            continue
+        bx_min, by_min, bx_max, by_max = candidate
+        b_width = bx_max - bx_min
+        b_height = by_max - by_min
+        if abs(b_width - width) > half_w or abs(b_height - height) > half_h:
+            continue
+        # Doubled center offsets, so the squared radius is scaled by 4
+        dx = bx_min + bx_max - cx2
+        dy = by_min + by_max - cy2
+        if dx * dx + dy * dy > 4 * radius_sq:
+            continue
+        inter_w = min(x_max, bx_max) - max(x_min, bx_min)
+        inter_h = min(y_max, by_max) - max(y_min, by_min)
+        if inter_w < 0 or inter_h < 0:
+            continue
+        inter_area = inter_w * inter_h
+        union_area = area + b_width * b_height - inter_area
+        iou = inter_area / union_area if union_area else 0.0
+        if iou > best_iou and iou >= min_iou:
+            best_iou = iou
+            best_idx = idx
+    return best_idx, best_iou
+
+
 def format_shortcut(text):
     mod, key = text.split('+', 1)
     return '<b>%s</b>+<b>%s</b>' % (mod, key)
 
 
 def generate_color_by_text(text):
-    s = ustr(text)
+    # QColor is mutable, so only the channel values are shared between calls
+    return QColor(*_color_channels_by_text(ustr(text)))
+
+
+def rgba_by_text(text):
+    """Return generate_color_by_text(text).getRgb() without building a QColor."""
+    return _color_channels_by_text(ustr(text))
+
+
+@lru_cache(maxsize=1024)  # one entry per label; herds can exceed a few hundred IDs
+def _color_channels_by_text(s):
     hash_code = int(hashlib.sha256(s.encode('utf-8')).hexdigest(), 16)
     r = int((hash_code) % 256)
     g = int((hash_code >> 8) % 256)
@@ -102,7 +188,7 @@ def generate_color_by_text(text):
     g = max(g, 80)
     b = max(b, 80)
     
-    return QColor(r, g, b, 200)
+    return r, g, b, 200
 
 
 def have_qstring():
@@ -114,15 +200,30 @@ def util_qt_strlistclass():
     return QStringList if have_qstring() else list
 
 
+_DIGITS_RE = re.compile('([0-9]+)')
+_DIGITS_MASK = str.maketrans('123456789', '000000000')
+
+
+def natural_key(text):
+    """
+    Split text into str and int parts so that it sorts in natural order.
+    """
+    parts = _DIGITS_RE.split(text)
+    # re.split with a capture group puts the digit runs at the odd indices
+    parts[1::2] = [int(part) for part in parts[1::2]]
+    return parts
+
+
 def natural_sort(list, key=lambda s:s):
     """
     Sort the list into natural alphanumeric order.
     """
-    def get_alphanum_key_func(key):
-        convert = lambda text: int(text) if text.isdigit() else text
-        return lambda s: [convert(c) for c in re.split('([0-9]+)', key(s))]
-    sort_key = get_alphanum_key_func(key)
-    list.sort(key=sort_key)
+    # Names that only differ in equally wide digit runs, like zero-padded
+    # video frames, are already in natural order when sorted as strings.
+    if len({key(s).translate(_DIGITS_MASK) for s in list}) <= 1:
+        list.sort(key=key)
+    else:
+        list.sort(key=lambda s: natural_key(key(s)))
 
 
 # QT4 has a trimmed method, in QT5 this is called strip
@@ -8,6 +8,29 @@ from libs.constants import DEFAULT_ENCODING
 TXT_EXT = '.txt'
 ENCODE_METHOD = DEFAULT_ENCODING
 
+# Class list path -> ((mtime_ns, size), classes), shared by every YoloReader
+_class_lists = {}
+
+
+def read_class_list(path):
+    """Return the classes listed in path, or None if it does not exist.
+
+    Stepping through a YOLO folder opens one reader per frame, so the class
+    files are only read again when their mtime or size changes.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _class_lists.get(path)
+    if cached is None or cached[0] != key:
+        with open(path, 'r') as f:
+            cached = (key, f.read().strip('\n').split('\n'))
+        _class_lists[path] = cached
+    return list(cached[1])
+
+
 class YOLOWriter:
 
     def __init__(self, folder_name, filename, img_size, database_src='Unknown', local_img_path=None):
@@ -154,22 +177,22 @@ class YoloReader:
         self.classes2 = []
         
         # Try to read classes.txt first (backward compatibility)
-        if os.path.exists(self.class_list_path):
-            with open(self.class_list_path, 'r') as f:
-                self.classes = f.read().strip('\n').split('\n')
-                self.classes1 = self.classes  # Default to main classes
+        classes = read_class_list(self.class_list_path)
+        if classes is not None:
+            self.classes = classes
+            self.classes1 = self.classes  # Default to main classes
         
         # Read class list 1 and 2 for dual label mode
-        if os.path.exists(self.class_list1_path):
-            with open(self.class_list1_path, 'r') as f:
-                self.classes1 = f.read().strip('\n').split('\n')
-                # If classes.txt doesn't exist, use classes1 as default
-                if not self.classes:
-                    self.classes = self.classes1
+        classes1 = read_class_list(self.class_list1_path)
+        if classes1 is not None:
+            self.classes1 = classes1
+            # If classes.txt doesn't exist, use classes1 as default
+            if not self.classes:
+                self.classes = self.classes1
         
-        if os.path.exists(self.class_list2_path):
-            with open(self.class_list2_path, 'r') as f:
-                self.classes2 = f.read().strip('\n').split('\n')
+        classes2 = read_class_list(self.class_list2_path)
+        if classes2 is not None:
+            self.classes2 = classes2
         
         # If no class files found, raise error
         if not self.classes and not self.classes1:
@@ -97,5 +97,47 @@ class TestCreateMLRW(unittest.TestCase):
         self.assertEqual(365, y_max, 'ymax is wrong')
 
 
+class TestYoloClassList(unittest.TestCase):
+
+    def test_read_class_list(self):
+        import tempfile
+        dir_name = os.path.abspath(os.path.dirname(__file__))
+        libs_path = os.path.join(dir_name, '..', 'libs')
+        sys.path.insert(0, libs_path)
+        from yolo_io import read_class_list
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'classes.txt')
+            self.assertIsNone(read_class_list(path))
+            with open(path, 'w') as f:
+                f.write('cow\nperson\n')
+            classes = read_class_list(path)
+            self.assertEqual(classes, ['cow', 'person'])
+            classes.append('dog')
+            self.assertEqual(read_class_list(path), ['cow', 'person'])
+            with open(path, 'w') as f:
+                f.write('cow\nperson\ndog\n')
+            self.assertEqual(read_class_list(path), ['cow', 'person', 'dog'])
+
+
+class TestYoloWrite(unittest.TestCase):
+
+    def test_save_with_image_size(self):
+        import tempfile
+        dir_name = os.path.abspath(os.path.dirname(__file__))
+        sys.path.insert(0, os.path.join(dir_name, '..'))
+        from libs.labelFile import LabelFile
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # The image does not exist; the size is all the writer needs
+            image_path = os.path.join(tmp_dir, 'frame.png')
+            target = os.path.join(tmp_dir, 'frame.txt')
+            shapes = [{'label': 'cow', 'points': [(50, 25), (150, 25), (150, 75), (50, 75)],
+                       'difficult': False}]
+            LabelFile().save_yolo_format(target, shapes, image_path, None, [], image_size=(200, 100))
+            with open(target) as f:
+                self.assertEqual(f.read(), 'cow 0.500000 0.500000 0.500000 0.500000\n')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,7 @@
-
 from unittest import TestCase
 
 from labelImg import get_main_app
+from libs.shape import Shape
 
 
 class TestMainWindow(TestCase):
@@ -18,3 +18,124 @@ class TestMainWindow(TestCase):
 
     def test_noop(self):
         pass
+
+    def combo_items(self):
+        cb = self.win.combo_box.cb
+        return [cb.itemText(i) for i in range(cb.count())]
+
+    def test_combo_box_tracks_unique_labels(self):
+        shapes = [Shape(label='cow'), Shape(label='cow'), Shape(label='calf')]
+        for shape in shapes:
+            self.win.add_label(shape)
+        self.assertEqual(self.combo_items(), ['', 'calf', 'cow'])
+
+        self.win.remove_label(shapes[0])
+        self.assertEqual(self.combo_items(), ['', 'calf', 'cow'])
+        self.win.remove_label(shapes[1])
+        self.assertEqual(self.combo_items(), ['', 'calf'])
+
+    def test_combo_box_resyncs_after_external_clear(self):
+        self.win.add_label(Shape(label='cow'))
+        self.win.label_list.clear()
+        self.win.items_to_shapes.clear()
+        self.win.shapes_to_items.clear()
+        self.win.add_label(Shape(label='calf'))
+        self.assertEqual(self.combo_items(), ['', 'calf'])
+
+    def test_snap_points_to_canvas(self):
+        from PyQt5.QtGui import QPixmap
+        self.win.canvas.pixmap = QPixmap(10, 20)
+        points, snapped = self.win.canvas.snap_points_to_canvas([(1, 2), (10, 20)])
+        self.assertEqual(points, [(1, 2), (10, 20)])
+        self.assertFalse(snapped)
+        points, snapped = self.win.canvas.snap_points_to_canvas([(-1, 5), (12, 25)])
+        self.assertEqual(points, [(0, 5), (10, 20)])
+        self.assertTrue(snapped)
+
+    def test_label_dialog_set_items(self):
+        dialog = self.win.label_dialog
+        dialog.set_items(['cow', 'calf'])
+        self.assertEqual(dialog.model.stringList(), ['cow', 'calf'])
+        self.assertEqual([dialog.list_widget.item(i).text() for i in range(dialog.list_widget.count())],
+                         ['cow', 'calf'])
+        dialog.set_items(['cow'])
+        self.assertEqual(dialog.list_widget.count(), 1)
+
+    def test_label_maps_pruned_after_external_clear(self):
+        old = Shape(label='cow')
+        self.win.add_label(old)
+        self.win.label_list.clear()
+        new = Shape(label='calf')
+        self.win.add_label(new)
+        self.assertEqual(list(self.win.items_to_shapes.values()), [new])
+        self.assertEqual(list(self.win.shapes_to_items), [new])
+
+    def test_annotation_lookup_ignores_extension_case(self):
+        import os
+        import tempfile
+        with tempfile.TemporaryDirectory() as dir_path:
+            open(os.path.join(dir_path, 'IMG_001.XML'), 'w').close()
+            self.assertIn('IMG_001.XML', self.win.annotation_file_names(dir_path))
+            self.assertTrue(self.win.has_annotation_file(dir_path, 'IMG_001.XML'))
+            # Same answer as the file system for a case-only difference
+            self.assertEqual(self.win.has_annotation_file(dir_path, 'IMG_001.xml'),
+                             os.path.isfile(os.path.join(dir_path, 'IMG_001.xml')))
+            self.assertFalse(self.win.has_annotation_file(dir_path, 'IMG_002.xml'))
+
+    def test_exif_rotated_jpeg_loads_upright(self):
+        import os
+        import struct
+        import tempfile
+        from PyQt5.QtCore import QBuffer, QByteArray, QIODevice
+        from PyQt5.QtGui import QImage
+        from labelImg import ImagePreloadJob, read
+
+        # 40x20 JPEG with an EXIF orientation of 6 (rotate 90 degrees clockwise)
+        image = QImage(40, 20, QImage.Format_RGB32)
+        image.fill(0)
+        data = QByteArray()
+        buf = QBuffer(data)
+        buf.open(QIODevice.WriteOnly)
+        image.save(buf, 'JPG')
+        tiff = b'MM\x00*' + struct.pack('>IHHHIHHI', 8, 1, 0x0112, 3, 1, 6, 0, 0)
+        exif = b'Exif\x00\x00' + tiff
+        jpeg = bytes(data)
+        jpeg = jpeg[:2] + b'\xff\xe1' + struct.pack('>H', len(exif) + 2) + exif + jpeg[2:]
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            path = os.path.join(dir_path, 'rotated.jpg')
+            with open(path, 'wb') as f:
+                f.write(jpeg)
+            self.assertEqual((read(path).width(), read(path).height()), (20, 40))
+            self.assertEqual(self.win._image_file_size(path), read(path).size())
+
+            preloaded = []
+            ImagePreloadJob([path], lambda p, img: preloaded.append(img)).run()
+            self.assertEqual(preloaded[0].size(), read(path).size())
+
+            with self.win.read_ahead([path]):
+                self.assertEqual(self.win.take_read_ahead(path).size(), read(path).size())
+
+            self.assertTrue(self.win.load_file(path))
+            self.assertEqual(self.win.image.size(), read(path).size())
+
+    def test_voc_size_image_depth_per_frame(self):
+        import os
+        import tempfile
+        from PyQt5.QtGui import QImage
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            paths = []
+            for name, image_format in (('rgb.png', QImage.Format_RGB32),
+                                       ('gray.png', QImage.Format_Grayscale8),
+                                       ('rgb2.png', QImage.Format_RGB32)):
+                image = QImage(8, 6, image_format)
+                image.fill(0xff3366cc)
+                path = os.path.join(dir_path, name)
+                image.save(path)
+                paths.append(path)
+            # Same size, so only the format tells the frames apart
+            depths = [self.win._voc_size_image(path, QImage(path).size()).isGrayscale()
+                      for path in paths]
+            self.assertEqual(depths, [QImage(path).isGrayscale() for path in paths])
+            self.assertEqual(depths, [False, True, False])
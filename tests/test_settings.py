@@ -26,7 +26,21 @@ class TestSettings(unittest.TestCase):
         self.assertEqual(settings.get('test1'), 10)
 
         settings.reset()
-        
+
+    def test_save_skips_unchanged(self):
+        settings = Settings()
+        settings['test0'] = 'hello'
+        self.assertEqual(settings.save(), True)
+        mtime = os.stat(settings.path).st_mtime_ns
+        time.sleep(0.01)
+        settings['test0'] = 'hello'
+        self.assertEqual(settings.save(), True)
+        self.assertEqual(os.stat(settings.path).st_mtime_ns, mtime)
+        settings['test0'] = 'world'
+        settings.save()
+        settings.load()
+        self.assertEqual(settings.get('test0'), 'world')
+        settings.reset()
 
 
 if __name__ == '__main__':
@@ -355,6 +355,24 @@ class TestTrackerIntegration(unittest.TestCase):
         # ここは実際のTrackerクラス実装後に記述
         pass
     
+    def test_snapshot_matches_shape_iou(self):
+        """スナップショットでも元の図形と同じIOUになるテスト"""
+        from PyQt5.QtCore import QPointF
+        from libs.shape import Shape
+        from libs.tracker import Tracker
+        tracker = Tracker()
+        prev = Shape(label="cow1")
+        curr = Shape(label="cow2")
+        for x, y in [(0, 0), (10, 0), (10, 10), (0, 10)]:
+            prev.add_point(QPointF(x, y))
+            curr.add_point(QPointF(x + 5, y))
+        snapshot = tracker.snapshot(prev)
+        self.assertEqual(snapshot.label, "cow1")
+        self.assertEqual(snapshot.bbox, (0, 0, 10, 10))
+        self.assertIsNone(snapshot.track_id)
+        self.assertAlmostEqual(tracker.calculate_iou(snapshot, curr),
+                               tracker.calculate_iou(prev, curr))
+    
     def test_frame_to_frame_tracking(self):
         """フレーム間追跡の統合テスト"""
         # ここは実際のTrackerクラス実装後に記述
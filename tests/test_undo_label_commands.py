@@ -97,6 +97,26 @@ class TestChangeLabelCommand(unittest.TestCase):
             
         except ImportError:
             self.skipTest("ChangeLabelCommand not implemented yet")
+    
+    def test_change_label_merge(self):
+        """Test merging consecutive label changes of the same shape"""
+        try:
+            from libs.undo.commands.label_commands import ChangeLabelCommand
+            
+            cmd1 = ChangeLabelCommand("frame1.png", 0, "cow_1", "cow_2")
+            cmd2 = ChangeLabelCommand("frame1.png", 0, "cow_2", "cow_3")
+            
+            self.assertTrue(cmd1.can_merge_with(cmd2))
+            self.assertFalse(cmd1.can_merge_with(ChangeLabelCommand("frame1.png", 1, "cow_2", "cow_3")))
+            self.assertFalse(cmd1.can_merge_with(ChangeLabelCommand("frame1.png", 0, "cow_2", "cow_3",
+                                                                    direct_file_edit=True)))
+            
+            merged = cmd1.merge(cmd2)
+            self.assertEqual(merged.old_label, "cow_1")
+            self.assertEqual(merged.new_label, "cow_3")
+            
+        except ImportError:
+            self.skipTest("ChangeLabelCommand not implemented yet")
 
 
 class TestApplyQuickIDCommand(unittest.TestCase):
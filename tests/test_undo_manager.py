@@ -452,6 +452,89 @@ class TestUndoManager(unittest.TestCase):
         except ImportError:
             self.skipTest("UndoManager not implemented yet")
     
+    def test_merged_command_is_executed(self):
+        """Test that a command folded into the previous one still runs"""
+        from libs.undo.manager import UndoManager
+        from libs.undo.command import Command
+        
+        executed = []
+        
+        class MergableCommand(Command):
+            def __init__(self, value):
+                super().__init__()
+                self.value = value
+            
+            def execute(self, app):
+                executed.append(self.value)
+                return True
+            
+            def undo(self, app):
+                return True
+            
+            @property
+            def description(self):
+                return f"Value {self.value}"
+            
+            def can_merge_with(self, other):
+                return isinstance(other, MergableCommand)
+            
+            def merge(self, other):
+                return MergableCommand(other.value)
+            
+            @property
+            def affects_save_state(self):
+                return True
+        
+        manager = UndoManager(self.app)
+        manager.merge_timeout = 1000
+        manager.execute_command(MergableCommand(1))
+        manager.execute_command(MergableCommand(2))
+        
+        self.assertEqual(executed, [1, 2])
+        self.assertEqual(len(manager.history), 1)
+        self.assertEqual(manager.history[0].value, 2)
+    
+    def test_merge_after_undo_drops_redo(self):
+        """Test that a change merged after an undo leaves nothing to redo"""
+        from libs.undo.manager import UndoManager
+        from libs.undo.command import Command
+        
+        class LabelCommand(Command):
+            def __init__(self, label, mergeable=True):
+                super().__init__()
+                self.label = label
+                self.mergeable = mergeable
+            
+            def execute(self, app):
+                return True
+            
+            def undo(self, app):
+                return True
+            
+            @property
+            def description(self):
+                return f"Label {self.label}"
+            
+            def can_merge_with(self, other):
+                return self.mergeable and other.mergeable
+            
+            def merge(self, other):
+                return LabelCommand(other.label)
+            
+            @property
+            def affects_save_state(self):
+                return True
+        
+        manager = UndoManager(self.app)
+        manager.merge_timeout = 1000
+        manager.execute_command(LabelCommand("cow"))
+        manager.execute_command(LabelCommand("calf", mergeable=False))
+        self.assertTrue(manager.undo())
+        manager.execute_command(LabelCommand("bull"))
+        
+        self.assertEqual([c.label for c in manager.history], ["bull"])
+        self.assertFalse(manager.can_redo())
+    
     def test_ui_update(self):
         """Test that UI is updated after undo/redo"""
         try:
@@ -498,6 +581,25 @@ class TestUndoManager(unittest.TestCase):
         except ImportError:
             self.skipTest("UndoManager not implemented yet")
     
+    def test_ui_update_before_actions_exist(self):
+        """Test actions built after the manager are still updated"""
+        try:
+            from libs.undo.manager import UndoManager
+            
+            app = Mock(spec=['file_path'])
+            manager = UndoManager(app)
+            
+            # No actions yet: nothing to update, nothing cached
+            manager.update_ui()
+            
+            app.actions = self.app.actions
+            manager.update_ui()
+            self.app.actions.undo.setEnabled.assert_called_with(False)
+            self.app.actions.redo.setEnabled.assert_called_with(False)
+            
+        except ImportError:
+            self.skipTest("UndoManager not implemented yet")
+    
     def test_clear_history(self):
         """Test clearing history"""
         try:
@@ -417,5 +417,22 @@ class TestDuplicateShapeCommand(unittest.TestCase):
             self.skipTest("MultiFrameDuplicateCommand not implemented yet")
 
 
+class TestIsSameShape(unittest.TestCase):
+    """Test the identical-BB check used by BB duplication"""
+    
+    def test_label2_difference_is_not_same(self):
+        from libs.shape import Shape
+        from libs.undo.commands.bb_duplication_commands import is_same_shape
+        
+        points = [(100, 100), (200, 100), (200, 200), (100, 200)]
+        shape = Shape(label='cow', label2='1')
+        shape.points = [QPointF(x, y) for x, y in points]
+        data = {'label': 'cow', 'label2': '1', 'points': points, 'difficult': False}
+        
+        self.assertTrue(is_same_shape(shape, data))
+        self.assertFalse(is_same_shape(shape, dict(data, label2='2')))
+        self.assertFalse(is_same_shape(shape, dict(data, points=points[::-1])))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,7 +1,7 @@
 import os
 import sys
 import unittest
-from libs.utils import Struct, new_action, new_icon, add_actions, format_shortcut, generate_color_by_text, natural_sort
+from libs.utils import Struct, new_action, new_icon, add_actions, format_shortcut, generate_color_by_text, rgba_by_text, natural_sort, natural_key, points_bbox, bbox_iou, bbox_ious, best_bbox_match
 
 class TestUtils(unittest.TestCase):
 
@@ -11,6 +11,16 @@ class TestUtils(unittest.TestCase):
         self.assertTrue(res.red() >= 0)
         self.assertTrue(res.blue() >= 0)
 
+    def test_generateColorByText_returnsIndependentColors(self):
+        first = generate_color_by_text('cow')
+        second = generate_color_by_text('cow')
+        self.assertEqual(first, second)
+        first.setAlpha(10)
+        self.assertEqual(second.alpha(), 200)
+
+    def test_rgbaByText_matchesGeneratedColor(self):
+        self.assertEqual(rgba_by_text('cow'), generate_color_by_text('cow').getRgb())
+
     def test_nautalSort_noError(self):
         l1 = ['f1', 'f11', 'f3']
         expected_l1 = ['f1', 'f3', 'f11']
@@ -18,5 +28,38 @@ class TestUtils(unittest.TestCase):
         for idx, val in enumerate(l1):
             self.assertTrue(val == expected_l1[idx])
 
+    def test_naturalKey_splitsDigitRuns(self):
+        self.assertEqual(natural_key('frame12_cam3'), ['frame', 12, '_cam', 3, ''])
+        l1 = ['img10.png', 'img9.png', 'img100.png']
+        natural_sort(l1)
+        self.assertEqual(l1, ['img9.png', 'img10.png', 'img100.png'])
+
+    def test_naturalSort_zeroPadded(self):
+        l1 = ['frame_0010.png', 'frame_0002.png', 'frame_0001.png']
+        natural_sort(l1)
+        self.assertEqual(l1, ['frame_0001.png', 'frame_0002.png', 'frame_0010.png'])
+        l2 = ['B_01.png', 'a_02.png']
+        natural_sort(l2, key=lambda x: x.lower())
+        self.assertEqual(l2, ['a_02.png', 'B_01.png'])
+
+    def test_bboxIou(self):
+        box = points_bbox([(0, 0), (10, 0), (10, 10), (0, 10)])
+        self.assertEqual(box, (0, 0, 10, 10))
+        self.assertAlmostEqual(bbox_iou(box, (5, 5, 15, 15)), 25 / 175)
+        self.assertEqual(bbox_iou(box, box), 1.0)
+        self.assertEqual(bbox_iou(box, (20, 20, 30, 30)), 0.0)
+        boxes = [(5, 5, 15, 15), box, (20, 20, 30, 30)]
+        self.assertEqual(bbox_ious(box, boxes), [bbox_iou(box, b) for b in boxes])
+
+    def test_bestBboxMatch(self):
+        box = (0, 0, 10, 10)
+        # Too small, shifted, close match, exact match further down
+        boxes = [(0, 0, 4, 4), None, (2, 2, 12, 12), (20, 0, 30, 10), (1, 0, 11, 10)]
+        idx, iou = best_bbox_match(box, boxes, 0.3)
+        self.assertEqual(idx, 4)
+        self.assertAlmostEqual(iou, bbox_iou(box, boxes[4]))
+        self.assertEqual(best_bbox_match(box, boxes[:2], 0.3), (-1, 0.0))
+        self.assertEqual(best_bbox_match(box, [(2, 2, 12, 12)], 0.9), (-1, 0.0))
+
 if __name__ == '__main__':
     unittest.main()